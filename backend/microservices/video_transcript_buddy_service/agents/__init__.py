@@ -3,16 +3,25 @@ Agents module - AI Agents for query processing.
 
 Agents:
     - QueryValidatorAgent: Validates and sanitizes user queries
+      (BasicQueryValidator / LLMQueryValidator, see create_query_validator)
     - QueryResolverAgent: Main orchestrator that resolves queries
     - DataAnalyzerAgent: Performs complex data analysis
 """
 
-from .query_validator_agent import QueryValidatorAgent
+from .query_validator_agent import (
+    QueryValidatorAgent,
+    BasicQueryValidator,
+    LLMQueryValidator,
+    create_query_validator,
+)
 from .query_resolver_agent import QueryResolverAgent
 from .data_analyzer_agent import DataAnalyzerAgent
 
 __all__ = [
     "QueryValidatorAgent",
+    "BasicQueryValidator",
+    "LLMQueryValidator",
+    "create_query_validator",
     "QueryResolverAgent",
     "DataAnalyzerAgent",
 ]
\ No newline at end of file
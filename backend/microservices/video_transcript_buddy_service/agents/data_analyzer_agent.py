@@ -9,18 +9,160 @@ This agent handles:
 - Deep content analysis
 """
 
+import asyncio
+import hashlib
+import itertools
 import logging
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field
+import re
+from collections import defaultdict
+from typing import Dict, Any, Optional, List, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from types import MappingProxyType
+from functools import cache, lru_cache
 
-from openai import OpenAI
+import orjson
+import tiktoken
+from openai import AsyncOpenAI
 from config import settings
 from common.exceptions import AgentException
+from common.llm_client import get_openai
 from dao.vector_store_dao import VectorStoreDAO
+from utils.semantic_cache import SemanticCache
+from utils.llm_batcher import LLMBatcher
 
 logger = logging.getLogger(__name__)
 
+# System messages, built once and shared read-only by every request
+_COMPARE_SYS = MappingProxyType({
+    "role": "system",
+    "content": """You are an expert analyst performing comparison analysis on video transcripts.
+
+Provide a structured comparison that includes:
+1. Key similarities between the sources
+2. Notable differences
+3. Unique points in each source
+4. Overall synthesis
+
+Format your response as clear sections with bullet points."""
+})
+
+_MAP_SUMMARY_SYS = MappingProxyType({
+    "role": "system",
+    "content": "You extract the key points of a video transcript that are relevant to a comparison query. Respond with concise bullet points."
+})
+
+_TREND_SYS = MappingProxyType({
+    "role": "system",
+    "content": """You are an analyst identifying trends and patterns in video transcript content.
+
+Analyze for:
+1. Recurring themes or topics
+2. Changes or evolution in discussion
+3. Patterns in how topics are addressed
+4. Any temporal progression if evident
+
+Provide specific examples from the content to support your findings."""
+})
+
+_SUMMARY_SYS = MappingProxyType({
+    "role": "system",
+    "content": """You are an expert summarizer for video transcript content.
+
+Create a comprehensive summary that includes:
+1. Main topics covered
+2. Key points and takeaways
+3. Important details or facts mentioned
+4. Any conclusions or recommendations
+
+Structure the summary with clear headings and bullet points."""
+})
+
+_EXTRACTION_SYS = MappingProxyType({
+    "role": "system",
+    "content": """You are a data extraction specialist.
+
+Extract the requested information from the transcript content.
+- Be thorough and find all instances
+- Format as a clear list
+- Include context for each extracted item
+- Note the source when possible"""
+})
+
+_SENTIMENT_SYS = MappingProxyType({
+    "role": "system",
+    "content": """You are a sentiment and tone analyst.
+
+Analyze the content for:
+1. Overall sentiment (positive, negative, neutral, mixed)
+2. Emotional tone (enthusiastic, serious, casual, etc.)
+3. Speaker attitude toward topics
+4. Any notable shifts in sentiment
+
+Provide specific examples to support your analysis."""
+})
+
+_GENERAL_SYS = MappingProxyType({
+    "role": "system",
+    "content": """You are an expert analyst for video transcript content.
+Provide thorough, well-structured analysis based on the content provided.
+Support your findings with specific examples from the text."""
+})
+
+# Shared across agent instances so identical concurrent calls are coalesced
+llm_batcher = LLMBatcher(max_concurrency=32)
+
+
+# Context window sizes (tokens) by model prefix; longest prefix wins
+_MODEL_CONTEXT_WINDOWS = {
+    "gpt-4o": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4-1106": 128000,
+    "gpt-4-0125": 128000,
+    "gpt-4-32k": 32768,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+}
+DEFAULT_CONTEXT_WINDOW = 8192
+
+# Reserved for system prompt, instructions and message framing
+PROMPT_OVERHEAD_TOKENS = 300
+
+# Above this estimated context size, routed analyses use the main model
+LONG_CONTEXT_TOKENS = 30000
+CHARS_PER_TOKEN = 4
+
+CONTEXT_SEPARATOR = "\n\n---\n\n"
+
+
+def _context_window(model: str) -> int:
+    """Get the context window size for a model."""
+    for prefix in sorted(_MODEL_CONTEXT_WINDOWS, key=len, reverse=True):
+        if model.startswith(prefix):
+            return _MODEL_CONTEXT_WINDOWS[prefix]
+    return DEFAULT_CONTEXT_WINDOW
+
+
+@cache
+def _get_encoder() -> "tiktoken.Encoding":
+    """Get the tokenizer for the configured model."""
+    try:
+        return tiktoken.encoding_for_model(settings.OPENAI_MODEL)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@lru_cache(maxsize=4096)
+def _encode_chunk(text: str) -> Tuple[int, ...]:
+    """Tokenize chunk text (memoized; identical chunks recur across queries)."""
+    return tuple(_get_encoder().encode(text))
+
+
+@lru_cache(maxsize=4096)
+def _format_chunk(index: int, source: str, content: str) -> str:
+    """Format a chunk for a prompt (memoized; hot chunks recur across queries)."""
+    return f"[Source {index}: {source}]\n{content}"
+
 
 class AnalysisType(Enum):
     """Types of analysis the agent can perform."""
@@ -33,7 +175,14 @@ class AnalysisType(Enum):
     TIMELINE = "timeline"
 
 
-@dataclass
+def _result_encoder(obj: Any) -> Any:
+    """orjson fallback for types it does not serialize natively."""
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+@dataclass(slots=True)
 class AnalysisResult:
     """Result of data analysis."""
     success: bool
@@ -57,6 +206,10 @@ class AnalysisResult:
             "confidence": self.confidence,
             "metadata": self.metadata
         }
+    
+    def to_json(self) -> bytes:
+        """Serialize directly to JSON bytes (skips the intermediate dict)."""
+        return orjson.dumps(self, default=_result_encoder)
 
 
 class DataAnalyzerAgent:
@@ -73,10 +226,66 @@ class DataAnalyzerAgent:
     
     AGENT_NAME = "data-analyzer-agent"
     
+    # Keyword -> analysis type, matched with a single precompiled regex
+    _KEYWORD_MAP: Dict[str, AnalysisType] = {
+        "compare": AnalysisType.COMPARISON,
+        "difference": AnalysisType.COMPARISON,
+        "versus": AnalysisType.COMPARISON,
+        "vs": AnalysisType.COMPARISON,
+        "trend": AnalysisType.TREND,
+        "over time": AnalysisType.TREND,
+        "change": AnalysisType.TREND,
+        "evolution": AnalysisType.TREND,
+        "summarize": AnalysisType.SUMMARY,
+        "summary": AnalysisType.SUMMARY,
+        "overview": AnalysisType.SUMMARY,
+        "main points": AnalysisType.SUMMARY,
+        "extract": AnalysisType.EXTRACTION,
+        "list": AnalysisType.EXTRACTION,
+        "find all": AnalysisType.EXTRACTION,
+        "identify": AnalysisType.EXTRACTION,
+        "sentiment": AnalysisType.SENTIMENT,
+        "tone": AnalysisType.SENTIMENT,
+        "feeling": AnalysisType.SENTIMENT,
+        "emotion": AnalysisType.SENTIMENT,
+        "topic": AnalysisType.TOPIC_MODELING,
+        "theme": AnalysisType.TOPIC_MODELING,
+        "subject": AnalysisType.TOPIC_MODELING,
+        "about": AnalysisType.TOPIC_MODELING,
+    }
+    # Substring match anywhere, like the original `in` checks ("whereabouts"
+    # hits "about"); the lookahead also finds keywords overlapping another match
+    _KEYWORD_RE = re.compile(
+        r"(?=(" + "|".join(map(re.escape, sorted(_KEYWORD_MAP, key=len, reverse=True))) + r"))",
+        re.IGNORECASE
+    )
+    # Bullet or numbered line; the marker prefix is skipped like lstrip('-•*0123456789.): ')
+    # and only items longer than 20 characters are captured
+    _INSIGHT_RE = re.compile(
+        r"^[^\S\n]*(?:[-•*]|\d[.):])[-•*\d.): ]*([^-•*\d.): \n].{20,}?)[^\S\n]*$",
+        re.MULTILINE
+    )
+    # Analyses that a smaller, faster model handles well
+    _MODEL_ROUTING: Dict[AnalysisType, str] = {
+        AnalysisType.SUMMARY: settings.OPENAI_FAST_MODEL,
+        AnalysisType.EXTRACTION: settings.OPENAI_FAST_MODEL,
+        AnalysisType.SENTIMENT: settings.OPENAI_FAST_MODEL,
+    }
+    # When several types match, the earlier one wins
+    _TYPE_PRIORITY: Dict[AnalysisType, int] = {
+        AnalysisType.COMPARISON: 0,
+        AnalysisType.TREND: 1,
+        AnalysisType.SUMMARY: 2,
+        AnalysisType.EXTRACTION: 3,
+        AnalysisType.SENTIMENT: 4,
+        AnalysisType.TOPIC_MODELING: 5,
+    }
+    
     def __init__(
         self,
         vector_store_dao: Optional[VectorStoreDAO] = None,
-        max_chunks: int = 10
+        max_chunks: int = 10,
+        semantic_cache: Optional[SemanticCache] = None
     ):
         """
         Initialize Data Analyzer Agent.
@@ -84,22 +293,43 @@ class DataAnalyzerAgent:
         Args:
             vector_store_dao: Vector store for searching transcripts
             max_chunks: Maximum chunks to analyze at once
+            semantic_cache: Optional cache for analysis results (defaults to
+                an in-memory cache when SEMANTIC_CACHE_ENABLED is set)
         """
         self.vector_store_dao = vector_store_dao or VectorStoreDAO()
         self.max_chunks = max_chunks
-        self._openai_client = None
+        self._dispatch = {
+            AnalysisType.COMPARISON: self._compare_analysis,
+            AnalysisType.TREND: self._trend_analysis,
+            AnalysisType.SUMMARY: self._summary_analysis,
+            AnalysisType.EXTRACTION: self._extraction_analysis,
+            AnalysisType.SENTIMENT: self._sentiment_analysis,
+        }
+        # In-flight searches, so identical concurrent searches share one execution
+        self._inflight: Dict[Tuple[str, Tuple[str, ...], int], asyncio.Future] = {}
+        
+        if semantic_cache is None and settings.SEMANTIC_CACHE_ENABLED:
+            semantic_cache = SemanticCache(
+                embed_fn=self._embed_query,
+                threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+                ttl_seconds=settings.SEMANTIC_CACHE_TTL_SECONDS,
+                max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES
+            )
+        self.semantic_cache = semantic_cache
     
-    @property
-    def openai_client(self) -> OpenAI:
-        """Lazy-load OpenAI client."""
-        if self._openai_client is None:
-            if not settings.OPENAI_API_KEY:
-                raise AgentException(
-                    "OpenAI API key not configured",
-                    agent_name=self.AGENT_NAME
-                )
-            self._openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        return self._openai_client
+    @classmethod
+    def _get_client(cls) -> AsyncOpenAI:
+        """Get the process-wide async OpenAI client shared by all agents."""
+        if not settings.OPENAI_API_KEY:
+            raise AgentException(
+                "OpenAI API key not configured",
+                agent_name=cls.AGENT_NAME
+            )
+        return get_openai()
+    
+    def _embed_query(self, query: str) -> List[float]:
+        """Embed a query with the vector store's embeddings model."""
+        return self.vector_store_dao.embed_query(query)
     
     async def analyze(
         self,
@@ -125,34 +355,38 @@ class DataAnalyzerAgent:
         try:
             # Determine analysis type if not specified
             if analysis_type is None:
-                analysis_type = await self._determine_analysis_type(query)
+                analysis_type = self._determine_analysis_type(query)
             
             # Get context if not provided
             if context is None:
-                search_results = self.vector_store_dao.search(
-                    query=query,
-                    n_results=self.max_chunks,
-                    transcript_ids=transcript_ids
-                )
+                search_results = await self._search(query, transcript_ids)
                 context = {
                     "query": query,
                     "chunks": search_results,
                     "chunk_count": len(search_results)
                 }
             
-            # Route to appropriate analysis method
-            if analysis_type == AnalysisType.COMPARISON:
-                return await self._compare_analysis(query, context)
-            elif analysis_type == AnalysisType.TREND:
-                return await self._trend_analysis(query, context)
-            elif analysis_type == AnalysisType.SUMMARY:
-                return await self._summary_analysis(query, context)
-            elif analysis_type == AnalysisType.EXTRACTION:
-                return await self._extraction_analysis(query, context)
-            elif analysis_type == AnalysisType.SENTIMENT:
-                return await self._sentiment_analysis(query, context)
-            else:
-                return await self._general_analysis(query, context, analysis_type)
+            if self.semantic_cache is None:
+                return await self._run_analysis(query, context, analysis_type)
+            
+            # Reuse a previous result for the same (or a near-identical) query
+            # over the same chunks instead of calling the LLM again
+            scope = self._cache_scope(analysis_type, context.get("chunks", []))
+            result, cache_hit = await self.semantic_cache.get_or_compute(
+                scope,
+                query,
+                lambda: self._run_analysis(query, context, analysis_type),
+                should_cache=lambda r: r.success
+            )
+            
+            if cache_hit:
+                logger.info(f"Semantic cache hit for {analysis_type.value} analysis")
+                return replace(
+                    result,
+                    query=query,
+                    metadata={**result.metadata, "cache_hit": True}
+                )
+            return result
         
         except Exception as e:
             logger.error(f"Analysis failed: {e}")
@@ -161,24 +395,87 @@ class DataAnalyzerAgent:
                 agent_name=self.AGENT_NAME
             )
     
-    async def _determine_analysis_type(self, query: str) -> AnalysisType:
-        """Determine the type of analysis needed."""
-        query_lower = query.lower()
+    async def _search(
+        self,
+        query: str,
+        transcript_ids: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search the vector store off the event loop.
         
-        if any(w in query_lower for w in ["compare", "difference", "versus", "vs"]):
-            return AnalysisType.COMPARISON
-        elif any(w in query_lower for w in ["trend", "over time", "change", "evolution"]):
-            return AnalysisType.TREND
-        elif any(w in query_lower for w in ["summarize", "summary", "overview", "main points"]):
-            return AnalysisType.SUMMARY
-        elif any(w in query_lower for w in ["extract", "list", "find all", "identify"]):
-            return AnalysisType.EXTRACTION
-        elif any(w in query_lower for w in ["sentiment", "tone", "feeling", "emotion"]):
-            return AnalysisType.SENTIMENT
-        elif any(w in query_lower for w in ["topic", "theme", "subject", "about"]):
-            return AnalysisType.TOPIC_MODELING
-        else:
+        Identical concurrent searches are coalesced into a single execution.
+        Results carry ids and metadata only; see _hydrate_contents.
+        
+        Args:
+            query: Search query
+            transcript_ids: Optional filter by transcript IDs
+            
+        Returns:
+            List of matching chunks
+        """
+        key = (query, tuple(transcript_ids or ()), self.max_chunks)
+        future = self._inflight.get(key)
+        
+        if future is None:
+            future = asyncio.ensure_future(asyncio.to_thread(
+                self.vector_store_dao.search,
+                query=query,
+                n_results=self.max_chunks,
+                transcript_ids=transcript_ids,
+                include_content=False
+            ))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # shield() so one caller's cancellation doesn't cancel the shared search
+        return await asyncio.shield(future)
+    
+    async def _run_analysis(
+        self,
+        query: str,
+        context: Dict[str, Any],
+        analysis_type: AnalysisType
+    ) -> AnalysisResult:
+        """Route to the appropriate analysis method."""
+        await self._hydrate_contents(context.get("chunks", []))
+        handler = self._dispatch.get(analysis_type)
+        if handler is not None:
+            return await handler(query, context)
+        return await self._general_analysis(query, context, analysis_type)
+    
+    def _cache_scope(
+        self,
+        analysis_type: AnalysisType,
+        chunks: List[Dict[str, Any]]
+    ) -> str:
+        """Build the semantic cache scope from analysis type and chunk identity."""
+        chunk_keys = sorted(
+            chunk.get("id") or hashlib.sha256(
+                chunk.get("content", "").encode("utf-8")
+            ).hexdigest()
+            for chunk in chunks
+        )
+        # Chunk ids are reused on re-index; the content version retires old entries
+        transcript_ids = sorted({
+            chunk["metadata"]["transcript_id"]
+            for chunk in chunks
+            if chunk.get("metadata", {}).get("transcript_id")
+        })
+        return self.semantic_cache.make_scope(
+            analysis_type.value,
+            self.vector_store_dao.get_content_version(transcript_ids),
+            *chunk_keys
+        )
+    
+    def _determine_analysis_type(self, query: str) -> AnalysisType:
+        """Determine the type of analysis needed."""
+        matches = {
+            self._KEYWORD_MAP[keyword.lower()]
+            for keyword in self._KEYWORD_RE.findall(query)
+        }
+        if not matches:
             return AnalysisType.SUMMARY
+        return min(matches, key=self._TYPE_PRIORITY.__getitem__)
     
     async def _compare_analysis(
         self,
@@ -198,34 +495,35 @@ class DataAnalyzerAgent:
             )
         
         # Group chunks by transcript
-        by_transcript = {}
+        by_transcript: Dict[str, List[str]] = defaultdict(list)
         for chunk in chunks:
             tid = chunk.get("metadata", {}).get("transcript_id", "unknown")
-            if tid not in by_transcript:
-                by_transcript[tid] = []
             by_transcript[tid].append(chunk.get("content", ""))
         
-        # Build comparison prompt
-        context_text = ""
-        for tid, contents in by_transcript.items():
-            context_text += f"\n\n=== Transcript: {tid} ===\n"
-            context_text += "\n---\n".join(contents[:3])
+        if len(by_transcript) == 1:
+            # Nothing to reduce: compare within the single transcript directly
+            contents = next(iter(by_transcript.values()))
+            summaries = ["\n---\n".join(contents[:3])]
+        else:
+            # Map: summarize each transcript concurrently so every call stays
+            # small; reduce: compare the summaries in one final call
+            summaries = await asyncio.gather(*[
+                self._summarize_single(query, tid, contents[:3])
+                for tid, contents in by_transcript.items()
+            ])
         
-        response = self.openai_client.chat.completions.create(
+        parts = []
+        for tid, summary in zip(by_transcript, summaries):
+            parts.append(f"\n\n=== Transcript: {tid} ===\n")
+            parts.append(summary)
+        context_text = self._truncate_to_budget(
+            "".join(parts), self._context_budget(1500, query)
+        )
+        
+        answer, insights = await self._stream_completion(
             model=settings.OPENAI_MODEL,
             messages=[
-                {
-                    "role": "system",
-                    "content": """You are an expert analyst performing comparison analysis on video transcripts.
-
-Provide a structured comparison that includes:
-1. Key similarities between the sources
-2. Notable differences
-3. Unique points in each source
-4. Overall synthesis
-
-Format your response as clear sections with bullet points."""
-                },
+                _COMPARE_SYS,
                 {
                     "role": "user",
                     "content": f"Compare the following transcript content:\n{context_text}\n\nComparison query: {query}"
@@ -235,8 +533,6 @@ Format your response as clear sections with bullet points."""
             temperature=0.3
         )
         
-        answer = response.choices[0].message.content.strip()
-        
         return AnalysisResult(
             success=True,
             analysis_type=AnalysisType.COMPARISON,
@@ -245,12 +541,48 @@ Format your response as clear sections with bullet points."""
                 "comparison": answer,
                 "transcripts_compared": list(by_transcript.keys())
             },
-            insights=self._extract_insights(answer),
+            insights=insights,
             sources_used=len(chunks),
             confidence=0.85,
             metadata={"transcript_count": len(by_transcript)}
         )
     
+    async def _summarize_single(
+        self,
+        query: str,
+        transcript_id: str,
+        contents: List[str]
+    ) -> str:
+        """
+        Summarize one transcript's chunks for the map step of a comparison.
+        
+        Args:
+            query: Comparison query
+            transcript_id: Transcript being summarized
+            contents: Chunk contents from that transcript
+            
+        Returns:
+            Bullet-point summary relevant to the query
+        """
+        content = self._truncate_to_budget(
+            "\n---\n".join(contents),
+            self._context_budget(500, query)
+        )
+        response = await llm_batcher.call(
+            self._get_client(),
+            model=settings.OPENAI_MODEL,
+            messages=[
+                _MAP_SUMMARY_SYS,
+                {
+                    "role": "user",
+                    "content": f"Transcript: {transcript_id}\n{content}\n\nComparison query: {query}"
+                }
+            ],
+            max_tokens=500,
+            temperature=0.3
+        )
+        return response.choices[0].message.content.strip()
+    
     async def _trend_analysis(
         self,
         query: str,
@@ -259,23 +591,14 @@ Format your response as clear sections with bullet points."""
         """Perform trend analysis."""
         chunks = context.get("chunks", [])
         
-        context_text = self._build_context_text(chunks)
+        context_text = self._build_context_text(
+            chunks, token_budget=self._context_budget(1200, query)
+        )
         
-        response = self.openai_client.chat.completions.create(
+        answer, insights = await self._stream_completion(
             model=settings.OPENAI_MODEL,
             messages=[
-                {
-                    "role": "system",
-                    "content": """You are an analyst identifying trends and patterns in video transcript content.
-
-Analyze for:
-1. Recurring themes or topics
-2. Changes or evolution in discussion
-3. Patterns in how topics are addressed
-4. Any temporal progression if evident
-
-Provide specific examples from the content to support your findings."""
-                },
+                _TREND_SYS,
                 {
                     "role": "user",
                     "content": f"Analyze trends in:\n{context_text}\n\nQuery: {query}"
@@ -285,14 +608,12 @@ Provide specific examples from the content to support your findings."""
             temperature=0.3
         )
         
-        answer = response.choices[0].message.content.strip()
-        
         return AnalysisResult(
             success=True,
             analysis_type=AnalysisType.TREND,
             query=query,
             result={"trend_analysis": answer},
-            insights=self._extract_insights(answer),
+            insights=insights,
             sources_used=len(chunks),
             confidence=0.8
         )
@@ -304,24 +625,16 @@ Provide specific examples from the content to support your findings."""
     ) -> AnalysisResult:
         """Generate comprehensive summary."""
         chunks = context.get("chunks", [])
+        model = self._select_model(AnalysisType.SUMMARY, chunks)
         
-        context_text = self._build_context_text(chunks)
+        context_text = self._build_context_text(
+            chunks, token_budget=self._context_budget(1500, query, model)
+        )
         
-        response = self.openai_client.chat.completions.create(
-            model=settings.OPENAI_MODEL,
+        answer, insights = await self._stream_completion(
+            model=model,
             messages=[
-                {
-                    "role": "system",
-                    "content": """You are an expert summarizer for video transcript content.
-
-Create a comprehensive summary that includes:
-1. Main topics covered
-2. Key points and takeaways
-3. Important details or facts mentioned
-4. Any conclusions or recommendations
-
-Structure the summary with clear headings and bullet points."""
-                },
+                _SUMMARY_SYS,
                 {
                     "role": "user",
                     "content": f"Summarize the following content:\n{context_text}\n\nFocus on: {query}"
@@ -331,14 +644,12 @@ Structure the summary with clear headings and bullet points."""
             temperature=0.3
         )
         
-        answer = response.choices[0].message.content.strip()
-        
         return AnalysisResult(
             success=True,
             analysis_type=AnalysisType.SUMMARY,
             query=query,
             result={"summary": answer},
-            insights=self._extract_insights(answer),
+            insights=insights,
             sources_used=len(chunks),
             confidence=0.9
         )
@@ -350,22 +661,16 @@ Structure the summary with clear headings and bullet points."""
     ) -> AnalysisResult:
         """Extract specific information."""
         chunks = context.get("chunks", [])
+        model = self._select_model(AnalysisType.EXTRACTION, chunks)
         
-        context_text = self._build_context_text(chunks)
+        context_text = self._build_context_text(
+            chunks, token_budget=self._context_budget(1200, query, model)
+        )
         
-        response = self.openai_client.chat.completions.create(
-            model=settings.OPENAI_MODEL,
+        answer, _ = await self._stream_completion(
+            model=model,
             messages=[
-                {
-                    "role": "system",
-                    "content": """You are a data extraction specialist.
-
-Extract the requested information from the transcript content.
-- Be thorough and find all instances
-- Format as a clear list
-- Include context for each extracted item
-- Note the source when possible"""
-                },
+                _EXTRACTION_SYS,
                 {
                     "role": "user",
                     "content": f"Extract from this content:\n{context_text}\n\nExtraction request: {query}"
@@ -375,8 +680,6 @@ Extract the requested information from the transcript content.
             temperature=0.2
         )
         
-        answer = response.choices[0].message.content.strip()
-        
         # Try to parse into list
         items = [line.strip() for line in answer.split('\n') if line.strip() and line.strip().startswith(('-', '•', '*', '1', '2', '3'))]
         
@@ -399,24 +702,16 @@ Extract the requested information from the transcript content.
     ) -> AnalysisResult:
         """Analyze sentiment and tone."""
         chunks = context.get("chunks", [])
+        model = self._select_model(AnalysisType.SENTIMENT, chunks)
         
-        context_text = self._build_context_text(chunks)
+        context_text = self._build_context_text(
+            chunks, token_budget=self._context_budget(1000, query, model)
+        )
         
-        response = self.openai_client.chat.completions.create(
-            model=settings.OPENAI_MODEL,
+        answer, insights = await self._stream_completion(
+            model=model,
             messages=[
-                {
-                    "role": "system",
-                    "content": """You are a sentiment and tone analyst.
-
-Analyze the content for:
-1. Overall sentiment (positive, negative, neutral, mixed)
-2. Emotional tone (enthusiastic, serious, casual, etc.)
-3. Speaker attitude toward topics
-4. Any notable shifts in sentiment
-
-Provide specific examples to support your analysis."""
-                },
+                _SENTIMENT_SYS,
                 {
                     "role": "user",
                     "content": f"Analyze sentiment in:\n{context_text}\n\nFocus: {query}"
@@ -426,14 +721,12 @@ Provide specific examples to support your analysis."""
             temperature=0.3
         )
         
-        answer = response.choices[0].message.content.strip()
-        
         return AnalysisResult(
             success=True,
             analysis_type=AnalysisType.SENTIMENT,
             query=query,
             result={"sentiment_analysis": answer},
-            insights=self._extract_insights(answer),
+            insights=insights,
             sources_used=len(chunks),
             confidence=0.75
         )
@@ -447,17 +740,14 @@ Provide specific examples to support your analysis."""
         """Perform general analysis for other types."""
         chunks = context.get("chunks", [])
         
-        context_text = self._build_context_text(chunks)
+        context_text = self._build_context_text(
+            chunks, token_budget=self._context_budget(1200, query)
+        )
         
-        response = self.openai_client.chat.completions.create(
+        answer, insights = await self._stream_completion(
             model=settings.OPENAI_MODEL,
             messages=[
-                {
-                    "role": "system",
-                    "content": """You are an expert analyst for video transcript content.
-Provide thorough, well-structured analysis based on the content provided.
-Support your findings with specific examples from the text."""
-                },
+                _GENERAL_SYS,
                 {
                     "role": "user",
                     "content": f"Analyze this content:\n{context_text}\n\nAnalysis request: {query}"
@@ -467,39 +757,173 @@ Support your findings with specific examples from the text."""
             temperature=0.3
         )
         
-        answer = response.choices[0].message.content.strip()
-        
         return AnalysisResult(
             success=True,
             analysis_type=analysis_type,
             query=query,
             result={"analysis": answer},
-            insights=self._extract_insights(answer),
+            insights=insights,
             sources_used=len(chunks),
             confidence=0.8
         )
     
-    def _build_context_text(self, chunks: List[Dict[str, Any]]) -> str:
-        """Build context text from chunks."""
+    async def _stream_completion(self, **request: Any) -> Tuple[str, List[str]]:
+        """
+        Stream a chat completion, extracting insights as lines complete.
+        
+        Insight parsing runs on each finished line while the rest of the
+        response is still being generated.
+        
+        Args:
+            **request: Keyword arguments for chat.completions.create
+            
+        Returns:
+            Tuple of (answer text, up to 5 insights)
+        """
+        stream = await llm_batcher.call(self._get_client(), stream=True, **request)
+        
+        parts: List[str] = []
+        insights: List[str] = []
+        line = ""
+        
+        try:
+            async for event in stream:
+                if not event.choices:
+                    continue
+                delta = event.choices[0].delta.content
+                if not delta:
+                    continue
+                
+                parts.append(delta)
+                line += delta
+                if "\n" in delta:
+                    *complete, line = line.split("\n")
+                    if len(insights) < 5:
+                        for text in complete:
+                            insights.extend(self._extract_insights(text))
+        finally:
+            await stream.close()
+        
+        if line and len(insights) < 5:
+            insights.extend(self._extract_insights(line))
+        
+        return "".join(parts).strip(), insights[:5]
+    
+    async def _hydrate_contents(self, chunks: List[Dict[str, Any]]) -> None:
+        """
+        Fill in 'content' for chunks returned without it.
+        
+        Missing contents are fetched from the vector store in one bulk lookup
+        off the event loop, and only when an analysis actually runs (semantic
+        cache hits never need the text).
+        """
+        missing = [c for c in chunks if "content" not in c and c.get("id")]
+        if not missing:
+            return
+        
+        contents = await asyncio.to_thread(
+            self.vector_store_dao.get_contents, [c["id"] for c in missing]
+        )
+        for chunk in missing:
+            chunk["content"] = contents.get(chunk["id"], "")
+    
+    def _select_model(
+        self,
+        analysis_type: AnalysisType,
+        chunks: List[Dict[str, Any]]
+    ) -> str:
+        """
+        Pick the model for an analysis.
+        
+        Summary, extraction and sentiment go to the fast model unless the
+        context is very long; everything else uses the main model.
+        """
+        model = self._MODEL_ROUTING.get(analysis_type)
+        if not model:
+            return settings.OPENAI_MODEL
+        
+        context_chars = sum(
+            chunk.get("metadata", {}).get("chunk_length") or len(chunk.get("content", ""))
+            for chunk in chunks[:self.max_chunks]
+        )
+        if context_chars // CHARS_PER_TOKEN > LONG_CONTEXT_TOKENS:
+            return settings.OPENAI_MODEL
+        return model
+    
+    def _context_budget(
+        self,
+        max_tokens: int,
+        query: str,
+        model: Optional[str] = None
+    ) -> int:
+        """
+        Tokens available for transcript context in one prompt.
+        
+        Args:
+            max_tokens: Completion tokens reserved for the response
+            query: User query included in the prompt
+            model: Model the prompt is for (defaults to OPENAI_MODEL)
+            
+        Returns:
+            Token budget for context text
+        """
+        window = _context_window(model or settings.OPENAI_MODEL)
+        query_tokens = len(_get_encoder().encode(query))
+        return max(0, window - max_tokens - PROMPT_OVERHEAD_TOKENS - query_tokens)
+    
+    def _truncate_to_budget(self, text: str, token_budget: int) -> str:
+        """Truncate text to at most token_budget tokens."""
+        tokens = _get_encoder().encode(text)
+        if len(tokens) <= token_budget:
+            return text
+        return _get_encoder().decode(tokens[:token_budget])
+    
+    def _build_context_text(
+        self,
+        chunks: List[Dict[str, Any]],
+        token_budget: Optional[int] = None
+    ) -> str:
+        """
+        Build context text from chunks.
+        
+        Args:
+            chunks: Search result chunks
+            token_budget: Optional token limit; chunks are added greedily and
+                the last one that doesn't fit is truncated to fill the budget
+                
+        Returns:
+            Context text for the prompt
+        """
+        chunks = chunks[:self.max_chunks]
+        
+        separator_tokens = len(_encode_chunk(CONTEXT_SEPARATOR))
         parts = []
-        for i, chunk in enumerate(chunks[:self.max_chunks], 1):
-            source = chunk.get("metadata", {}).get("transcript_id", "Unknown")
-            content = chunk.get("content", "")
-            parts.append(f"[Source {i}: {source}]\n{content}")
-        return "\n\n---\n\n".join(parts)
+        used = 0
+        
+        for i, chunk in enumerate(chunks, 1):
+            formatted = _format_chunk(
+                i,
+                chunk.get("metadata", {}).get("transcript_id", "Unknown"),
+                chunk.get("content", "")
+            )
+            
+            if token_budget is not None:
+                tokens = _encode_chunk(formatted)
+                cost = len(tokens) + (separator_tokens if parts else 0)
+                if used + cost > token_budget:
+                    remaining = token_budget - used - (separator_tokens if parts else 0)
+                    if remaining > 0:
+                        parts.append(_get_encoder().decode(list(tokens[:remaining])))
+                    break
+                used += cost
+            
+            parts.append(formatted)
+        
+        return CONTEXT_SEPARATOR.join(parts)
     
     def _extract_insights(self, text: str) -> List[str]:
-        """Extract key insights from analysis text."""
-        insights = []
-        
-        # Look for bullet points or numbered items
-        lines = text.split('\n')
-        for line in lines:
-            line = line.strip()
-            if line.startswith(('-', '•', '*')) or (len(line) > 2 and line[0].isdigit() and line[1] in '.):'):
-                # Clean up the insight
-                insight = line.lstrip('-•*0123456789.): ').strip()
-                if len(insight) > 20:  # Skip very short items
-                    insights.append(insight)
-        
-        return insights[:5]  # Return top 5 insights
\ No newline at end of file
+        """Extract key insights (top 5 bullet/numbered items) from analysis text."""
+        return [
+            m.group(1)
+            for m in itertools.islice(self._INSIGHT_RE.finditer(text), 5)
+        ]
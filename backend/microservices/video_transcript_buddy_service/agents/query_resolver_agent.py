@@ -8,15 +8,26 @@ This agent:
 - Handles multi-step reasoning and handoffs
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import lru_cache
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 from config import settings
 from common.exceptions import AgentException
+from common.llm_client import get_openai
 from dao.vector_store_dao import VectorStoreDAO
+from utils.semantic_cache import SemanticCache
+from utils.session_chunk_cache import SessionChunkCache
+
+try:
+    # Optional: pyahocorasick scans for all indicators in one linear pass
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +40,68 @@ class QueryComplexity(Enum):
     MULTI_TRANSCRIPT = "multi_transcript"  # Cross-transcript analysis
 
 
-@dataclass
+MULTI_TRANSCRIPT_INDICATORS = (
+    "all videos", "across", "throughout", "every transcript",
+    "multiple", "different videos"
+)
+
+COMPLEX_INDICATORS = (
+    "compare", "contrast", "analyze", "relationship",
+    "trend", "pattern", "correlation", "difference",
+    "how does", "why does", "explain why"
+)
+
+
+def _build_indicator_automaton():
+    """Build an Aho-Corasick automaton over all indicators (None if unavailable)."""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for indicator in COMPLEX_INDICATORS:
+        automaton.add_word(indicator, QueryComplexity.COMPLEX)
+    for indicator in MULTI_TRANSCRIPT_INDICATORS:
+        automaton.add_word(indicator, QueryComplexity.MULTI_TRANSCRIPT)
+    automaton.make_automaton()
+    return automaton
+
+
+_INDICATOR_AUTOMATON = _build_indicator_automaton()
+
+
+@lru_cache(maxsize=4096)
+def _classify(query_lower: str) -> str:
+    """
+    Classify a lowercased query, returning the QueryComplexity value.
+    
+    Pure and cached: repeated queries skip the indicator scan entirely.
+    """
+    if _INDICATOR_AUTOMATON is not None:
+        # Multi-transcript indicators take priority over complex ones
+        found = None
+        for _, category in _INDICATOR_AUTOMATON.iter(query_lower):
+            if category == QueryComplexity.MULTI_TRANSCRIPT:
+                return category.value
+            found = category
+        if found is not None:
+            return found.value
+    else:
+        # Check for multi-transcript queries
+        if any(indicator in query_lower for indicator in MULTI_TRANSCRIPT_INDICATORS):
+            return QueryComplexity.MULTI_TRANSCRIPT.value
+        
+        # Check for complex queries
+        if any(indicator in query_lower for indicator in COMPLEX_INDICATORS):
+            return QueryComplexity.COMPLEX.value
+    
+    # Check for moderate complexity (questions with multiple parts)
+    if query_lower.count("?") > 1 or " and " in query_lower:
+        return QueryComplexity.MODERATE.value
+    
+    return QueryComplexity.SIMPLE.value
+
+
+@dataclass(slots=True)
 class ResolverResult:
     """Result of query resolution."""
     success: bool
@@ -74,10 +146,47 @@ class QueryResolverAgent:
     MIN_CONFIDENCE_THRESHOLD = 0.3
     HANDOFF_COMPLEXITY_THRESHOLD = QueryComplexity.COMPLEX
     
+    # Maximum queries resolved concurrently by resolve_many (OpenAI rate limits)
+    MAX_CONCURRENCY = 8
+    
+    # Candidates prefetched per session, as a multiple of the chunks used
+    PREFETCH_FACTOR = 4
+    
+    NO_RESULTS_ANSWER = "I couldn't find any relevant information in the transcripts to answer your question."
+    
+    # System prompt per query complexity (MODERATE uses the default prompt)
+    _SYSTEM_PROMPTS: Dict[QueryComplexity, str] = {
+        QueryComplexity.COMPLEX: """You are an expert analyst answering questions based on video transcript content.
+
+For complex questions:
+- Analyze the information thoroughly
+- Consider multiple perspectives
+- Draw connections between different parts of the content
+- Provide structured, detailed answers
+- Cite sources when making claims
+
+If information is insufficient, explain what's missing.""",
+        QueryComplexity.MULTI_TRANSCRIPT: """You are an assistant answering questions across multiple video transcripts.
+
+- Synthesize information from all provided sources
+- Note any differences or contradictions between sources
+- Clearly attribute information to specific transcripts
+- Provide a comprehensive overview""",
+        QueryComplexity.SIMPLE: """You are a helpful assistant answering questions based on video transcript content.
+
+Rules:
+- Only answer based on the provided context
+- If the context doesn't contain relevant information, say so
+- Cite sources when possible (e.g., "According to Source 1...")
+- Be concise but thorough""",
+    }
+    
     def __init__(
         self,
         vector_store_dao: Optional[VectorStoreDAO] = None,
-        max_sources: int = 5
+        max_sources: int = 5,
+        semantic_cache: Optional[SemanticCache] = None,
+        session_cache: Optional[SessionChunkCache] = None
     ):
         """
         Initialize Query Resolver Agent.
@@ -85,58 +194,211 @@ class QueryResolverAgent:
         Args:
             vector_store_dao: Vector store for searching transcripts
             max_sources: Maximum number of source chunks to use
+            semantic_cache: Optional cache for resolved answers (defaults to
+                an in-memory cache when SEMANTIC_CACHE_ENABLED is set)
+            session_cache: Optional per-session chunk prefetch cache
         """
         self.vector_store_dao = vector_store_dao or VectorStoreDAO()
         self.max_sources = max_sources
-        self._openai_client = None
+        self.session_cache = session_cache or SessionChunkCache()
+        
+        if semantic_cache is None and settings.SEMANTIC_CACHE_ENABLED:
+            semantic_cache = SemanticCache(
+                embed_fn=self._embed_query,
+                threshold=settings.RESOLVER_CACHE_THRESHOLD,
+                ttl_seconds=settings.SEMANTIC_CACHE_TTL_SECONDS,
+                max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES
+            )
+        self.semantic_cache = semantic_cache
     
     @property
-    def openai_client(self) -> OpenAI:
-        """Lazy-load OpenAI client."""
-        if self._openai_client is None:
-            if not settings.OPENAI_API_KEY:
-                raise AgentException(
-                    "OpenAI API key not configured",
-                    agent_name=self.AGENT_NAME
-                )
-            self._openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        return self._openai_client
+    def openai_client(self) -> AsyncOpenAI:
+        """Get the process-wide async OpenAI client shared by all agents."""
+        if not settings.OPENAI_API_KEY:
+            raise AgentException(
+                "OpenAI API key not configured",
+                agent_name=self.AGENT_NAME
+            )
+        return get_openai()
+    
+    def _embed_query(self, query: str) -> List[float]:
+        """Embed a query for semantic cache lookups."""
+        return self.vector_store_dao.embed_query(query)
     
     async def resolve(
         self,
         query: str,
         transcript_ids: Optional[List[str]] = None,
-        include_reasoning: bool = False
+        include_reasoning: bool = False,
+        search_results: Optional[List[Dict[str, Any]]] = None,
+        session_id: Optional[str] = None
     ) -> ResolverResult:
         """
         Resolve a user query.
         
+        Near-duplicate queries over the same transcripts are answered from
+        the semantic cache, skipping vector search and the LLM call.
+        
         Args:
             query: User's question
             transcript_ids: Optional filter by transcript IDs
             include_reasoning: Whether to include reasoning steps
+            search_results: Precomputed search results (skips the vector search)
+            session_id: Optional conversation/session ID; follow-up queries on
+                the same transcripts re-rank the previous turn's candidates
             
         Returns:
             ResolverResult with answer and sources
         """
+        if self.semantic_cache is None:
+            return await self._resolve(
+                query, transcript_ids, include_reasoning, search_results, session_id
+            )
+        
+        # The content version retires entries once a transcript is re-indexed or deleted
+        scope = self.semantic_cache.make_scope(
+            "resolve",
+            include_reasoning,
+            self.vector_store_dao.get_content_version(transcript_ids),
+            *sorted(transcript_ids or [])
+        )
+        result, cache_hit = await self.semantic_cache.get_or_compute(
+            scope,
+            query,
+            lambda: self._resolve(
+                query, transcript_ids, include_reasoning, search_results, session_id
+            ),
+            should_cache=lambda r: r.success
+        )
+        
+        if cache_hit:
+            logger.info(f"Semantic cache hit for query: {query[:50]}...")
+            return replace(
+                result,
+                query=query,
+                metadata={**result.metadata, "cache_hit": True}
+            )
+        return result
+    
+    async def resolve_many(
+        self,
+        queries: List[str],
+        transcript_ids: Optional[List[str]] = None,
+        include_reasoning: bool = False
+    ) -> List[ResolverResult]:
+        """
+        Resolve several queries concurrently.
+        
+        All queries are embedded and searched in one batched vector store
+        call; answers are then generated with at most MAX_CONCURRENCY queries
+        in flight. A query that fails yields an unsuccessful ResolverResult
+        instead of failing the batch.
+        
+        Args:
+            queries: User questions
+            transcript_ids: Optional filter by transcript IDs (applies to all)
+            include_reasoning: Whether to include reasoning steps
+            
+        Returns:
+            ResolverResults in the same order as queries
+        """
+        try:
+            batch_results = await asyncio.to_thread(
+                self.vector_store_dao.search_batch,
+                queries,
+                n_results=self.max_sources,
+                transcript_ids=transcript_ids
+            )
+        except Exception as e:
+            # Fall back to searching per query
+            logger.warning(f"Batch search failed, searching per query: {e}")
+            batch_results = [None] * len(queries)
+        
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        
+        async def resolve_one(
+            query: str,
+            search_results: Optional[List[Dict[str, Any]]]
+        ) -> ResolverResult:
+            async with semaphore:
+                return await self.resolve(
+                    query, transcript_ids, include_reasoning, search_results
+                )
+        
+        results = await asyncio.gather(
+            *[resolve_one(q, r) for q, r in zip(queries, batch_results)],
+            return_exceptions=True
+        )
+        
+        return [
+            result if not isinstance(result, BaseException) else ResolverResult(
+                success=False,
+                query=query,
+                answer="",
+                metadata={"error": str(result)}
+            )
+            for query, result in zip(queries, results)
+        ]
+    
+    async def resolve_stream(
+        self,
+        query: str,
+        transcript_ids: Optional[List[str]] = None,
+        session_id: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Resolve a user query, yielding the answer as it is generated.
+        
+        Unlike resolve(), this bypasses the semantic cache and never hands
+        off to the data analyzer; the answer is always generated directly.
+        
+        Args:
+            query: User's question
+            transcript_ids: Optional filter by transcript IDs
+            session_id: Optional conversation/session ID (see resolve)
+            
+        Yields:
+            Answer text fragments in generation order
+        """
+        logger.info(f"Resolving query (streaming): {query[:50]}...")
+        
+        complexity = await self._analyze_complexity(query.lower())
+        search_results = self._search(query, transcript_ids, self.max_sources, session_id)
+        
+        if not search_results:
+            yield self.NO_RESULTS_ANSWER
+            return
+        
+        context = self._build_context(search_results)
+        async for token in self._generate_answer_stream(query, context, complexity):
+            yield token
+    
+    async def _resolve(
+        self,
+        query: str,
+        transcript_ids: Optional[List[str]],
+        include_reasoning: bool,
+        search_results: Optional[List[Dict[str, Any]]] = None,
+        session_id: Optional[str] = None
+    ) -> ResolverResult:
+        """Run the full resolution pipeline (search + answer generation)."""
         logger.info(f"Resolving query: {query[:50]}...")
         reasoning_steps = []
         
         try:
-            # Step 1: Analyze query complexity
-            complexity = await self._analyze_complexity(query)
+            # Step 1: Analyze query complexity (lowercased once for all scans)
+            complexity = await self._analyze_complexity(query.lower())
             reasoning_steps.append(f"Query complexity: {complexity.value}")
             
             # Step 2: Check if handoff is needed
             if complexity == QueryComplexity.COMPLEX:
                 reasoning_steps.append("Complex query detected, may need data analyzer")
             
-            # Step 3: Search for relevant content
-            search_results = self.vector_store_dao.search(
-                query=query,
-                n_results=self.max_sources,
-                transcript_ids=transcript_ids
-            )
+            # Step 3: Search for relevant content (unless already batched)
+            if search_results is None:
+                search_results = self._search(
+                    query, transcript_ids, self.max_sources, session_id
+                )
             reasoning_steps.append(f"Found {len(search_results)} relevant chunks")
             
             # Step 4: Check if we have enough content
@@ -144,7 +406,7 @@ class QueryResolverAgent:
                 return ResolverResult(
                     success=False,
                     query=query,
-                    answer="I couldn't find any relevant information in the transcripts to answer your question.",
+                    answer=self.NO_RESULTS_ANSWER,
                     confidence=0.0,
                     complexity=complexity,
                     reasoning_steps=reasoning_steps if include_reasoning else []
@@ -161,7 +423,7 @@ class QueryResolverAgent:
                     success=True,
                     query=query,
                     answer="",
-                    sources=self._format_sources(search_results),
+                    sources=self._format_sources(search_results)[0],
                     confidence=avg_score,
                     complexity=complexity,
                     reasoning_steps=reasoning_steps if include_reasoning else [],
@@ -174,7 +436,7 @@ class QueryResolverAgent:
             reasoning_steps.append("Generated answer from context")
             
             # Step 8: Format sources
-            sources = self._format_sources(search_results)
+            sources, transcript_count = self._format_sources(search_results)
             
             return ResolverResult(
                 success=True,
@@ -186,7 +448,7 @@ class QueryResolverAgent:
                 reasoning_steps=reasoning_steps if include_reasoning else [],
                 metadata={
                     "chunks_used": len(search_results),
-                    "transcript_count": len(set(s.get("transcript_id") for s in sources))
+                    "transcript_count": transcript_count
                 }
             )
         
@@ -197,50 +459,56 @@ class QueryResolverAgent:
                 agent_name=self.AGENT_NAME
             )
     
-    async def _analyze_complexity(self, query: str) -> QueryComplexity:
-        """Analyze the complexity of the query."""
-        query_lower = query.lower()
-        
-        # Simple heuristics first
-        complex_indicators = [
-            "compare", "contrast", "analyze", "relationship",
-            "trend", "pattern", "correlation", "difference",
-            "how does", "why does", "explain why"
-        ]
-        
-        multi_transcript_indicators = [
-            "all videos", "across", "throughout", "every transcript",
-            "multiple", "different videos"
-        ]
-        
-        # Check for multi-transcript queries
-        if any(indicator in query_lower for indicator in multi_transcript_indicators):
-            return QueryComplexity.MULTI_TRANSCRIPT
+    def _search(
+        self,
+        query: str,
+        transcript_ids: Optional[List[str]],
+        n_results: int,
+        session_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for relevant chunks, reusing the session's prefetched candidates.
         
-        # Check for complex queries
-        if any(indicator in query_lower for indicator in complex_indicators):
-            return QueryComplexity.COMPLEX
+        Without a session or transcript filter this is a plain vector search.
+        """
+        if not (session_id and transcript_ids):
+            return self.vector_store_dao.search(
+                query=query,
+                n_results=n_results,
+                transcript_ids=transcript_ids
+            )
         
-        # Check for moderate complexity (questions with multiple parts)
-        if query.count("?") > 1 or " and " in query_lower:
-            return QueryComplexity.MODERATE
+        hint = self.session_cache.get(session_id, transcript_ids)
+        if hint is not None:
+            results = self.vector_store_dao.rerank(query, hint.chunks, n_results=n_results)
+            # Topic still stable: the best candidate scores at least as well as the
+            # weakest one prefetched, so better chunks are unlikely outside the set
+            if (
+                results
+                and len(results) >= min(n_results, len(hint.chunks))
+                and results[0]["score"] >= hint.score_floor
+            ):
+                return results
         
-        return QueryComplexity.SIMPLE
+        candidates = self.vector_store_dao.search(
+            query=query,
+            n_results=n_results * self.PREFETCH_FACTOR,
+            transcript_ids=transcript_ids
+        )
+        self.session_cache.set(session_id, transcript_ids, candidates)
+        return candidates[:n_results]
+    
+    async def _analyze_complexity(self, query_lower: str) -> QueryComplexity:
+        """Analyze the complexity of the query (expects it already lowercased)."""
+        return QueryComplexity(_classify(query_lower))
     
     def _build_context(self, search_results: List[Dict[str, Any]]) -> str:
         """Build context string from search results."""
-        context_parts = []
-        
-        for i, result in enumerate(search_results, 1):
-            source = result.get("metadata", {}).get("transcript_id", "Unknown")
-            content = result.get("content", "")
-            score = result.get("score", 0)
-            
-            context_parts.append(
-                f"[Source {i}: {source} (relevance: {score:.2f})]\n{content}"
-            )
-        
-        return "\n\n---\n\n".join(context_parts)
+        return "\n\n---\n\n".join([
+            f"[Source {i}: {result.get('metadata', {}).get('transcript_id', 'Unknown')} "
+            f"(relevance: {result.get('score', 0):.2f})]\n{result.get('content', '')}"
+            for i, result in enumerate(search_results, 1)
+        ])
     
     async def _generate_answer(
         self,
@@ -248,40 +516,23 @@ class QueryResolverAgent:
         context: str,
         complexity: QueryComplexity
     ) -> str:
-        """Generate answer using LLM."""
+        """Generate answer using LLM (buffers the streamed response)."""
+        parts = [token async for token in self._generate_answer_stream(query, context, complexity)]
+        return "".join(parts).strip()
+    
+    async def _generate_answer_stream(
+        self,
+        query: str,
+        context: str,
+        complexity: QueryComplexity
+    ) -> AsyncIterator[str]:
+        """Generate answer using LLM, yielding tokens as they arrive."""
         
         # Adjust prompt based on complexity
-        if complexity == QueryComplexity.COMPLEX:
-            system_prompt = """You are an expert analyst answering questions based on video transcript content.
-
-For complex questions:
-- Analyze the information thoroughly
-- Consider multiple perspectives
-- Draw connections between different parts of the content
-- Provide structured, detailed answers
-- Cite sources when making claims
-
-If information is insufficient, explain what's missing."""
-        
-        elif complexity == QueryComplexity.MULTI_TRANSCRIPT:
-            system_prompt = """You are an assistant answering questions across multiple video transcripts.
-
-- Synthesize information from all provided sources
-- Note any differences or contradictions between sources
-- Clearly attribute information to specific transcripts
-- Provide a comprehensive overview"""
-        
-        else:
-            system_prompt = """You are a helpful assistant answering questions based on video transcript content.
-
-Rules:
-- Only answer based on the provided context
-- If the context doesn't contain relevant information, say so
-- Cite sources when possible (e.g., "According to Source 1...")
-- Be concise but thorough"""
+        system_prompt = self._SYSTEM_PROMPTS.get(complexity, self._SYSTEM_PROMPTS[QueryComplexity.SIMPLE])
         
         try:
-            response = self.openai_client.chat.completions.create(
+            response = await self.openai_client.chat.completions.create(
                 model=settings.OPENAI_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -291,10 +542,13 @@ Rules:
                     }
                 ],
                 max_tokens=1000,
-                temperature=0.3
+                temperature=0.3,
+                stream=True
             )
             
-            return response.choices[0].message.content.strip()
+            async for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
         
         except Exception as e:
             logger.error(f"Failed to generate answer: {e}")
@@ -303,31 +557,39 @@ Rules:
                 agent_name=self.AGENT_NAME
             )
     
-    def _format_sources(self, search_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Format search results as source references."""
+    def _format_sources(
+        self,
+        search_results: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Format search results as source references.
+        
+        Returns:
+            Tuple of (sources, number of distinct transcripts)
+        """
         sources = []
         seen_transcripts = set()
         
         for result in search_results:
             metadata = result.get("metadata", {})
+            content = result.get("content")
             transcript_id = metadata.get("transcript_id", "Unknown")
+            seen_transcripts.add(transcript_id)
             
-            source = {
+            sources.append({
                 "transcript_id": transcript_id,
                 "chunk_index": metadata.get("chunk_index", 0),
                 "score": round(result.get("score", 0), 4),
-                "preview": result.get("content", "")[:200] + "..." if result.get("content") else ""
-            }
-            
-            sources.append(source)
-            seen_transcripts.add(transcript_id)
+                "preview": content[:200] + "..." if content else ""
+            })
         
-        return sources
+        return sources, len(seen_transcripts)
     
     async def get_context_for_handoff(
         self,
         query: str,
-        transcript_ids: Optional[List[str]] = None
+        transcript_ids: Optional[List[str]] = None,
+        session_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Get context for handing off to another agent.
@@ -335,19 +597,21 @@ Rules:
         Args:
             query: User's question
             transcript_ids: Optional filter by transcript IDs
+            session_id: Optional conversation/session ID (see resolve)
             
         Returns:
             Context dict for handoff
         """
-        search_results = self.vector_store_dao.search(
-            query=query,
-            n_results=self.max_sources * 2,  # Get more for handoff
-            transcript_ids=transcript_ids
+        search_results = self._search(
+            query,
+            transcript_ids,
+            self.max_sources * 2,  # Get more for handoff
+            session_id
         )
         
         return {
             "query": query,
             "context": self._build_context(search_results),
-            "sources": self._format_sources(search_results),
+            "sources": self._format_sources(search_results)[0],
             "chunk_count": len(search_results)
         }
\ No newline at end of file
@@ -14,12 +14,30 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from enum import Enum
 
-from openai import OpenAI
+import orjson
+from openai import AsyncOpenAI
 from config import settings
 from common.exceptions import AgentException
+from common.llm_client import get_openai
+
+try:
+    # Optional: google-re2 matches in linear time without backtracking
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
 
 logger = logging.getLogger(__name__)
 
+# Sanitization: strip potentially dangerous characters (keeps punctuation)
+# in one C-level pass, then collapse whitespace
+_DANGER_TBL = str.maketrans("", "", "<>{}|[]\\^`")
+_WS_RE = re.compile(r'\s+')
+
+# Model prefixes that accept response_format={"type": "json_object"}
+_JSON_MODE_MODEL_PREFIXES = (
+    "gpt-4o", "gpt-4.1", "gpt-4-turbo", "gpt-4-1106", "gpt-4-0125", "gpt-3.5-turbo"
+)
+
 
 class QueryValidationStatus(Enum):
     """Query validation status codes."""
@@ -30,7 +48,7 @@ class QueryValidationStatus(Enum):
     POTENTIALLY_HARMFUL = "potentially_harmful"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of query validation."""
     status: QueryValidationStatus
@@ -58,15 +76,14 @@ class ValidationResult:
         }
 
 
-class QueryValidatorAgent:
+class BasicQueryValidator:
     """
-    Agent for validating user queries.
+    Rule-based validator for user queries (no LLM calls).
     
     Performs:
     - Basic validation (length, format)
-    - Content validation (relevance, safety)
+    - Pattern-based safety check
     - Query sanitization
-    - Improvement suggestions
     """
     
     AGENT_NAME = "query-validator-agent"
@@ -75,33 +92,15 @@ class QueryValidatorAgent:
     MIN_QUERY_LENGTH = 3
     MAX_QUERY_LENGTH = 1000
     
-    # Patterns for basic filtering
+    # Patterns for basic filtering (matched case-insensitively)
     HARMFUL_PATTERNS = [
-        r'(?i)(hack|exploit|attack|injection)',
-        r'(?i)(password|credential|secret).*(?:steal|get|find)',
+        r'(hack|exploit|attack|injection)',
+        r'(password|credential|secret).*(?:steal|get|find)',
     ]
-    
-    def __init__(self, use_llm: bool = True):
-        """
-        Initialize Query Validator Agent.
-        
-        Args:
-            use_llm: Whether to use LLM for advanced validation
-        """
-        self.use_llm = use_llm
-        self._openai_client = None
-    
-    @property
-    def openai_client(self) -> OpenAI:
-        """Lazy-load OpenAI client."""
-        if self._openai_client is None:
-            if not settings.OPENAI_API_KEY:
-                raise AgentException(
-                    "OpenAI API key not configured",
-                    agent_name=self.AGENT_NAME
-                )
-            self._openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        return self._openai_client
+    # All patterns in one alternation: a single scan per query
+    _HARMFUL_RE = _re_engine.compile(
+        "(?i)" + "|".join(f"(?:{p})" for p in HARMFUL_PATTERNS)
+    )
     
     async def validate(self, query: str) -> ValidationResult:
         """
@@ -128,16 +127,6 @@ class QueryValidatorAgent:
         # Step 3: Sanitize query
         sanitized_query = self._sanitize_query(query)
         
-        # Step 4: LLM-based validation (if enabled)
-        if self.use_llm:
-            try:
-                llm_result = await self._llm_validation(sanitized_query)
-                if not llm_result.is_valid:
-                    llm_result.sanitized_query = sanitized_query
-                    return llm_result
-            except Exception as e:
-                logger.warning(f"LLM validation failed, continuing with basic validation: {e}")
-        
         # All checks passed
         return ValidationResult(
             status=QueryValidationStatus.VALID,
@@ -150,34 +139,36 @@ class QueryValidatorAgent:
     
     def _basic_validation(self, query: str) -> ValidationResult:
         """Perform basic validation checks."""
-        # Check if empty
-        if not query or not query.strip():
+        # Check maximum length first, so oversized input is rejected before any copying
+        if query and len(query) > self.MAX_QUERY_LENGTH:
             return ValidationResult(
                 status=QueryValidationStatus.INVALID,
                 is_valid=False,
                 original_query=query,
-                message="Query cannot be empty",
-                suggestions=["Please enter a question about the transcripts"]
+                message=f"Query is too long (maximum {self.MAX_QUERY_LENGTH} characters)",
+                suggestions=["Please shorten your question"]
             )
         
-        # Check minimum length
-        if len(query.strip()) < self.MIN_QUERY_LENGTH:
+        stripped = query.strip() if query else ""
+        
+        # Check if empty
+        if not stripped:
             return ValidationResult(
                 status=QueryValidationStatus.INVALID,
                 is_valid=False,
                 original_query=query,
-                message=f"Query is too short (minimum {self.MIN_QUERY_LENGTH} characters)",
-                suggestions=["Please provide more detail in your question"]
+                message="Query cannot be empty",
+                suggestions=["Please enter a question about the transcripts"]
             )
         
-        # Check maximum length
-        if len(query) > self.MAX_QUERY_LENGTH:
+        # Check minimum length
+        if len(stripped) < self.MIN_QUERY_LENGTH:
             return ValidationResult(
                 status=QueryValidationStatus.INVALID,
                 is_valid=False,
                 original_query=query,
-                message=f"Query is too long (maximum {self.MAX_QUERY_LENGTH} characters)",
-                suggestions=["Please shorten your question"]
+                message=f"Query is too short (minimum {self.MIN_QUERY_LENGTH} characters)",
+                suggestions=["Please provide more detail in your question"]
             )
         
         # Passed basic validation
@@ -190,16 +181,15 @@ class QueryValidatorAgent:
     
     def _safety_check(self, query: str) -> ValidationResult:
         """Check for potentially harmful queries."""
-        for pattern in self.HARMFUL_PATTERNS:
-            if re.search(pattern, query):
-                logger.warning(f"Potentially harmful query detected: {query[:50]}...")
-                return ValidationResult(
-                    status=QueryValidationStatus.POTENTIALLY_HARMFUL,
-                    is_valid=False,
-                    original_query=query,
-                    message="Query contains potentially harmful content",
-                    suggestions=["Please rephrase your question"]
-                )
+        if self._HARMFUL_RE.search(query):
+            logger.warning(f"Potentially harmful query detected: {query[:50]}...")
+            return ValidationResult(
+                status=QueryValidationStatus.POTENTIALLY_HARMFUL,
+                is_valid=False,
+                original_query=query,
+                message="Query contains potentially harmful content",
+                suggestions=["Please rephrase your question"]
+            )
         
         return ValidationResult(
             status=QueryValidationStatus.VALID,
@@ -210,22 +200,62 @@ class QueryValidatorAgent:
     
     def _sanitize_query(self, query: str) -> str:
         """Sanitize and normalize the query."""
-        # Strip whitespace
-        sanitized = query.strip()
+        return _WS_RE.sub(' ', query.strip().translate(_DANGER_TBL))
+
+
+class LLMQueryValidator(BasicQueryValidator):
+    """
+    Validator that adds an LLM relevance/clarity check to the basic rules.
+    
+    Also generates improvement suggestions.
+    """
+    
+    @property
+    def openai_client(self) -> AsyncOpenAI:
+        """Get the process-wide async OpenAI client shared by all agents."""
+        if not settings.OPENAI_API_KEY:
+            raise AgentException(
+                "OpenAI API key not configured",
+                agent_name=self.AGENT_NAME
+            )
+        return get_openai()
+    
+    async def validate(self, query: str) -> ValidationResult:
+        """
+        Validate a user query, then check it with the LLM.
         
-        # Normalize multiple spaces
-        sanitized = re.sub(r'\s+', ' ', sanitized)
+        Args:
+            query: User's query string
+            
+        Returns:
+            ValidationResult with validation details
+        """
+        result = await super().validate(query)
+        if not result.is_valid:
+            return result
         
-        # Remove potentially dangerous characters (but keep punctuation)
-        sanitized = re.sub(r'[<>{}|\[\]\\^`]', '', sanitized)
+        # Step 4: LLM-based validation (falls back to the basic result on error)
+        try:
+            llm_result = await self._llm_validation(result.sanitized_query)
+            if not llm_result.is_valid:
+                llm_result.sanitized_query = result.sanitized_query
+                return llm_result
+        except Exception as e:
+            logger.warning(f"LLM validation failed, continuing with basic validation: {e}")
         
-        return sanitized
+        return result
     
     async def _llm_validation(self, query: str) -> ValidationResult:
         """Use LLM to validate query relevance and clarity."""
+        # JSON mode guarantees parseable output when the configured model
+        # supports it; otherwise fenced output is handled below
+        model_options = {"model": settings.OPENAI_MODEL}
+        if settings.OPENAI_MODEL.startswith(_JSON_MODE_MODEL_PREFIXES):
+            model_options["response_format"] = {"type": "json_object"}
+        
         try:
-            response = self.openai_client.chat.completions.create(
-                model=settings.OPENAI_MODEL,
+            response = await self.openai_client.chat.completions.create(
+                **model_options,
                 messages=[
                     {
                         "role": "system",
@@ -256,14 +286,12 @@ Respond with JSON only:
             content = response.choices[0].message.content.strip()
             
             # Try to extract JSON
-            import json
             try:
                 # Handle potential markdown code blocks
                 if "```" in content:
-                    content = re.search(r'```(?:json)?\s*(.*?)\s*```', content, re.DOTALL)
-                    content = content.group(1) if content else "{}"
+                    content = self._strip_code_fence(content)
                 
-                result = json.loads(content)
+                result = orjson.loads(content)
                 
                 status_map = {
                     "valid": QueryValidationStatus.VALID,
@@ -280,7 +308,7 @@ Respond with JSON only:
                     suggestions=result.get("suggestions", []),
                     confidence=0.9
                 )
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # If JSON parsing fails, assume valid
                 logger.warning(f"Failed to parse LLM validation response: {content}")
                 return ValidationResult(
@@ -298,10 +326,17 @@ Respond with JSON only:
                 agent_name=self.AGENT_NAME
             )
     
+    @staticmethod
+    def _strip_code_fence(content: str) -> str:
+        """Return the body of the first ```/```json fenced block ("{}" if unclosed)."""
+        _, _, rest = content.partition("```")
+        body, closing, _ = rest.removeprefix("json").partition("```")
+        return body.strip() if closing else "{}"
+    
     async def suggest_improvements(self, query: str) -> List[str]:
         """Generate suggestions to improve the query."""
         try:
-            response = self.openai_client.chat.completions.create(
+            response = await self.openai_client.chat.completions.create(
                 model=settings.OPENAI_MODEL,
                 messages=[
                     {
@@ -329,4 +364,43 @@ Respond with just the suggestions, one per line."""
         
         except Exception as e:
             logger.error(f"Failed to generate suggestions: {e}")
-            return []
\ No newline at end of file
+            return []
+
+
+class QueryValidatorAgent(LLMQueryValidator):
+    """
+    Backward-compatible validator keeping the original constructor.
+    
+    Prefer create_query_validator(); with use_llm=False this behaves like
+    BasicQueryValidator.
+    """
+    
+    def __init__(self, use_llm: bool = True):
+        """
+        Initialize Query Validator Agent.
+        
+        Args:
+            use_llm: Whether to use LLM for advanced validation
+        """
+        self.use_llm = use_llm
+    
+    async def validate(self, query: str) -> ValidationResult:
+        """Validate a user query, adding the LLM check only when use_llm is set."""
+        if not self.use_llm:
+            return await BasicQueryValidator.validate(self, query)
+        return await super().validate(query)
+
+
+def create_query_validator(use_llm: Optional[bool] = None) -> BasicQueryValidator:
+    """
+    Create the configured query validator.
+    
+    Args:
+        use_llm: Whether to add LLM validation (defaults to USE_LLM_VALIDATION)
+        
+    Returns:
+        LLMQueryValidator or BasicQueryValidator
+    """
+    if use_llm is None:
+        use_llm = settings.USE_LLM_VALIDATION
+    return LLMQueryValidator() if use_llm else BasicQueryValidator()
@@ -0,0 +1,45 @@
+"""Add composite indexes to usage_records for per-user aggregations
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 10:00:00.000000
+
+Known drift: the usage_records table created by 0001 has a `timestamp`
+column, while models/usage.py (used by init_db()) has `created_at` and
+declares the equivalent indexes as ix_usage_records_user_created and
+ix_usage_records_user_type_created. These indexes target the migrated
+column. Until the two usage_records schemas are reconciled, autogenerate
+will report the difference; drop those index ops from generated revisions.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Per-user time range scans (newest first) without a sort step
+    op.create_index(
+        'ix_usage_records_user_timestamp',
+        'usage_records',
+        ['user_id', sa.text('timestamp DESC')]
+    )
+    # Per-user, per-type aggregations covered by the index
+    op.create_index(
+        'ix_usage_records_user_type_ts',
+        'usage_records',
+        ['user_id', 'usage_type', 'timestamp']
+    )
+    # user_id alone is a prefix of both composites
+    op.drop_index('ix_usage_records_user_id', table_name='usage_records')
+
+
+def downgrade() -> None:
+    op.create_index('ix_usage_records_user_id', 'usage_records', ['user_id'])
+    op.drop_index('ix_usage_records_user_type_ts', table_name='usage_records')
+    op.drop_index('ix_usage_records_user_timestamp', table_name='usage_records')
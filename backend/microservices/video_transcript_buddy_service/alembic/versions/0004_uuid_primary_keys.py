@@ -0,0 +1,86 @@
+"""Store user, subscription and usage record ids as native UUIDs
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 10:30:00.000000
+
+PostgreSQL only: fixed 16-byte uuid keys compare faster and pack more
+entries per index page than varchar. SQLite has no uuid type, so the
+ids stay strings there.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+# Primary keys converted to uuid (generated server-side when not supplied)
+UUID_PRIMARY_KEYS = ['users', 'subscriptions', 'usage_records']
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == 'postgresql'
+
+
+def _user_foreign_keys():
+    """
+    Find every foreign key referencing users.id as (table, constraint, column).
+    
+    Looked up rather than hard-coded: besides the migrated tables, init_db()
+    creates conversations and mcp_servers, and constraint names may differ.
+    """
+    inspector = sa.inspect(op.get_bind())
+    found = []
+    for table in inspector.get_table_names():
+        for fk in inspector.get_foreign_keys(table):
+            if fk['referred_table'] == 'users' and fk['referred_columns'] == ['id']:
+                found.append((table, fk['name'], fk['constrained_columns'][0]))
+    return found
+
+
+def _convert(to_uuid: bool) -> None:
+    target, cast = (sa.Uuid(), 'uuid') if to_uuid else (sa.String(), 'varchar')
+    foreign_keys = _user_foreign_keys()
+    
+    # Referencing columns must change type together with users.id
+    for table, constraint, _ in foreign_keys:
+        op.drop_constraint(constraint, table, type_='foreignkey')
+    
+    for table in UUID_PRIMARY_KEYS:
+        op.alter_column(
+            table, 'id',
+            type_=target,
+            postgresql_using=f'id::{cast}',
+            server_default=sa.text('gen_random_uuid()') if to_uuid else None
+        )
+    # Through text so non-string columns (mcp_servers.user_id was integer) cast too
+    for table, _, column in foreign_keys:
+        op.alter_column(
+            table, column,
+            type_=target,
+            postgresql_using=f'{column}::text::{cast}'
+        )
+    
+    for table, constraint, column in foreign_keys:
+        op.create_foreign_key(constraint, table, 'users', [column], ['id'])
+
+
+def upgrade() -> None:
+    if not _is_postgresql():
+        return
+    
+    # gen_random_uuid() is built in from PostgreSQL 13; pgcrypto covers older servers
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+    _convert(to_uuid=True)
+
+
+def downgrade() -> None:
+    if not _is_postgresql():
+        return
+    
+    _convert(to_uuid=False)
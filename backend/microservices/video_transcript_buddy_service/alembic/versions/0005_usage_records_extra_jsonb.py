@@ -0,0 +1,67 @@
+"""Rename usage_records.metadata to extra and store it as JSON
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15 11:00:00.000000
+
+`metadata` is reserved on SQLAlchemy declarative models. On PostgreSQL the
+column becomes JSONB with a GIN index for containment queries; SQLite
+uses its JSON type.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == 'postgresql'
+
+
+def upgrade() -> None:
+    if _is_postgresql():
+        op.alter_column('usage_records', 'metadata', new_column_name='extra')
+        op.alter_column(
+            'usage_records', 'extra',
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            postgresql_using='extra::jsonb'
+        )
+        op.create_index(
+            'ix_usage_records_extra_gin',
+            'usage_records',
+            ['extra'],
+            postgresql_using='gin'
+        )
+    else:
+        with op.batch_alter_table('usage_records') as batch_op:
+            batch_op.alter_column(
+                'metadata',
+                new_column_name='extra',
+                type_=sa.JSON(),
+                existing_nullable=True
+            )
+
+
+def downgrade() -> None:
+    if _is_postgresql():
+        op.drop_index('ix_usage_records_extra_gin', table_name='usage_records')
+        op.alter_column(
+            'usage_records', 'extra',
+            type_=sa.Text(),
+            postgresql_using='extra::text'
+        )
+        op.alter_column('usage_records', 'extra', new_column_name='metadata')
+    else:
+        with op.batch_alter_table('usage_records') as batch_op:
+            batch_op.alter_column(
+                'extra',
+                new_column_name='metadata',
+                type_=sa.Text(),
+                existing_nullable=True
+            )
@@ -0,0 +1,58 @@
+"""Maintain updated_at with a BEFORE UPDATE trigger
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15 11:30:00.000000
+
+PostgreSQL only: the database stamps updated_at on every row update, so
+it stays correct even for writes that bypass the ORM. SQLite keeps
+relying on the models' onupdate.
+
+The columns are timestamp without time zone holding UTC (the models write
+datetime.utcnow()), so the trigger stamps timezone('utc', now()) rather
+than the session-local now().
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+# Tables with an updated_at column
+TABLES = ['users', 'subscriptions', 'transcripts']
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == 'postgresql'
+
+
+def upgrade() -> None:
+    if not _is_postgresql():
+        return
+    
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = timezone('utc', now());
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    if not _is_postgresql():
+        return
+    
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
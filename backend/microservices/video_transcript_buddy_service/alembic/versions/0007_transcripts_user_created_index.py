@@ -0,0 +1,50 @@
+"""Index transcripts by (user_id, created_at DESC) for recency listings
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15 12:00:00.000000
+
+list_transcripts filters on user_id and orders by created_at DESC; the
+composite index serves both without a sort. On PostgreSQL the indexes are
+built and dropped CONCURRENTLY so the table stays writable meanwhile.
+"""
+from contextlib import nullcontext
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == 'postgresql'
+
+
+def _non_blocking():
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    if _is_postgresql():
+        return op.get_context().autocommit_block()
+    return nullcontext()
+
+
+def upgrade() -> None:
+    with _non_blocking():
+        op.create_index(
+            'ix_transcripts_user_created',
+            'transcripts',
+            ['user_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True
+        )
+        # user_id alone is a prefix of the composite
+        op.drop_index('ix_transcripts_user_id', table_name='transcripts', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with _non_blocking():
+        op.create_index('ix_transcripts_user_id', 'transcripts', ['user_id'], postgresql_concurrently=True)
+        op.drop_index('ix_transcripts_user_created', table_name='transcripts', postgresql_concurrently=True)
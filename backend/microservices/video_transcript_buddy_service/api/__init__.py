@@ -1,12 +1,36 @@
 """API module - REST endpoints, models, and dependencies."""
 
-from .routes import health_routes, transcript_routes, query_routes, auth_routes, usage_routes
-from .dependencies import (
-    get_current_user,
-    check_upload_limit,
-    check_query_limit,
-    check_file_size_limit,
-)
+import importlib
+
+# Attributes are imported on first access (PEP 562), so importing a single
+# submodule such as api.dependencies doesn't pull in every route module.
+_LAZY_ATTRS = {
+    "health_routes": (".routes.health_routes", None),
+    "transcript_routes": (".routes.transcript_routes", None),
+    "query_routes": (".routes.query_routes", None),
+    "auth_routes": (".routes.auth_routes", None),
+    "usage_routes": (".routes.usage_routes", None),
+    "conversation_routes": (".routes.conversation_routes", None),
+    "admin_routes": (".routes.admin_routes", None),
+    "llm_routes": (".routes.llm_routes", None),
+    "ollama_model_routes": (".routes.ollama_model_routes", None),
+    "get_current_user": (".dependencies", "get_current_user"),
+    "check_upload_limit": (".dependencies", "check_upload_limit"),
+    "check_query_limit": (".dependencies", "check_query_limit"),
+    "check_file_size_limit": (".dependencies", "check_file_size_limit"),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __name__)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "health_routes",
@@ -14,8 +38,12 @@ __all__ = [
     "query_routes",
     "auth_routes",
     "usage_routes",
+    "conversation_routes",
+    "admin_routes",
+    "llm_routes",
+    "ollama_model_routes",
     "get_current_user",
     "check_upload_limit",
     "check_query_limit",
     "check_file_size_limit",
-]
\ No newline at end of file
+]
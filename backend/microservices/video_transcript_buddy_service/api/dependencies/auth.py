@@ -2,7 +2,9 @@
 Auth Dependencies - FastAPI dependencies for authentication and authorization.
 """
 
-from fastapi import Depends, HTTPException, status, Header
+from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 from typing import Optional
 
@@ -10,28 +12,50 @@ from config.database import get_db
 from services.auth_service import AuthService
 from services.usage_service import UsageService
 from models.user import User
-from models.subscription import get_tier_limits
-from common.exceptions import AuthenticationException
+from models.subscription import get_tier_limits, TIERS, TIER_MAX_BYTES
+from common.exceptions import AuthenticationException, TierLimitExceededException
+
+
+# Static parts of the 403/413 error payloads, built once at import
+UPLOAD_LIMIT_DETAIL_TEMPLATE = {"error": True, "error_code": "UPLOAD_LIMIT_REACHED"}
+QUERY_LIMIT_DETAIL_TEMPLATE = {"error": True, "error_code": "QUERY_LIMIT_REACHED"}
+FILE_TOO_LARGE_DETAILS = {
+    tier.value: {
+        "error": True,
+        "error_code": "FILE_TOO_LARGE",
+        "message": f"File exceeds {limits.max_file_size_mb}MB limit for {tier.value} tier",
+        "max_size_mb": limits.max_file_size_mb
+    }
+    for tier, limits in TIERS.items()
+}
+
+auth_service = AuthService()
+
+# Parses "Authorization: Bearer <token>"; auto_error=False so we keep our own 401
+bearer_scheme = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(
-    authorization: Optional[str] = Header(None),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
     db: Session = Depends(get_db)
 ) -> User:
     """
     Get current authenticated user from token.
+    
+    The user is built from token claims and is detached: only id, email,
+    tier and is_active are set (see AuthService.get_current_user).
     """
-    if not authorization or not authorization.startswith("Bearer "):
+    if credentials is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Missing or invalid authorization header"
         )
     
-    token = authorization.replace("Bearer ", "")
+    token = credentials.credentials
     
     try:
-        auth_service = AuthService(db)
-        return auth_service.get_current_user(token)
+        # Sync DB lookup; keep it off the event loop
+        return await run_in_threadpool(auth_service.get_current_user, db, token)
     except AuthenticationException as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -47,18 +71,18 @@ async def check_upload_limit(
     Check if user can upload (within tier limit).
     """
     usage_service = UsageService(db)
-    result = usage_service.check_limit(current_user.id, "UPLOAD")
+    result = await run_in_threadpool(
+        usage_service.check_limit, current_user.id, "UPLOAD", tier=current_user.tier
+    )
     
     if not result["allowed"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail={
-                "error": True,
-                "error_code": "UPLOAD_LIMIT_REACHED",
-                "message": result["reason"],
-                "limit": result["limit"],
-                "current": result["current"]
-            }
+        raise TierLimitExceededException(
+            dict(
+                UPLOAD_LIMIT_DETAIL_TEMPLATE,
+                message=result["reason"],
+                limit=result["limit"],
+                current=result["current"]
+            )
         )
     
     return current_user
@@ -72,18 +96,18 @@ async def check_query_limit(
     Check if user can query (within tier limit).
     """
     usage_service = UsageService(db)
-    result = usage_service.check_limit(current_user.id, "QUERY")
+    result = await run_in_threadpool(
+        usage_service.check_limit, current_user.id, "QUERY", tier=current_user.tier
+    )
     
     if not result["allowed"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail={
-                "error": True,
-                "error_code": "QUERY_LIMIT_REACHED",
-                "message": result["reason"],
-                "limit": result["limit"],
-                "current": result["current"]
-            }
+        raise TierLimitExceededException(
+            dict(
+                QUERY_LIMIT_DETAIL_TEMPLATE,
+                message=result["reason"],
+                limit=result["limit"],
+                current=result["current"]
+            )
         )
     
     return current_user
@@ -96,16 +120,18 @@ async def check_file_size_limit(
     """
     Check if file size is within tier limit.
     """
-    tier_limits = get_tier_limits(current_user.tier)
-    max_bytes = tier_limits.max_file_size_bytes
+    max_bytes = TIER_MAX_BYTES.get(current_user.tier)
+    if max_bytes is None:
+        max_bytes = get_tier_limits(current_user.tier).max_file_size_bytes
     
     if file_size > max_bytes:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail={
+        detail = FILE_TOO_LARGE_DETAILS.get(current_user.tier)
+        if detail is None:
+            tier_limits = get_tier_limits(current_user.tier)
+            detail = {
                 "error": True,
                 "error_code": "FILE_TOO_LARGE",
                 "message": f"File exceeds {tier_limits.max_file_size_mb}MB limit for {current_user.tier} tier",
                 "max_size_mb": tier_limits.max_file_size_mb
             }
-        )
\ No newline at end of file
+        raise TierLimitExceededException(detail, status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
\ No newline at end of file
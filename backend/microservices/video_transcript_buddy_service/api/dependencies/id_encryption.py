@@ -2,7 +2,7 @@
 ID Encryption Dependency - FastAPI dependency for automatic ID encryption/decryption.
 """
 
-from fastapi import Depends, HTTPException, status, Query
+from fastapi import Depends, HTTPException, Path, Request, status, Query
 from sqlalchemy.orm import Session
 from typing import Optional
 
@@ -13,42 +13,47 @@ from utils.id_encryption import UserIDEncryptor, decrypt_id, _key_cache
 
 
 def get_id_encryptor(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ) -> UserIDEncryptor:
     """
     Get an ID encryptor for the current user.
     Use this to encrypt IDs in responses.
+    
+    The encryptor is kept on request.state, so every dependency and route
+    in a request shares one instance and its resolved key.
     """
-    return UserIDEncryptor(db, current_user.id)
+    encryptor = getattr(request.state, "id_encryptor", None)
+    if encryptor is None or encryptor.user_id != current_user.id:
+        encryptor = UserIDEncryptor(db, current_user.id)
+        request.state.id_encryptor = encryptor
+    return encryptor
 
 
 def decrypt_conversation_id(
     conversation_id: str = Query(..., description="Encrypted conversation ID"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    encryptor: UserIDEncryptor = Depends(get_id_encryptor)
 ) -> int:
     """
     Decrypt a conversation ID from query parameter.
     Use as a dependency to automatically decrypt and validate.
     """
-    encryptor = UserIDEncryptor(db, current_user.id)
     try:
         decrypted = encryptor.decrypt(conversation_id)
-        if not isinstance(decrypted, int):
-            raise ValueError("Invalid conversation ID format")
-        return decrypted
-    except Exception as e:
+    except ValueError:
+        decrypted = None
+    if not isinstance(decrypted, int):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid or expired conversation ID"
         )
+    return decrypted
 
 
 def decrypt_optional_conversation_id(
     conversation_id: Optional[str] = Query(None, description="Encrypted conversation ID"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    encryptor: UserIDEncryptor = Depends(get_id_encryptor)
 ) -> Optional[int]:
     """
     Decrypt an optional conversation ID from query parameter.
@@ -57,55 +62,49 @@ def decrypt_optional_conversation_id(
     if conversation_id is None:
         return None
     
-    encryptor = UserIDEncryptor(db, current_user.id)
     try:
         decrypted = encryptor.decrypt(conversation_id)
-        if not isinstance(decrypted, int):
-            raise ValueError("Invalid conversation ID format")
-        return decrypted
-    except Exception as e:
+    except ValueError:
+        decrypted = None
+    if not isinstance(decrypted, int):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid or expired conversation ID"
         )
+    return decrypted
 
 
-class EncryptedIDPath:
+def encrypted_id_path(param_name: str, id_type: type = int):
     """
-    Dependency class for path parameters that are encrypted IDs.
+    Build a dependency that decrypts an encrypted ID path parameter.
+    
+    Args:
+        param_name: Name of the path parameter holding the encrypted ID
+        id_type: Expected type of the decrypted ID; use str for UUID keys
     
     Usage:
         @router.get("/conversations/{conversation_id}")
         async def get_conversation(
-            conversation_id: int = Depends(EncryptedIDPath("conversation_id"))
+            conversation_id: str = Depends(encrypted_id_path("conversation_id", str))
         ):
-            # conversation_id is now the decrypted integer
+            # conversation_id is now the decrypted ID
     """
     
-    def __init__(self, param_name: str):
-        self.param_name = param_name
-    
-    async def __call__(
-        self,
-        current_user: User = Depends(get_current_user),
-        db: Session = Depends(get_db),
-        **kwargs
-    ) -> int:
-        encrypted_id = kwargs.get(self.param_name)
-        if not encrypted_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Missing {self.param_name}"
-            )
-        
-        encryptor = UserIDEncryptor(db, current_user.id)
+    def _decrypt_path_id(
+        encrypted_id: str = Path(..., alias=param_name),
+        encryptor: UserIDEncryptor = Depends(get_id_encryptor)
+    ):
         try:
             decrypted = encryptor.decrypt(encrypted_id)
-            if not isinstance(decrypted, int):
-                raise ValueError("Invalid ID format")
-            return decrypted
-        except Exception:
+        except ValueError:
+            decrypted = None
+        if id_type is str and decrypted is not None:
+            decrypted = str(decrypted)
+        if not isinstance(decrypted, id_type):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid or expired {self.param_name}"
+                detail=f"Invalid or expired {param_name}"
             )
+        return decrypted
+    
+    return _decrypt_path_id
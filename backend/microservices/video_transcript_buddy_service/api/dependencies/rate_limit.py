@@ -0,0 +1,66 @@
+"""
+Rate Limit Dependencies - Throttle auth endpoints before any bcrypt work runs.
+"""
+
+import hashlib
+
+from fastapi import HTTPException, Request, status
+
+from config.settings import settings
+from utils.rate_limiter import FixedWindowRateLimiter
+
+
+_auth_ip_limiter = FixedWindowRateLimiter(limit=settings.AUTH_RATE_LIMIT_PER_IP)
+_login_email_limiter = FixedWindowRateLimiter(limit=settings.AUTH_RATE_LIMIT_PER_EMAIL)
+
+
+def _raise_rate_limited(retry_after: int) -> None:
+    raise HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail={
+            "error": True,
+            "error_code": "RATE_LIMITED",
+            "message": "Too many attempts, please try again later",
+            "retry_after": retry_after
+        },
+        headers={"Retry-After": str(retry_after)}
+    )
+
+
+def limit_auth_by_ip(request: Request) -> None:
+    """
+    Throttle auth requests per client IP and endpoint.
+    
+    The IP is request.client, i.e. the direct peer unless uvicorn runs with
+    --proxy-headers and the reverse proxy's address is in
+    --forwarded-allow-ips (settings.FORWARDED_ALLOW_IPS); then uvicorn
+    substitutes the client address from X-Forwarded-For. Without that, every
+    client behind the proxy shares the proxy's bucket.
+    """
+    client_ip = request.client.host if request.client else "unknown"
+    allowed, retry_after = _auth_ip_limiter.hit(f"{request.url.path}:{client_ip}")
+    if not allowed:
+        _raise_rate_limited(retry_after)
+
+
+def _email_key(email: str) -> str:
+    # Hash so raw addresses aren't kept in memory
+    return hashlib.sha256(email.lower().encode('utf-8')).hexdigest()
+
+
+def limit_login_by_email(email: str) -> None:
+    """
+    Reject logins to an account with too many recent failed attempts,
+    whatever IP they come from.
+    
+    Only failures count (see record_failed_login), so successful logins
+    can't be used to lock an account out.
+    """
+    allowed, retry_after = _login_email_limiter.check(_email_key(email))
+    if not allowed:
+        _raise_rate_limited(retry_after)
+
+
+def record_failed_login(email: str) -> None:
+    """Count a failed login attempt against the target account."""
+    _login_email_limiter.hit(_email_key(email))
@@ -2,7 +2,7 @@
 Auth Request Models - Pydantic models for auth API requests.
 """
 
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 
 
 class RegisterRequest(BaseModel):
@@ -29,21 +29,25 @@ class RegisterRequest(BaseModel):
         examples=["John Doe"]
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "user@example.com",
                 "password": "securepassword123",
                 "full_name": "John Doe"
             }
         }
+    )
 
 
 class LoginRequest(BaseModel):
     """Request model for user login."""
     
-    email: EmailStr = Field(
+    # Plain pattern check: the user lookup is the real validation on login
+    email: str = Field(
         ...,
+        max_length=254,
+        pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$",
         description="Registered email address",
         examples=["user@example.com"]
     )
@@ -54,13 +58,14 @@ class LoginRequest(BaseModel):
         examples=["securepassword123"]
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "user@example.com",
                 "password": "securepassword123"
             }
         }
+    )
 
 
 class RefreshTokenRequest(BaseModel):
@@ -2,8 +2,33 @@
 Auth Response Models - Pydantic models for auth API responses.
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional
+
+
+class AuthUserData(BaseModel):
+    """User info returned with auth tokens."""
+    
+    id: str = Field(..., description="User ID")
+    email: str = Field(..., description="User email")
+    full_name: Optional[str] = Field(None, description="Full name")
+    tier: str = Field(..., description="Subscription tier")
+
+
+class AuthData(BaseModel):
+    """Tokens and user info from register/login."""
+    
+    access_token: str = Field(..., description="JWT access token")
+    refresh_token: str = Field(..., description="JWT refresh token")
+    token_type: str = Field(default="bearer", description="Token type")
+    user: AuthUserData = Field(..., description="Authenticated user")
+
+
+class TokenData(BaseModel):
+    """New access token from a refresh."""
+    
+    access_token: str = Field(..., description="JWT access token")
+    token_type: str = Field(default="bearer", description="Token type")
 
 
 class AuthResponse(BaseModel):
@@ -11,13 +36,13 @@ class AuthResponse(BaseModel):
     
     success: bool = Field(..., description="Whether the request was successful")
     message: str = Field(..., description="Human-readable message")
-    data: Optional[Dict[str, Any]] = Field(
+    data: Optional[AuthData] = Field(
         default=None,
         description="Auth data with tokens and user info"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "message": "Login successful",
@@ -34,6 +59,7 @@ class AuthResponse(BaseModel):
                 }
             }
         }
+    )
 
 
 class TokenResponse(BaseModel):
@@ -41,13 +67,13 @@ class TokenResponse(BaseModel):
     
     success: bool = Field(..., description="Whether the request was successful")
     message: str = Field(..., description="Human-readable message")
-    data: Optional[Dict[str, str]] = Field(
+    data: Optional[TokenData] = Field(
         default=None,
         description="New access token"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "message": "Token refreshed",
@@ -57,6 +83,7 @@ class TokenResponse(BaseModel):
                 }
             }
         }
+    )
 
 
 class UserResponse(BaseModel):
@@ -64,7 +91,7 @@ class UserResponse(BaseModel):
     
     success: bool = Field(..., description="Whether the request was successful")
     message: str = Field(..., description="Human-readable message")
-    data: Optional[Dict[str, Any]] = Field(
+    data: Optional[AuthUserData] = Field(
         default=None,
         description="User information"
     )
\ No newline at end of file
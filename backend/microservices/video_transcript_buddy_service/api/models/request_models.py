@@ -2,7 +2,7 @@
 Request Models - Pydantic models for API request validation.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 
 # Import auth models
@@ -51,8 +51,8 @@ class QueryRequest(BaseModel):
         description="Temperature for LLM responses (0-1)"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "question": "What are the main topics discussed in the video?",
                 "transcript_ids": None,
@@ -62,6 +62,7 @@ class QueryRequest(BaseModel):
                 "llm_temperature": 0.7
             }
         }
+    )
 
 
 class SearchRequest(BaseModel):
@@ -88,14 +89,15 @@ class SearchRequest(BaseModel):
         description="Maximum number of results to return"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "query": "machine learning algorithms",
                 "transcript_ids": None,
                 "max_results": 5
             }
         }
+    )
 
 
 class ReindexRequest(BaseModel):
@@ -115,13 +117,14 @@ class ReindexRequest(BaseModel):
         description="Overlap between chunks (default: 200)"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "chunk_size": 1000,
                 "chunk_overlap": 200
             }
         }
+    )
 
 
 class TranscriptUploadRequest(BaseModel):
@@ -138,13 +141,14 @@ class TranscriptUploadRequest(BaseModel):
         examples=[["tutorial", "python", "beginner"]]
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "auto_index": True,
                 "tags": ["tutorial", "python"]
             }
         }
+    )
 
 
 # Export all
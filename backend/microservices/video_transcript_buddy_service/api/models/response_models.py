@@ -6,7 +6,7 @@ from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 
 # Import auth models
-from .auth_response_models import AuthResponse, TokenResponse, UserResponse
+from .auth_response_models import AuthUserData, AuthData, TokenData, AuthResponse, TokenResponse, UserResponse
 
 
 class BaseResponse(BaseModel):
@@ -184,6 +184,9 @@ __all__ = [
     "ErrorDetail",
     "HealthCheckResponse",
     "VectorStoreStatsResponse",
+    "AuthUserData",
+    "AuthData",
+    "TokenData",
     "AuthResponse",
     "TokenResponse",
     "UserResponse",
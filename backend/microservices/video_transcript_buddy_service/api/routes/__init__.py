@@ -7,6 +7,8 @@ from .query_routes import router as query_router
 from .auth_routes import router as auth_router
 from .usage_routes import router as usage_router
 from .admin_routes import router as admin_router
+from .llm_routes import router as llm_router
+from .ollama_model_routes import router as ollama_model_router
 
 __all__ = [
     "health_router",
@@ -16,4 +18,6 @@ __all__ = [
     "auth_router",
     "usage_router",
     "admin_router",
+    "llm_router",
+    "ollama_model_router",
 ]
\ No newline at end of file
@@ -3,46 +3,93 @@ Admin Routes - Administrative operations for system management.
 """
 
 import logging
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+import threading
+import uuid
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status, Depends, Query
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from typing import Optional
-from pydantic import BaseModel
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
-from config.database import get_db
+from config.database import get_db, get_db_context
 from api.dependencies.auth import get_current_user
 from models.user import User
-from utils.id_encryption import rotate_user_key, invalidate_user_key_cache
+from models.subscription import TierRank, TIER_RANKS
+from utils.id_encryption import rotate_user_key, rotate_all_user_keys as rotate_all_keys, invalidate_user_key_cache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Status of rotate-all-keys jobs, by job id. Held in this worker's memory only,
+# so with several workers the status must be polled on the worker that started
+# the job, and it is lost on restart.
+_rotation_jobs: Dict[str, Dict[str, Any]] = {}
+_rotation_jobs_lock = threading.Lock()
+
+# Finished jobs are kept this long, and at most this many jobs are kept overall
+ROTATION_JOB_RETENTION_SECONDS = 3600
+ROTATION_JOBS_MAX = 50
+
 
 class KeyRotationResponse(BaseModel):
     """Response for key rotation."""
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+    
     success: bool
     message: str
     user_id: str
     rotated_at: datetime
 
 
+class KeyRotationJobResponse(BaseModel):
+    """Status of a background rotate-all-keys job."""
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+    
+    job_id: str
+    status: str
+    processed: int
+    total: int
+    started_by: str
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+
 class UserKeyStatusResponse(BaseModel):
     """Response for user key status."""
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+    
     user_id: str
     email: str
     has_encryption_key: bool
     key_rotated_at: Optional[datetime]
 
 
-def require_admin(current_user: User = Depends(get_current_user)) -> User:
-    """Dependency to ensure user is admin (ENTERPRISE tier for now)."""
-    if current_user.tier != "ENTERPRISE":
+def require_admin(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    Dependency to ensure user is admin (ENTERPRISE tier for now).
+    
+    get_current_user trusts the token's claims, so the admin check reloads
+    the user row: a deactivated or downgraded admin loses access immediately
+    rather than when their token expires.
+    """
+    user = db.get(User, current_user.id)
+    if not user or not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found or inactive"
+        )
+    if TIER_RANKS.get(user.tier, TierRank.FREE) < TierRank.ENTERPRISE:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
         )
-    return current_user
+    return user
 
 
 @router.post(
@@ -51,8 +98,8 @@ def require_admin(current_user: User = Depends(get_current_user)) -> User:
     summary="Rotate user's encryption key",
     description="Regenerate a user's ID encryption key. User will need to re-login."
 )
-async def rotate_user_encryption_key(
-    user_id: str,
+def rotate_user_encryption_key(
+    user_id: uuid.UUID,
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db)
 ) -> KeyRotationResponse:
@@ -68,30 +115,11 @@ async def rotate_user_encryption_key(
     - User-requested key regeneration
     """
     try:
-        # Verify target user exists
-        target_user = db.query(User).filter(User.id == user_id).first()
-        if not target_user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User {user_id} not found"
-            )
-        
-        # Rotate the key
-        rotate_user_key(db, user_id)
-        
-        logger.info(f"Admin {current_user.email} rotated encryption key for user {user_id}")
-        
-        return KeyRotationResponse(
-            success=True,
-            message=f"Encryption key rotated for user {target_user.email}. User must re-login.",
-            user_id=user_id,
-            rotated_at=datetime.utcnow()
-        )
-        
-    except ValueError as e:
+        email = rotate_user_key(db, str(user_id))
+    except ValueError:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User {user_id} not found"
         )
     except Exception as e:
         logger.error(f"Key rotation failed: {e}")
@@ -99,6 +127,15 @@ async def rotate_user_encryption_key(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to rotate encryption key"
         )
+    
+    logger.info(f"Admin {current_user.email} rotated encryption key for user {user_id}")
+    
+    return KeyRotationResponse(
+        success=True,
+        message=f"Encryption key rotated for user {email}. User must re-login.",
+        user_id=str(user_id),
+        rotated_at=datetime.utcnow()
+    )
 
 
 @router.get(
@@ -107,13 +144,13 @@ async def rotate_user_encryption_key(
     summary="Get user's encryption key status",
     description="Check if user has an encryption key and when it was last rotated"
 )
-async def get_user_key_status(
-    user_id: str,
+def get_user_key_status(
+    user_id: uuid.UUID,
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db)
 ) -> UserKeyStatusResponse:
     """Get encryption key status for a user."""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, str(user_id))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -128,16 +165,67 @@ async def get_user_key_status(
     )
 
 
+def _update_rotation_job(job_id: str, **fields) -> None:
+    with _rotation_jobs_lock:
+        _rotation_jobs[job_id].update(fields)
+
+
+def _prune_rotation_jobs() -> None:
+    """Drop expired finished jobs, then the oldest finished ones over the cap (lock must be held)."""
+    now = datetime.utcnow()
+    finished = [
+        job_id for job_id, job in _rotation_jobs.items()
+        if job.get("finished_at") is not None
+    ]
+    for job_id in finished:
+        age = (now - _rotation_jobs[job_id]["finished_at"]).total_seconds()
+        if age > ROTATION_JOB_RETENTION_SECONDS:
+            del _rotation_jobs[job_id]
+    
+    # Insertion order is start order, so this drops the oldest first
+    for job_id in [j for j in finished if j in _rotation_jobs]:
+        if len(_rotation_jobs) <= ROTATION_JOBS_MAX:
+            break
+        del _rotation_jobs[job_id]
+
+
+def _run_rotate_all_keys(job_id: str, admin_email: str) -> None:
+    """Rotate every user's key with its own DB session, recording progress on the job."""
+    _update_rotation_job(job_id, status="running")
+    try:
+        with get_db_context() as db:
+            rotated_count = rotate_all_keys(
+                db,
+                on_batch=lambda processed: _update_rotation_job(job_id, processed=processed)
+            )
+    except Exception as e:
+        logger.error(f"Rotate-all-keys job {job_id} failed: {e}")
+        _update_rotation_job(job_id, status="failed", error=str(e), finished_at=datetime.utcnow())
+        return
+    
+    _update_rotation_job(
+        job_id, status="completed", processed=rotated_count, finished_at=datetime.utcnow()
+    )
+    logger.warning(f"Admin {admin_email} rotated ALL user encryption keys ({rotated_count} users)")
+
+
 @router.post(
     "/users/rotate-all-keys",
+    response_model=KeyRotationJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Rotate encryption keys for all users",
-    description="Emergency operation: Rotate keys for all users. All users must re-login."
+    description=(
+        "Emergency operation: Rotate keys for all users in the background. All users must re-login. "
+        "Job status is kept in the memory of the worker that accepted the request, for up to "
+        f"{ROTATION_JOB_RETENTION_SECONDS} seconds after the job finishes."
+    )
 )
-async def rotate_all_user_keys(
+def rotate_all_user_keys(
+    background_tasks: BackgroundTasks,
     confirm: bool = Query(False, description="Must be true to confirm this destructive operation"),
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db)
-):
+) -> KeyRotationJobResponse:
     """
     Rotate encryption keys for ALL users.
     
@@ -146,6 +234,10 @@ async def rotate_all_user_keys(
     - Require all users to log out and log back in
     
     Only use in emergency situations (e.g., suspected system-wide breach).
+    The rotation runs after the response is sent; poll
+    /users/rotate-all-keys/status/{job_id} for progress. Job status lives
+    in this worker's memory only, so behind several workers the status
+    call can miss it, and it does not survive a restart.
     """
     if not confirm:
         raise HTTPException(
@@ -153,24 +245,49 @@ async def rotate_all_user_keys(
             detail="Must set confirm=true to execute this operation"
         )
     
-    users = db.query(User).all()
-    rotated_count = 0
+    job = {
+        "job_id": str(uuid.uuid4()),
+        "status": "pending",
+        "processed": 0,
+        "total": db.execute(select(func.count(User.id))).scalar_one(),
+        "started_by": current_user.email,
+        "started_at": datetime.utcnow()
+    }
+    with _rotation_jobs_lock:
+        _prune_rotation_jobs()
+        _rotation_jobs[job["job_id"]] = job
+    
+    background_tasks.add_task(_run_rotate_all_keys, job["job_id"], current_user.email)
     
-    for user in users:
-        try:
-            rotate_user_key(db, user.id)
-            rotated_count += 1
-        except Exception as e:
-            logger.error(f"Failed to rotate key for user {user.id}: {e}")
+    return KeyRotationJobResponse(**job)
+
+
+@router.get(
+    "/users/rotate-all-keys/status/{job_id}",
+    response_model=KeyRotationJobResponse,
+    summary="Get rotate-all-keys job status",
+    description=(
+        "Check progress of a background rotate-all-keys job. Only jobs started on this worker "
+        "are known; finished jobs are forgotten after the retention period."
+    )
+)
+def get_rotate_all_keys_status(
+    job_id: str,
+    current_user: User = Depends(require_admin)
+) -> KeyRotationJobResponse:
+    """Get status of a rotate-all-keys job started on this worker."""
+    with _rotation_jobs_lock:
+        _prune_rotation_jobs()
+        job = _rotation_jobs.get(job_id)
+        job = dict(job) if job else None
     
-    logger.warning(f"Admin {current_user.email} rotated ALL user encryption keys ({rotated_count} users)")
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found"
+        )
     
-    return {
-        "success": True,
-        "message": f"Rotated encryption keys for {rotated_count} users",
-        "total_users": len(users),
-        "rotated_count": rotated_count
-    }
+    return KeyRotationJobResponse(**job)
 
 
 @router.post(
@@ -179,7 +296,7 @@ async def rotate_all_user_keys(
     summary="Rotate own encryption key",
     description="User can rotate their own encryption key. Requires re-login."
 )
-async def rotate_own_encryption_key(
+def rotate_own_encryption_key(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ) -> KeyRotationResponse:
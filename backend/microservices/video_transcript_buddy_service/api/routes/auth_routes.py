@@ -7,21 +7,24 @@ from sqlalchemy.orm import Session
 
 from config.database import get_db
 from services.auth_service import AuthService
+from api.dependencies.rate_limit import limit_auth_by_ip, limit_login_by_email, record_failed_login
 from api.models.request_models import RegisterRequest, LoginRequest, RefreshTokenRequest
 from api.models.response_models import AuthResponse, TokenResponse
 from common.exceptions import ValidationException, AuthenticationException
 
 router = APIRouter()
+auth_service = AuthService()
 
 
 @router.post(
     "/register",
     response_model=AuthResponse,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(limit_auth_by_ip)],
     summary="Register new user",
     description="Create a new user account with FREE tier"
 )
-async def register(request: RegisterRequest, db: Session = Depends(get_db)):
+def register(request: RegisterRequest, db: Session = Depends(get_db)):
     """
     Register a new user.
     
@@ -30,15 +33,15 @@ async def register(request: RegisterRequest, db: Session = Depends(get_db)):
     - **full_name**: Optional full name
     """
     try:
-        auth_service = AuthService(db)
         user = auth_service.register(
+            db=db,
             email=request.email,
             password=request.password,
             full_name=request.full_name
         )
         
-        # Auto login after registration
-        tokens = auth_service.login(request.email, request.password)
+        # Auto login after registration; the user was just created, so skip the password re-check
+        tokens = auth_service.issue_tokens(user)
         
         return AuthResponse(
             success=True,
@@ -56,19 +59,22 @@ async def register(request: RegisterRequest, db: Session = Depends(get_db)):
 @router.post(
     "/login",
     response_model=AuthResponse,
+    dependencies=[Depends(limit_auth_by_ip)],
     summary="User login",
     description="Authenticate and get access tokens"
 )
-async def login(request: LoginRequest, db: Session = Depends(get_db)):
+def login(request: LoginRequest, db: Session = Depends(get_db)):
     """
     Login with email and password.
     
     - **email**: Registered email
     - **password**: Account password
     """
+    limit_login_by_email(request.email)
+    
     try:
-        auth_service = AuthService(db)
         tokens = auth_service.login(
+            db=db,
             email=request.email,
             password=request.password
         )
@@ -80,6 +86,7 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
         )
     
     except AuthenticationException as e:
+        record_failed_login(request.email)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=e.to_dict()
@@ -92,15 +99,14 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
     summary="Refresh access token",
     description="Get new access token using refresh token"
 )
-async def refresh_token(request: RefreshTokenRequest, db: Session = Depends(get_db)):
+def refresh_token(request: RefreshTokenRequest, db: Session = Depends(get_db)):
     """
     Refresh access token.
     
     - **refresh_token**: Valid refresh token
     """
     try:
-        auth_service = AuthService(db)
-        tokens = auth_service.refresh_tokens(request.refresh_token)
+        tokens = auth_service.refresh_tokens(db, request.refresh_token)
         
         return TokenResponse(
             success=True,
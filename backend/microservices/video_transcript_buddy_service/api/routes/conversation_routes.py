@@ -3,9 +3,11 @@ Conversation Routes - REST endpoints for conversation management.
 With per-user ID encryption for secure API communication.
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends
+import time
+from fastapi import APIRouter, HTTPException, Request, Response, status, Depends
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from sqlalchemy.orm import Session
 
 from config.database import get_db
@@ -13,6 +15,7 @@ from services.conversation_service import ConversationService
 from api.dependencies.auth import get_current_user
 from api.dependencies.id_encryption import get_id_encryptor
 from utils.id_encryption import UserIDEncryptor
+from utils.http_cache import make_etag, etag_matches
 from models.user import User
 from common.exceptions import ValidationException
 
@@ -23,6 +26,19 @@ conversation_service = ConversationService()
 # ID fields to encrypt in responses
 ENCRYPTED_ID_FIELDS = ['id', 'user_id']
 
+# Clients may reuse conversation reads briefly, then revalidate with If-None-Match
+CONVERSATION_CACHE_CONTROL = "private, max-age=5"
+
+
+def _conversation_etag(user_id: str, *version) -> str:
+    """
+    ETag for a conversation read.
+    
+    Includes the current UTC day so cached bodies (and the encrypted IDs
+    in them, which expire) are refreshed at least daily.
+    """
+    return make_etag(user_id, int(time.time() // 86400), *version)
+
 
 def encrypt_conversation_response(data: dict, encryptor: UserIDEncryptor) -> dict:
     """Encrypt ID fields in conversation response."""
@@ -31,7 +47,7 @@ def encrypt_conversation_response(data: dict, encryptor: UserIDEncryptor) -> dic
 
 def encrypt_conversation_list(data_list: list, encryptor: UserIDEncryptor) -> list:
     """Encrypt ID fields in list of conversations."""
-    return [encrypt_conversation_response(item, encryptor) for item in data_list]
+    return encryptor.encrypt_dicts(data_list, ENCRYPTED_ID_FIELDS)
 
 
 # Request/Response Models
@@ -56,6 +72,8 @@ class UpdateConversationRequest(BaseModel):
 
 
 class ConversationResponse(BaseModel):
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+    
     id: str
     name: str
     user_id: str
@@ -74,13 +92,18 @@ class ConversationResponse(BaseModel):
     last_activity_at: str
 
 
+# Built once; list responses are validated here and sent straight to orjson,
+# skipping FastAPI's per-request response_model pass and jsonable_encoder
+_conversation_list_adapter = TypeAdapter(List[ConversationResponse])
+
+
 @router.post(
     "/",
     response_model=ConversationResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new conversation"
 )
-async def create_conversation(
+def create_conversation(
     request: CreateConversationRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -118,19 +141,34 @@ async def create_conversation(
 @router.get(
     "/",
     response_model=List[ConversationResponse],
+    response_class=ORJSONResponse,
     summary="List all conversations"
 )
-async def list_conversations(
+def list_conversations(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     encryptor: UserIDEncryptor = Depends(get_id_encryptor)
 ):
     """List all conversations for the current user."""
+    etag = _conversation_etag(
+        current_user.id, *conversation_service.get_list_version(db, current_user.id)
+    )
+    cache_headers = {"ETag": etag, "Cache-Control": CONVERSATION_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+    
     conversations = conversation_service.list_conversations(
         db=db,
         user_id=current_user.id
     )
-    return encrypt_conversation_list(conversations, encryptor)
+    encrypted = encrypt_conversation_list(conversations, encryptor)
+    return ORJSONResponse(
+        _conversation_list_adapter.dump_python(
+            _conversation_list_adapter.validate_python(encrypted), mode="json"
+        ),
+        headers=cache_headers
+    )
 
 
 @router.get(
@@ -138,8 +176,10 @@ async def list_conversations(
     response_model=ConversationResponse,
     summary="Get conversation details"
 )
-async def get_conversation(
+def get_conversation(
     conversation_id: str,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     encryptor: UserIDEncryptor = Depends(get_id_encryptor)
@@ -149,6 +189,14 @@ async def get_conversation(
         # Decrypt the conversation ID from request
         decrypted_id = encryptor.decrypt(conversation_id)
         
+        version = conversation_service.get_conversation_version(db, decrypted_id, current_user.id)
+        if version is not None:
+            etag = _conversation_etag(current_user.id, decrypted_id, *version)
+            cache_headers = {"ETag": etag, "Cache-Control": CONVERSATION_CACHE_CONTROL}
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+            response.headers.update(cache_headers)
+        
         conversation = conversation_service.get_conversation(
             db=db,
             conversation_id=decrypted_id,
@@ -172,7 +220,7 @@ async def get_conversation(
     response_model=ConversationResponse,
     summary="Update conversation"
 )
-async def update_conversation(
+def update_conversation(
     conversation_id: str,
     request: UpdateConversationRequest,
     current_user: User = Depends(get_current_user),
@@ -213,7 +261,7 @@ async def update_conversation(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete conversation"
 )
-async def delete_conversation(
+def delete_conversation(
     conversation_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -245,7 +293,7 @@ async def delete_conversation(
     "/validate-downgrade",
     summary="Validate subscription downgrade"
 )
-async def validate_downgrade(
+def validate_downgrade(
     new_tier: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -2,9 +2,12 @@
 Health Routes - Health check endpoints for the service.
 """
 
+import asyncio
+import threading
+import time
 from fastapi import APIRouter, status
-from typing import Dict, Any
-from datetime import datetime
+from typing import Dict, Any, Optional
+from datetime import datetime, timezone
 
 from config import settings
 from utils.aws_utils import validate_aws_credentials, check_s3_bucket_exists
@@ -12,6 +15,59 @@ from dao.vector_store_dao import VectorStoreDAO
 
 router = APIRouter()
 
+# Readiness results are reused briefly so probe bursts don't hit AWS each time
+READINESS_CACHE_TTL_SECONDS = 5.0
+_readiness_cache: Optional[Dict[str, Any]] = None
+_readiness_expires_at = 0.0
+_readiness_lock = asyncio.Lock()
+
+# Shared DAO so health checks don't build a new instance (and reload the index) per call
+_vector_store: Optional[VectorStoreDAO] = None
+_vector_store_lock = threading.Lock()
+
+# Probes don't need sub-second timestamps; reuse the formatted string briefly
+TIMESTAMP_CACHE_TTL_SECONDS = 0.1
+_timestamp_cache = (float("-inf"), "")  # (monotonic time, iso string)
+
+
+def _get_vector_store() -> VectorStoreDAO:
+    global _vector_store
+    if _vector_store is None:
+        with _vector_store_lock:
+            if _vector_store is None:
+                _vector_store = VectorStoreDAO()
+    return _vector_store
+
+
+def _timestamp() -> str:
+    global _timestamp_cache
+    cached_at, iso = _timestamp_cache
+    now = time.monotonic()
+    if now - cached_at >= TIMESTAMP_CACHE_TTL_SECONDS:
+        iso = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        _timestamp_cache = (now, iso)
+    return iso
+
+
+def _check_aws_credentials() -> bool:
+    is_valid, _ = validate_aws_credentials()
+    return is_valid
+
+
+def _check_s3_bucket() -> bool:
+    if not settings.S3_BUCKET_NAME:
+        return False
+    exists, _ = check_s3_bucket_exists(settings.S3_BUCKET_NAME)
+    return exists
+
+
+def _check_vector_store() -> bool:
+    try:
+        stats = _get_vector_store().get_stats()
+        return "error" not in stats
+    except Exception:
+        return False
+
 
 @router.get(
     "/health",
@@ -25,7 +81,7 @@ async def health_check() -> Dict[str, Any]:
         "status": "healthy",
         "service": settings.APP_NAME,
         "version": settings.APP_VERSION,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _timestamp()
     }
 
 
@@ -39,41 +95,36 @@ async def readiness_check() -> Dict[str, Any]:
     """
     Readiness check - verifies all dependencies are available.
     """
-    checks = {
-        "aws_credentials": False,
-        "s3_bucket": False,
-        "vector_store": False,
-        "openai_api": False
-    }
-    
-    # Check AWS credentials
-    is_valid, error = validate_aws_credentials()
-    checks["aws_credentials"] = is_valid
-    
-    # Check S3 bucket
-    if settings.S3_BUCKET_NAME:
-        exists, error = check_s3_bucket_exists(settings.S3_BUCKET_NAME)
-        checks["s3_bucket"] = exists
-    
-    # Check vector store
-    try:
-        vector_store = VectorStoreDAO()
-        stats = vector_store.get_stats()
-        checks["vector_store"] = "error" not in stats
-    except Exception:
-        checks["vector_store"] = False
-    
-    # Check OpenAI API key
-    checks["openai_api"] = bool(settings.OPENAI_API_KEY)
+    global _readiness_cache, _readiness_expires_at
     
-    # Determine overall status
-    all_ready = all(checks.values())
-    
-    return {
-        "status": "ready" if all_ready else "not_ready",
-        "checks": checks,
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    async with _readiness_lock:
+        if _readiness_cache is not None and time.monotonic() < _readiness_expires_at:
+            return _readiness_cache
+        
+        # The probes are blocking network calls; run them side by side
+        aws_ok, s3_ok, vector_store_ok = await asyncio.gather(
+            asyncio.to_thread(_check_aws_credentials),
+            asyncio.to_thread(_check_s3_bucket),
+            asyncio.to_thread(_check_vector_store)
+        )
+        
+        checks = {
+            "aws_credentials": aws_ok,
+            "s3_bucket": s3_ok,
+            "vector_store": vector_store_ok,
+            "openai_api": bool(settings.OPENAI_API_KEY)
+        }
+        
+        # Determine overall status
+        all_ready = all(checks.values())
+        
+        _readiness_cache = {
+            "status": "ready" if all_ready else "not_ready",
+            "checks": checks,
+            "timestamp": _timestamp()
+        }
+        _readiness_expires_at = time.monotonic() + READINESS_CACHE_TTL_SECONDS
+        return _readiness_cache
 
 
 @router.get(
@@ -86,7 +137,7 @@ async def liveness_check() -> Dict[str, str]:
     """Liveness check - just verifies the service is running."""
     return {
         "status": "alive",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _timestamp()
     }
 
 
@@ -103,8 +154,7 @@ async def detailed_health_check() -> Dict[str, Any]:
     # Get vector store stats
     vector_stats = {}
     try:
-        vector_store = VectorStoreDAO()
-        vector_stats = vector_store.get_stats()
+        vector_stats = _get_vector_store().get_stats()
     except Exception as e:
         vector_stats = {"error": str(e)}
     
@@ -134,5 +184,5 @@ async def detailed_health_check() -> Dict[str, Any]:
             },
             "vector_store": vector_stats
         },
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _timestamp()
     }
\ No newline at end of file
@@ -8,13 +8,18 @@ Provides endpoints to:
 - Test provider connectivity
 """
 
+import asyncio
 import logging
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from api.dependencies.auth import get_current_user
 from models.user import User
+from utils.ttl_cache import async_ttl_cache
+from utils.http_cache import make_etag, etag_matches
 from services.llm import (
     LLMProviderFactory, 
     LLMProviderConfig, 
@@ -68,12 +73,198 @@ class TestConnectionResponse(BaseModel):
     models: Optional[List[str]] = None
 
 
+# ============================================================================
+# Provider Catalog
+# ============================================================================
+
+# All providers including coming soon; static, so built once at import
+_ALL_PROVIDERS_TEMPLATE = (
+    # Available providers
+    ProviderInfo(
+        provider="openai",
+        name="OpenAI",
+        description="GPT-4, GPT-3.5 Turbo (cloud)",
+        available=False,
+        status="available",
+        models=["gpt-4", "gpt-4-turbo", "gpt-3.5-turbo"],
+        requires_api_key=True,
+        is_local=False
+    ),
+    ProviderInfo(
+        provider="ollama",
+        name="Ollama",
+        description="Local LLMs (Llama, Mistral, etc.)",
+        available=False,
+        status="available",
+        models=[],
+        requires_api_key=False,
+        is_local=True,
+        endpoint="http://localhost:11434"
+    ),
+    ProviderInfo(
+        provider="lmstudio",
+        name="LM Studio",
+        description="Local model runner",
+        available=False,
+        status="available",
+        models=[],
+        requires_api_key=False,
+        is_local=True,
+        endpoint="http://localhost:1234/v1"
+    ),
+    # Coming Soon providers
+    ProviderInfo(
+        provider="gemini",
+        name="Google Gemini",
+        description="Gemini Pro, Ultra (cloud)",
+        available=False,
+        status="coming_soon",
+        models=["gemini-pro", "gemini-pro-vision", "gemini-ultra"],
+        requires_api_key=True,
+        is_local=False,
+        eta="Q2 2026"
+    ),
+    ProviderInfo(
+        provider="claude",
+        name="Anthropic Claude",
+        description="Claude 3 Opus, Sonnet, Haiku",
+        available=False,
+        status="coming_soon",
+        models=["claude-3-opus", "claude-3-sonnet", "claude-3-haiku"],
+        requires_api_key=True,
+        is_local=False,
+        eta="Q2 2026"
+    ),
+    ProviderInfo(
+        provider="copilot",
+        name="Microsoft Copilot",
+        description="Azure OpenAI Service",
+        available=False,
+        status="coming_soon",
+        models=["gpt-4", "gpt-35-turbo"],
+        requires_api_key=True,
+        is_local=False,
+        eta="Q3 2026"
+    ),
+    ProviderInfo(
+        provider="n8n",
+        name="n8n Agentic",
+        description="Workflow automation with AI",
+        available=False,
+        status="coming_soon",
+        models=[],
+        requires_api_key=True,
+        is_local=False,
+        eta="Q3 2026"
+    ),
+    ProviderInfo(
+        provider="mcp",
+        name="MCP Server",
+        description="Model Context Protocol",
+        available=False,
+        status="coming_soon",
+        models=[],
+        requires_api_key=False,
+        is_local=False,
+        eta="Q2 2026"
+    ),
+)
+_PROVIDER_INDEX = {p.provider: i for i, p in enumerate(_ALL_PROVIDERS_TEMPLATE)}
+
+# Provider listing reused across requests so UI polling doesn't re-probe local
+# LLM servers each hit. Contents come from global detection, not the caller.
+PROVIDERS_CACHE_TTL_SECONDS = 30
+
+# Clients revalidate these slowly-changing listings with If-None-Match
+LLM_LISTING_CACHE_CONTROL = "private, max-age=30"
+
+# Installed/served model lists change on the order of minutes. Keyed by a
+# caller-supplied base_url, so the number of cached endpoints is capped.
+PROVIDER_MODELS_TTL_SECONDS = 20
+PROVIDER_MODELS_CACHE_MAX_ENTRIES = 64
+
+
+@async_ttl_cache(seconds=PROVIDER_MODELS_TTL_SECONDS, max_entries=PROVIDER_MODELS_CACHE_MAX_ENTRIES)
+async def _list_provider_models_cached(provider: str, base_url: Optional[str]) -> List[str]:
+    if provider == "openai":
+        config = LLMProviderConfig.openai()
+    elif provider == "ollama":
+        config = LLMProviderConfig.ollama(base_url=base_url or "http://localhost:11434")
+    else:
+        config = LLMProviderConfig.lmstudio(base_url=base_url or "http://localhost:1234/v1")
+    
+    return await LLMProviderFactory.get_or_create_provider(config).list_models()
+
+
+# Curated list, identical for every caller
+RECOMMENDED_MODELS_BY_PROVIDER = {
+    "openai": [
+        {"name": "gpt-4", "description": "Most capable, best for complex queries"},
+        {"name": "gpt-4-turbo", "description": "Faster, good balance of speed and quality"},
+        {"name": "gpt-3.5-turbo", "description": "Fast and cost-effective"},
+    ],
+    "ollama": [
+        {"name": "llama3.2", "description": "Latest Llama, great all-around performance"},
+        {"name": "llama3.1", "description": "Stable, well-tested"},
+        {"name": "mistral", "description": "Fast, efficient for coding tasks"},
+        {"name": "mixtral", "description": "Mixture of experts, powerful"},
+        {"name": "codellama", "description": "Specialized for code"},
+        {"name": "phi3", "description": "Small but capable Microsoft model"},
+        {"name": "gemma2", "description": "Google's efficient model"},
+    ],
+    "lmstudio": [
+        {"name": "Load any model in LM Studio", "description": "Use the model loaded in LM Studio"}
+    ]
+}
+
+# Constant body, so it is serialized and tagged once at import
+_RECOMMENDED_MODELS_BODY = orjson.dumps(RECOMMENDED_MODELS_BY_PROVIDER)
+_RECOMMENDED_MODELS_ETAG = make_etag(_RECOMMENDED_MODELS_BODY.decode("utf-8"))
+
+
+def _conditional_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """Return 304 if the client's If-None-Match is current, else the pre-serialized JSON body."""
+    headers = {"ETag": etag, "Cache-Control": LLM_LISTING_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@async_ttl_cache(seconds=PROVIDERS_CACHE_TTL_SECONDS)
+async def _build_providers_listing() -> Tuple[bytes, str]:
+    """
+    Detect providers and serialize the full listing as (JSON body, ETag).
+    
+    Built from ProviderInfo.model_dump() once per cache period, rather than
+    re-validated against response_model per request.
+    """
+    providers = await LLMProviderFactory.detect_available_providers()
+    
+    all_providers = [provider.model_copy() for provider in _ALL_PROVIDERS_TEMPLATE]
+    
+    # Update with detected availability (only for implemented providers)
+    for detected in providers:
+        index = _PROVIDER_INDEX.get(detected["provider"])
+        if index is None:
+            continue
+        provider = all_providers[index]
+        provider.available = detected["available"]
+        if detected.get("models"):
+            provider.models = detected["models"]
+        if detected.get("endpoint"):
+            provider.endpoint = detected["endpoint"]
+    
+    body = orjson.dumps([provider.model_dump() for provider in all_providers])
+    return body, make_etag(body.decode("utf-8"))
+
+
 # ============================================================================
 # Routes
 # ============================================================================
 
-@router.get("/providers/", response_model=List[ProviderInfo])
+@router.get("/providers/", response_model=List[ProviderInfo], response_class=ORJSONResponse)
 async def list_providers(
+    request: Request,
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -84,119 +275,15 @@ async def list_providers(
     - Coming Soon: Gemini, Claude, Copilot, n8n, MCP
     """
     try:
-        providers = await LLMProviderFactory.detect_available_providers()
-        
-        # All providers including coming soon
-        all_providers = [
-            # Available providers
-            ProviderInfo(
-                provider="openai",
-                name="OpenAI",
-                description="GPT-4, GPT-3.5 Turbo (cloud)",
-                available=False,
-                status="available",
-                models=["gpt-4", "gpt-4-turbo", "gpt-3.5-turbo"],
-                requires_api_key=True,
-                is_local=False
-            ),
-            ProviderInfo(
-                provider="ollama",
-                name="Ollama",
-                description="Local LLMs (Llama, Mistral, etc.)",
-                available=False,
-                status="available",
-                models=[],
-                requires_api_key=False,
-                is_local=True,
-                endpoint="http://localhost:11434"
-            ),
-            ProviderInfo(
-                provider="lmstudio",
-                name="LM Studio",
-                description="Local model runner",
-                available=False,
-                status="available",
-                models=[],
-                requires_api_key=False,
-                is_local=True,
-                endpoint="http://localhost:1234/v1"
-            ),
-            # Coming Soon providers
-            ProviderInfo(
-                provider="gemini",
-                name="Google Gemini",
-                description="Gemini Pro, Ultra (cloud)",
-                available=False,
-                status="coming_soon",
-                models=["gemini-pro", "gemini-pro-vision", "gemini-ultra"],
-                requires_api_key=True,
-                is_local=False,
-                eta="Q2 2026"
-            ),
-            ProviderInfo(
-                provider="claude",
-                name="Anthropic Claude",
-                description="Claude 3 Opus, Sonnet, Haiku",
-                available=False,
-                status="coming_soon",
-                models=["claude-3-opus", "claude-3-sonnet", "claude-3-haiku"],
-                requires_api_key=True,
-                is_local=False,
-                eta="Q2 2026"
-            ),
-            ProviderInfo(
-                provider="copilot",
-                name="Microsoft Copilot",
-                description="Azure OpenAI Service",
-                available=False,
-                status="coming_soon",
-                models=["gpt-4", "gpt-35-turbo"],
-                requires_api_key=True,
-                is_local=False,
-                eta="Q3 2026"
-            ),
-            ProviderInfo(
-                provider="n8n",
-                name="n8n Agentic",
-                description="Workflow automation with AI",
-                available=False,
-                status="coming_soon",
-                models=[],
-                requires_api_key=True,
-                is_local=False,
-                eta="Q3 2026"
-            ),
-            ProviderInfo(
-                provider="mcp",
-                name="MCP Server",
-                description="Model Context Protocol",
-                available=False,
-                status="coming_soon",
-                models=[],
-                requires_api_key=False,
-                is_local=False,
-                eta="Q2 2026"
-            ),
-        ]
-        
-        # Update with detected availability (only for implemented providers)
-        for detected in providers:
-            for provider in all_providers:
-                if provider.provider == detected["provider"]:
-                    provider.available = detected["available"]
-                    if detected.get("models"):
-                        provider.models = detected["models"]
-                    if detected.get("endpoint"):
-                        provider.endpoint = detected["endpoint"]
-        
-        return all_providers
+        body, etag = await _build_providers_listing()
+        return _conditional_json_response(request, body, etag)
         
     except Exception as e:
         logger.error(f"Failed to list providers: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/providers/{provider}/models/", response_model=List[str])
+@router.get("/providers/{provider}/models/", response_model=List[str], response_class=ORJSONResponse)
 async def list_provider_models(
     provider: str,
     base_url: Optional[str] = Query(None, description="Custom endpoint URL"),
@@ -207,24 +294,13 @@ async def list_provider_models(
     
     For local providers (Ollama, LM Studio), lists models currently installed.
     """
+    if provider not in ("openai", "ollama", "lmstudio"):
+        raise HTTPException(status_code=400, detail=f"Unknown provider: {provider}")
+    
     try:
-        # Create config based on provider
-        if provider == "openai":
-            config = LLMProviderConfig.openai()
-        elif provider == "ollama":
-            config = LLMProviderConfig.ollama(base_url=base_url or "http://localhost:11434")
-        elif provider == "lmstudio":
-            config = LLMProviderConfig.lmstudio(base_url=base_url or "http://localhost:1234/v1")
-        else:
-            raise HTTPException(status_code=400, detail=f"Unknown provider: {provider}")
+        # Cached per (provider, base_url); a plain list of names needs no validation
+        return ORJSONResponse(await _list_provider_models_cached(provider, base_url))
         
-        llm_provider = LLMProviderFactory.create(config)
-        models = await llm_provider.list_models()
-        
-        return models
-        
-    except HTTPException:
-        raise
     except ConnectionError as e:
         raise HTTPException(
             status_code=503, 
@@ -258,11 +334,20 @@ async def test_provider_connection(
             api_key=request.api_key
         )
         
-        llm_provider = LLMProviderFactory.create(config)
-        available = await llm_provider.is_available()
+        llm_provider = LLMProviderFactory.get_or_create_provider(config)
+        
+        # Both calls hit the same endpoint independently; run them side by side
+        available, models = await asyncio.gather(
+            llm_provider.is_available(),
+            llm_provider.list_models(),
+            return_exceptions=True
+        )
+        if isinstance(available, BaseException):
+            raise available
         
         if available:
-            models = await llm_provider.list_models()
+            if isinstance(models, BaseException):
+                raise models
             return TestConnectionResponse(
                 success=True,
                 message=f"Successfully connected to {request.provider}",
@@ -292,6 +377,7 @@ async def test_provider_connection(
 
 @router.get("/recommended-models/")
 async def get_recommended_models(
+    request: Request,
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -299,22 +385,4 @@ async def get_recommended_models(
     
     Returns curated list of popular/effective models.
     """
-    return {
-        "openai": [
-            {"name": "gpt-4", "description": "Most capable, best for complex queries"},
-            {"name": "gpt-4-turbo", "description": "Faster, good balance of speed and quality"},
-            {"name": "gpt-3.5-turbo", "description": "Fast and cost-effective"},
-        ],
-        "ollama": [
-            {"name": "llama3.2", "description": "Latest Llama, great all-around performance"},
-            {"name": "llama3.1", "description": "Stable, well-tested"},
-            {"name": "mistral", "description": "Fast, efficient for coding tasks"},
-            {"name": "mixtral", "description": "Mixture of experts, powerful"},
-            {"name": "codellama", "description": "Specialized for code"},
-            {"name": "phi3", "description": "Small but capable Microsoft model"},
-            {"name": "gemma2", "description": "Google's efficient model"},
-        ],
-        "lmstudio": [
-            {"name": "Load any model in LM Studio", "description": "Use the model loaded in LM Studio"}
-        ]
-    }
+    return _conditional_json_response(request, _RECOMMENDED_MODELS_BODY, _RECOMMENDED_MODELS_ETAG)
@@ -12,20 +12,23 @@ Endpoints:
 
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from config.database import get_db
 from services.ollama_model_service import ollama_model_service
 from api.dependencies.auth import get_current_user
-from api.dependencies.id_encryption import get_id_encryptor
-from utils.id_encryption import UserIDEncryptor
+from api.dependencies.id_encryption import encrypted_id_path
 from models.user import User
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Model lists are plain dicts of primitives (to_dict output), so the list
+# endpoints hand them to ORJSONResponse directly and skip jsonable_encoder
+
 
 @router.post(
     "/discover",
@@ -57,6 +60,7 @@ async def discover_models(
 
 @router.get(
     "/",
+    response_class=ORJSONResponse,
     summary="List all discovered models",
     description="Get all Ollama models ever discovered on this system"
 )
@@ -73,15 +77,16 @@ async def list_models(
         installed_only=installed_only
     )
     
-    return {
+    return ORJSONResponse({
         "success": True,
         "models": models,
         "total": len(models)
-    }
+    })
 
 
 @router.get(
     "/enabled",
+    response_class=ORJSONResponse,
     summary="List enabled models",
     description="Get enabled and installed models (for chat UI model selector)"
 )
@@ -92,11 +97,11 @@ async def list_enabled_models(
     """Get only enabled and installed models for the chat UI."""
     models = ollama_model_service.get_enabled_models(db)
     
-    return {
+    return ORJSONResponse({
         "success": True,
         "models": models,
         "total": len(models)
-    }
+    })
 
 
 @router.put(
@@ -129,15 +134,15 @@ async def toggle_model(
 
 @router.get(
     "/conversation/{conversation_id}",
+    response_class=ORJSONResponse,
     summary="Get conversation models",
     description="Get models available for a specific conversation"
 )
 async def get_conversation_models(
-    conversation_id: str,
     include_new: bool = Query(True, description="Include newly discovered models"),
+    decrypted_conv_id: str = Depends(encrypted_id_path("conversation_id", str)),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-    encryptor: UserIDEncryptor = Depends(get_id_encryptor)
+    current_user: User = Depends(get_current_user)
 ):
     """
     Get models for a conversation.
@@ -145,29 +150,23 @@ async def get_conversation_models(
     Returns:
     - Models linked when conversation was created (is_original=True)
     - Optionally, new models discovered since (is_new=True)
-    """
-    # Decrypt conversation ID
-    try:
-        decrypted_conv_id = encryptor.decrypt(conversation_id)
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid conversation ID"
-        )
     
-    models = ollama_model_service.get_conversation_models(
+    The conversation ID is decrypted by the shared path dependency, which
+    reuses the per-user decrypted-ID cache for repeat polls.
+    """
+    models, original_count, new_count = ollama_model_service.get_conversation_models(
         db, 
-        str(decrypted_conv_id),
+        decrypted_conv_id,
         include_new=include_new
     )
     
-    return {
+    return ORJSONResponse({
         "success": True,
         "models": models,
         "total": len(models),
-        "original_count": sum(1 for m in models if m.get("is_original")),
-        "new_count": sum(1 for m in models if m.get("is_new"))
-    }
+        "original_count": original_count,
+        "new_count": new_count
+    })
 
 
 @router.post(
@@ -176,25 +175,15 @@ async def get_conversation_models(
     description="Add a newly discovered model to an existing conversation"
 )
 async def add_model_to_conversation(
-    conversation_id: str,
     model_id: str,
+    decrypted_conv_id: str = Depends(encrypted_id_path("conversation_id", str)),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-    encryptor: UserIDEncryptor = Depends(get_id_encryptor)
+    current_user: User = Depends(get_current_user)
 ):
     """Add a model to a conversation (for newly discovered models)."""
-    # Decrypt conversation ID
-    try:
-        decrypted_conv_id = encryptor.decrypt(conversation_id)
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid conversation ID"
-        )
-    
     result = ollama_model_service.add_model_to_conversation(
         db, 
-        str(decrypted_conv_id),
+        decrypted_conv_id,
         model_id
     )
     
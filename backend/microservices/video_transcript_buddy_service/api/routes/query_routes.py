@@ -46,8 +46,8 @@ def _resolve_transcript_ids_to_filenames(
     
     The frontend sends encrypted database UUIDs (transcript.id), but the vector
     store indexes documents by filename. This function:
-    1. Decrypts the encrypted IDs to get the actual UUIDs
-    2. Looks up transcripts in the database
+    1. Decrypts the encrypted IDs to get the actual UUIDs (one batch)
+    2. Looks up the transcripts in the database (one query)
     3. Returns the corresponding filenames
     
     Args:
@@ -62,29 +62,29 @@ def _resolve_transcript_ids_to_filenames(
     if not transcript_ids:
         return None
     
+    # Decrypt all IDs with one key lookup, skipping stale or invalid ones
+    decrypted_ids = [
+        decrypted_id
+        for decrypted_id in encryptor.decrypt_batch(transcript_ids)
+        if decrypted_id is not None
+    ]
+    if len(decrypted_ids) < len(transcript_ids):
+        logger.warning(f"Skipped {len(transcript_ids) - len(decrypted_ids)} undecryptable transcript IDs")
+    
     filenames = []
-    for encrypted_id in transcript_ids:
-        try:
-            # Decrypt the ID to get the actual database UUID
-            decrypted_id = encryptor.decrypt(encrypted_id)
-            logger.debug(f"Decrypted transcript ID: {encrypted_id} -> {decrypted_id}")
-            
-            # Look up the transcript to get the filename
-            transcript = db.query(Transcript).filter(
-                Transcript.id == decrypted_id,
-                Transcript.user_id == current_user.id
-            ).first()
-            
-            if transcript:
-                filenames.append(transcript.filename)
-                logger.debug(f"Resolved transcript {decrypted_id} to filename: {transcript.filename}")
+    if decrypted_ids:
+        # Look up all transcripts in one query, then keep the request order
+        rows = db.query(Transcript.id, Transcript.filename).filter(
+            Transcript.id.in_(decrypted_ids),
+            Transcript.user_id == current_user.id
+        ).all()
+        filename_by_id = {row.id: row.filename for row in rows}
+        for decrypted_id in decrypted_ids:
+            filename = filename_by_id.get(decrypted_id)
+            if filename:
+                filenames.append(filename)
             else:
                 logger.warning(f"Transcript not found for ID: {decrypted_id}")
-        
-        except Exception as e:
-            logger.warning(f"Failed to decrypt/resolve transcript ID {encrypted_id}: {e}")
-            # Skip invalid IDs silently - they might be stale encrypted IDs
-            continue
     
     if not filenames:
         logger.warning("No valid transcript filenames resolved - search may return empty results")
@@ -63,8 +63,8 @@ async def check_limits(
     """
     usage_service = UsageService(db)
     
-    upload_limit = usage_service.check_limit(current_user.id, "UPLOAD")
-    query_limit = usage_service.check_limit(current_user.id, "QUERY")
+    upload_limit = usage_service.check_limit(current_user.id, "UPLOAD", tier=current_user.tier)
+    query_limit = usage_service.check_limit(current_user.id, "QUERY", tier=current_user.tier)
     
     return BaseResponse(
         success=True,
@@ -7,6 +7,7 @@ from .exceptions import (
     VectorStoreException,
     AgentException,
     ValidationException,
+    TierLimitExceededException,
 )
 from .constants import (
     SUPPORTED_FILE_EXTENSIONS,
@@ -23,6 +24,7 @@ __all__ = [
     "VectorStoreException",
     "AgentException",
     "ValidationException",
+    "TierLimitExceededException",
     # Constants
     "SUPPORTED_FILE_EXTENSIONS",
     "MAX_FILE_SIZE_MB",
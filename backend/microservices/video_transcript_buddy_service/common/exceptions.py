@@ -107,6 +107,23 @@ class AuthenticationException(BaseAppException):
         )
 
 
+class TierLimitExceededException(BaseAppException):
+    """
+    Raised when a request exceeds the user's subscription tier limits.
+    
+    Carries the full response payload; the app's handler sends it as
+    {"detail": payload} with the given status code.
+    """
+    
+    def __init__(self, detail: dict, status_code: int = 403):
+        self.detail = detail
+        self.status_code = status_code
+        super().__init__(
+            message=detail.get("message") or "Tier limit exceeded",
+            error_code=detail.get("error_code", "TIER_LIMIT_EXCEEDED")
+        )
+
+
 class RateLimitException(BaseAppException):
     """Raised when rate limit is exceeded."""
     
@@ -0,0 +1,49 @@
+"""
+LLM Client - Process-wide async OpenAI client.
+
+Every agent shares one client, so a single keep-alive connection pool
+(and its TLS sessions) is reused across all requests.
+
+Usage:
+    from common.llm_client import get_openai
+    response = await get_openai().chat.completions.create(...)
+"""
+
+import threading
+from typing import Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+from config import settings
+
+_client: Optional[AsyncOpenAI] = None
+_client_lock = threading.Lock()
+
+
+def get_openai() -> AsyncOpenAI:
+    """
+    Get the shared async OpenAI client, creating it on first use.
+
+    HTTP/2 multiplexes concurrent completions over a few connections.
+    Callers are expected to check OPENAI_API_KEY before calling.
+
+    Returns:
+        The process-wide AsyncOpenAI client
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = AsyncOpenAI(
+                    api_key=settings.OPENAI_API_KEY,
+                    http_client=httpx.AsyncClient(
+                        http2=True,
+                        limits=httpx.Limits(
+                            max_connections=200,
+                            max_keepalive_connections=100,
+                            keepalive_expiry=60
+                        )
+                    )
+                )
+    return _client
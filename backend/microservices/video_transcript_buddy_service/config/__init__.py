@@ -1,7 +1,7 @@
 """Configuration module."""
 
 from .settings import settings, get_settings, Settings
-from .database import get_db, get_db_context, engine, Base, init_db
+from .database import get_db, get_db_context, engine, Base, GUID, init_db
 
 __all__ = [
     "settings", 
@@ -11,5 +11,6 @@ __all__ = [
     "get_db_context",
     "engine",
     "Base",
+    "GUID",
     "init_db",
 ]
\ No newline at end of file
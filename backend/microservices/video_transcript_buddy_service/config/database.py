@@ -17,7 +17,7 @@ import logging
 from typing import Generator
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, String, Uuid
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 from sqlalchemy.pool import StaticPool, QueuePool
 
@@ -28,6 +28,10 @@ logger = logging.getLogger(__name__)
 # Create declarative base for models
 Base = declarative_base()
 
+# Primary/foreign key type for UUID ids: native 16-byte uuid on PostgreSQL,
+# 36-char string elsewhere. Values are str in Python either way.
+GUID = String(36).with_variant(Uuid(as_uuid=False), "postgresql")
+
 
 def get_engine():
     """
@@ -73,6 +77,7 @@ def get_engine():
             pool_size=settings.DB_POOL_SIZE,
             max_overflow=settings.DB_MAX_OVERFLOW,
             pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
             pool_pre_ping=True,  # Verify connections before use
             echo=settings.DEBUG
         )
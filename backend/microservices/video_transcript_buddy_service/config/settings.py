@@ -13,7 +13,7 @@ Note:
 
 import os
 from typing import Optional, List, Union
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
 from functools import lru_cache
 
@@ -30,6 +30,7 @@ class Settings(BaseSettings):
     # Server Settings
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    FORWARDED_ALLOW_IPS: str = "127.0.0.1"  # Proxies whose X-Forwarded-For is trusted (comma-separated, * for any)
     
     # -----------------------------------------------------------------------------
     # Database Settings (SQLite local / PostgreSQL production)
@@ -39,9 +40,10 @@ class Settings(BaseSettings):
     SQLITE_DATABASE_PATH: str = "./data/transcriptquery.db"
     
     # Database pool settings (for PostgreSQL)
-    DB_POOL_SIZE: int = 5
+    DB_POOL_SIZE: int = 20  # Sized for the sync handlers running in the threadpool
     DB_MAX_OVERFLOW: int = 10
     DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600  # Seconds; replace connections before server/proxy idle timeouts
     
     @property
     def database_uri(self) -> str:
@@ -79,6 +81,17 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: Optional[str] = None
     OPENAI_MODEL: str = "gpt-4"
     OPENAI_EMBEDDING_MODEL: str = "text-embedding-ada-002"
+    # Smaller model for structural analyses (summary/extraction/sentiment); empty disables routing
+    OPENAI_FAST_MODEL: str = "gpt-4o-mini"
+    USE_LLM_VALIDATION: bool = True  # Add an LLM relevance check to query validation
+    LLM_WARMUP_ON_STARTUP: bool = True  # Open provider connections in the background at startup
+    
+    # Semantic cache for analysis results (skips the LLM for near-identical queries)
+    SEMANTIC_CACHE_ENABLED: bool = True
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95
+    SEMANTIC_CACHE_TTL_SECONDS: int = 3600
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 1024
+    RESOLVER_CACHE_THRESHOLD: float = 0.92  # Query answers tolerate slightly looser matches
     
     # Vector Store Settings
     VECTOR_STORE_TYPE: str = "local"
@@ -97,6 +110,11 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    AUTH_CACHE_TTL_SECONDS: int = 60  # Token -> user cache (0 disables)
+    AUTH_RATE_LIMIT_PER_IP: int = 20  # Login/register requests per IP per minute (0 disables)
+    AUTH_RATE_LIMIT_PER_EMAIL: int = 5  # Login attempts per account per minute (0 disables)
+    AUTH_PASSWORD_CACHE_TTL_SECONDS: int = 60  # Reuse a successful bcrypt check briefly (0 disables)
+    PASSWORD_HASH_ROUNDS: int = 12  # bcrypt cost; lower (min 4) only in test environments
     
     # CORS Settings
     CORS_ORIGINS: Union[str, List[str]] = "http://localhost:4200,http://127.0.0.1:4200"
@@ -109,11 +127,12 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(',') if origin.strip()]
         return v
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
-        extra = "ignore"
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore"
+    )
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
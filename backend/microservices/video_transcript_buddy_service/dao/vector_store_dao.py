@@ -8,7 +8,8 @@ import logging
 import os
 import json
 import pickle
-from typing import List, Optional, Dict, Any
+import threading
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
 from config import settings
@@ -19,6 +20,38 @@ from common.constants import DEFAULT_SEARCH_RESULTS, MAX_SEARCH_RESULTS
 logger = logging.getLogger(__name__)
 
 
+class _ContentVersions:
+    """
+    Change counters for indexed content, shared by every DAO in the process.
+    
+    Caches keyed on transcript ids include these so that re-indexing or
+    deleting a transcript makes their old entries unreachable.
+    """
+    
+    def __init__(self):
+        self._transcripts: Dict[str, int] = {}
+        self._store = 0  # Any change
+        self._clears = 0  # Whole-store clears
+        self._lock = threading.Lock()
+    
+    def bump(self, transcript_id: Optional[str] = None) -> None:
+        with self._lock:
+            self._store += 1
+            if transcript_id is None:
+                self._clears += 1
+            else:
+                self._transcripts[transcript_id] = self._transcripts.get(transcript_id, 0) + 1
+    
+    def get(self, transcript_ids: Optional[List[str]]) -> Tuple[int, ...]:
+        with self._lock:
+            if not transcript_ids:
+                return (self._store,)
+            return (self._clears, *(self._transcripts.get(t, 0) for t in sorted(transcript_ids)))
+
+
+_content_versions = _ContentVersions()
+
+
 class VectorStoreDAO:
     """Data Access Object for vector store operations using FAISS."""
     
@@ -38,6 +71,7 @@ class VectorStoreDAO:
         self.collection_name = collection_name
         self._index = None
         self._documents = []  # Store documents with metadata
+        self._id_map = None  # Lazily built chunk id -> document position
         self._embeddings_model = None
         self._index_path = os.path.join(self.persist_directory, f"{collection_name}.faiss")
         self._docs_path = os.path.join(self.persist_directory, f"{collection_name}_docs.pkl")
@@ -67,6 +101,25 @@ class VectorStoreDAO:
         
         return self._embeddings_model
     
+    def embed_query(self, query: str) -> List[float]:
+        """Embed a single query with the store's embeddings model."""
+        return self._get_embeddings_model().embed_query(query)
+    
+    def get_content_version(self, transcript_ids: Optional[List[str]] = None) -> Tuple[int, ...]:
+        """
+        Get a version stamp for the indexed content of some transcripts.
+        
+        The stamp changes whenever any of them is re-indexed or deleted (or,
+        with no ids, when anything in the store changes). Process-local.
+        
+        Args:
+            transcript_ids: Transcripts of interest (None for the whole store)
+            
+        Returns:
+            Tuple usable as part of a cache key
+        """
+        return _content_versions.get(transcript_ids)
+    
     def _load_index(self):
         """Load existing index from disk."""
         if self._index is not None:
@@ -81,11 +134,17 @@ class VectorStoreDAO:
                 self._index = faiss.read_index(self._index_path)
                 with open(self._docs_path, 'rb') as f:
                     self._documents = pickle.load(f)
+                # Stores written by an earlier build kept a second copy of each
+                # chunk's text here; drop it (it leaves disk on the next save)
+                for doc in self._documents:
+                    doc["metadata"].pop("formatted_context", None)
+                self._id_map = None
                 logger.info(f"Loaded existing index with {len(self._documents)} documents")
             else:
                 # Create new index (1536 dimensions for OpenAI embeddings)
                 self._index = faiss.IndexFlatL2(1536)
                 self._documents = []
+                self._id_map = None
                 logger.info("Created new FAISS index")
         
         except Exception as e:
@@ -181,8 +240,11 @@ class VectorStoreDAO:
                     }
                 })
             
+            self._id_map = None
+            
             # Save to disk
             self._save_index()
+            _content_versions.bump(transcript_id)
             
             logger.info(f"Indexed transcript {transcript_id}: {len(chunks)} chunks")
             
@@ -235,7 +297,9 @@ class VectorStoreDAO:
                 self._index = faiss.IndexFlatL2(1536)
             
             self._documents = docs_to_keep
+            self._id_map = None
             self._save_index()
+            _content_versions.bump(transcript_id)
             
             logger.info(f"Deleted {deleted_count} chunks for {transcript_id}")
         
@@ -248,7 +312,8 @@ class VectorStoreDAO:
         n_results: int = DEFAULT_SEARCH_RESULTS,
         transcript_ids: Optional[List[str]] = None,
         user_id: Optional[str] = None,
-        min_score: float = 0.0
+        min_score: float = 0.0,
+        include_content: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Search for relevant transcript chunks.
@@ -259,6 +324,7 @@ class VectorStoreDAO:
             transcript_ids: Optional filter by transcript IDs
             user_id: REQUIRED for multi-tenancy - filters results to user's data only
             min_score: Minimum similarity score (0-1)
+            include_content: If False, omit chunk text (fetch later with get_contents)
             
         Returns:
             List of matching chunks with metadata
@@ -284,44 +350,10 @@ class VectorStoreDAO:
             k = min(n_results * 3, len(self._documents))  # Get extra for filtering
             distances, indices = self._index.search(query_array, k)
             
-            # Process results
-            search_results = []
-            
-            for i, idx in enumerate(indices[0]):
-                if idx < 0 or idx >= len(self._documents):
-                    continue
-                
-                doc = self._documents[idx]
-                distance = distances[0][i]
-                
-                # Convert L2 distance to similarity score
-                similarity = 1 / (1 + distance)
-                
-                # SECURITY: Filter by user_id for multi-tenancy (CRITICAL)
-                if user_id:
-                    doc_user_id = doc["metadata"].get("user_id")
-                    if doc_user_id != user_id:
-                        continue  # Skip documents belonging to other users
-                
-                # Filter by transcript_ids if specified
-                if transcript_ids:
-                    if doc["metadata"].get("transcript_id") not in transcript_ids:
-                        continue
-                
-                # Filter by minimum score
-                if similarity < min_score:
-                    continue
-                
-                search_results.append({
-                    "id": doc["id"],
-                    "content": doc["content"],
-                    "metadata": doc["metadata"],
-                    "score": round(similarity, 4),
-                    "distance": round(float(distance), 4)
-                })
-                
-                if len(search_results) >= n_results:
-                    break
+            search_results = self._collect_results(
+                distances[0], indices[0], n_results,
+                transcript_ids, user_id, min_score, include_content
+            )
             
             logger.info(f"Search returned {len(search_results)} results for query: {query[:50]}...")
             return search_results
@@ -333,6 +365,209 @@ class VectorStoreDAO:
                 operation="search"
             )
     
+    def search_batch(
+        self,
+        queries: List[str],
+        n_results: int = DEFAULT_SEARCH_RESULTS,
+        transcript_ids: Optional[List[str]] = None,
+        user_id: Optional[str] = None,
+        min_score: float = 0.0,
+        include_content: bool = True
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several queries at once.
+        
+        All queries are embedded in a single embeddings request and looked
+        up with one multi-vector index search.
+        
+        Args:
+            queries: Search queries
+            n_results: Number of results to return per query
+            transcript_ids: Optional filter by transcript IDs
+            user_id: REQUIRED for multi-tenancy - filters results to user's data only
+            min_score: Minimum similarity score (0-1)
+            include_content: If False, omit chunk text (fetch later with get_contents)
+            
+        Returns:
+            One list of matching chunks per query, in query order
+        """
+        logger.info(f"Batch vector search by user_id={user_id}, transcript_ids={transcript_ids}")
+        n_results = min(n_results, MAX_SEARCH_RESULTS)
+        
+        if not queries:
+            return []
+        
+        try:
+            import numpy as np
+            
+            self._load_index()
+            
+            if len(self._documents) == 0:
+                return [[] for _ in queries]
+            
+            # Embed all queries in one request
+            embeddings_model = self._get_embeddings_model()
+            query_array = np.array(embeddings_model.embed_documents(queries)).astype('float32')
+            
+            k = min(n_results * 3, len(self._documents))  # Get extra for filtering
+            distances, indices = self._index.search(query_array, k)
+            
+            batch_results = [
+                self._collect_results(
+                    distances[row], indices[row], n_results,
+                    transcript_ids, user_id, min_score, include_content
+                )
+                for row in range(len(queries))
+            ]
+            
+            logger.info(f"Batch search returned results for {len(queries)} queries")
+            return batch_results
+        
+        except Exception as e:
+            logger.error(f"Batch search failed: {e}")
+            raise VectorStoreException(
+                f"Batch search failed: {str(e)}",
+                operation="search_batch"
+            )
+    
+    def rerank(
+        self,
+        query: str,
+        chunks: List[Dict[str, Any]],
+        n_results: int = DEFAULT_SEARCH_RESULTS,
+        min_score: float = 0.0,
+        include_content: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Re-score previously retrieved chunks against a new query.
+        
+        Distances are computed locally from the stored vectors, so no index
+        search runs. Chunks no longer in the store are skipped.
+        
+        Args:
+            query: Search query
+            chunks: Candidate chunks (as returned by search)
+            n_results: Number of results to return
+            min_score: Minimum similarity score (0-1)
+            include_content: If False, omit chunk text (fetch later with get_contents)
+            
+        Returns:
+            Candidate chunks ordered by similarity to the query
+        """
+        n_results = min(n_results, MAX_SEARCH_RESULTS)
+        
+        try:
+            import numpy as np
+            
+            self._load_index()
+            id_map = self._get_id_map()
+            
+            positions = np.array(
+                [id_map[c["id"]] for c in chunks if c.get("id") in id_map],
+                dtype='int64'
+            )
+            if positions.size == 0:
+                return []
+            
+            embeddings_model = self._get_embeddings_model()
+            query_vector = np.array(embeddings_model.embed_query(query)).astype('float32')
+            vectors = np.vstack([self._index.reconstruct(int(p)) for p in positions])
+            
+            # Squared L2, matching the distances IndexFlatL2 reports
+            distances = ((vectors - query_vector) ** 2).sum(axis=1)
+            order = np.argsort(distances)
+            
+            return self._collect_results(
+                distances[order], positions[order], n_results,
+                None, None, min_score, include_content
+            )
+        
+        except Exception as e:
+            logger.error(f"Rerank failed: {e}")
+            raise VectorStoreException(
+                f"Rerank failed: {str(e)}",
+                operation="rerank"
+            )
+    
+    def _get_id_map(self) -> Dict[str, int]:
+        """Map chunk IDs to document positions (rebuilt after changes)."""
+        if self._id_map is None:
+            self._id_map = {doc["id"]: i for i, doc in enumerate(self._documents)}
+        return self._id_map
+    
+    def _collect_results(
+        self,
+        distances,
+        indices,
+        n_results: int,
+        transcript_ids: Optional[List[str]],
+        user_id: Optional[str],
+        min_score: float,
+        include_content: bool
+    ) -> List[Dict[str, Any]]:
+        """Filter and format one query's raw index hits."""
+        search_results = []
+        
+        for i, idx in enumerate(indices):
+            if idx < 0 or idx >= len(self._documents):
+                continue
+            
+            doc = self._documents[idx]
+            distance = distances[i]
+            
+            # Convert L2 distance to similarity score
+            similarity = 1 / (1 + distance)
+            
+            # SECURITY: Filter by user_id for multi-tenancy (CRITICAL)
+            if user_id:
+                doc_user_id = doc["metadata"].get("user_id")
+                if doc_user_id != user_id:
+                    continue  # Skip documents belonging to other users
+            
+            # Filter by transcript_ids if specified
+            if transcript_ids:
+                if doc["metadata"].get("transcript_id") not in transcript_ids:
+                    continue
+            
+            # Filter by minimum score
+            if similarity < min_score:
+                continue
+            
+            result = {
+                "id": doc["id"],
+                "metadata": doc["metadata"],
+                "score": round(similarity, 4),
+                "distance": round(float(distance), 4)
+            }
+            if include_content:
+                result["content"] = doc["content"]
+            search_results.append(result)
+            
+            if len(search_results) >= n_results:
+                break
+        
+        return search_results
+    
+    def get_contents(self, chunk_ids: List[str]) -> Dict[str, str]:
+        """
+        Fetch chunk contents for multiple chunk IDs in one call.
+        
+        Args:
+            chunk_ids: Chunk identifiers (as returned by search)
+            
+        Returns:
+            Dict mapping chunk ID to content (unknown IDs are omitted)
+        """
+        self._load_index()
+        id_map = self._get_id_map()
+        
+        contents = {}
+        for chunk_id in chunk_ids:
+            idx = id_map.get(chunk_id)
+            if idx is not None:
+                contents[chunk_id] = self._documents[idx]["content"]
+        return contents
+    
     def delete_transcript(self, transcript_id: str) -> bool:
         """
         Delete all chunks for a transcript.
@@ -454,12 +689,14 @@ class VectorStoreDAO:
             
             self._index = faiss.IndexFlatL2(1536)
             self._documents = []
+            self._id_map = None
             
             # Remove files
             if os.path.exists(self._index_path):
                 os.remove(self._index_path)
             if os.path.exists(self._docs_path):
                 os.remove(self._docs_path)
+            _content_versions.bump()
             
             logger.info(f"Cleared vector store: {self.collection_name}")
             return True
@@ -10,21 +10,32 @@ API Documentation:
     http://localhost:8000/redoc (ReDoc)
 """
 
+import asyncio
 import logging
 import os
 from pathlib import Path
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from alembic.config import Config
 from alembic import command
 
 from config import settings, init_db
-from api.routes import health_router, transcript_router, query_router, auth_router, usage_router, conversation_router, admin_router
-from api.routes.llm_routes import router as llm_router
-from common.exceptions import BaseAppException, AuthenticationException
+from api.routes import (
+    health_router,
+    transcript_router,
+    query_router,
+    auth_router,
+    usage_router,
+    conversation_router,
+    admin_router,
+    llm_router,
+    ollama_model_router,
+)
+from common.exceptions import BaseAppException, AuthenticationException, TierLimitExceededException
+from services.llm import LLMProviderFactory
 
 # Configure logging
 logging.basicConfig(
@@ -62,10 +73,18 @@ async def lifespan(app: FastAPI):
     init_db()
     logger.info("Database initialized")
     
+    # Warm provider connections without holding up startup
+    warmup_task = None
+    if settings.LLM_WARMUP_ON_STARTUP:
+        warmup_task = asyncio.create_task(LLMProviderFactory.warmup())
+    
     yield
     
     # Shutdown
     logger.info(f"Shutting down {settings.APP_NAME}")
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    await LLMProviderFactory.aclose_all()
 
 
 # Create FastAPI application
@@ -76,6 +95,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -97,7 +117,7 @@ app.add_middleware(
 async def app_exception_handler(request: Request, exc: BaseAppException):
     """Handle application-specific exceptions."""
     logger.error(f"Application error: {exc.message}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
         content=exc.to_dict()
     )
@@ -107,12 +127,21 @@ async def app_exception_handler(request: Request, exc: BaseAppException):
 async def auth_exception_handler(request: Request, exc: AuthenticationException):
     """Handle authentication exceptions."""
     logger.warning(f"Authentication error: {exc.message}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_401_UNAUTHORIZED,
         content=exc.to_dict()
     )
 
 
+@app.exception_handler(TierLimitExceededException)
+async def tier_limit_exception_handler(request: Request, exc: TierLimitExceededException):
+    """Handle tier limit rejections (same body shape as HTTPException)."""
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail}
+    )
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle request validation errors."""
@@ -124,7 +153,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "type": error["type"]
         })
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": True,
@@ -139,7 +168,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions."""
     logger.exception(f"Unexpected error: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": True,
@@ -210,7 +239,6 @@ app.include_router(
 )
 
 # Ollama model management routes
-from api.routes.ollama_model_routes import router as ollama_model_router
 app.include_router(
     ollama_model_router,
     prefix="/api/models/ollama",
@@ -261,5 +289,7 @@ if __name__ == "__main__":
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
-        log_level=settings.LOG_LEVEL.lower()
+        log_level=settings.LOG_LEVEL.lower(),
+        proxy_headers=True,
+        forwarded_allow_ips=settings.FORWARDED_ALLOW_IPS
     )
\ No newline at end of file
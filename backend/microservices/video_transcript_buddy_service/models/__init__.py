@@ -3,7 +3,7 @@ Database Models - SQLAlchemy ORM models for users, subscriptions, usage tracking
 """
 
 from .user import User
-from .subscription import TierName, TierLimits, Subscription, SubscriptionStatus, TIERS, get_tier_limits
+from .subscription import TierName, TierRank, TIER_RANKS, TierLimits, Subscription, SubscriptionStatus, TIERS, TIER_MAX_BYTES, get_tier_limits
 from .usage import UsageType, UsageRecord
 from .conversation import Conversation
 from .transcript import Transcript
@@ -13,10 +13,13 @@ from .ollama_model import OllamaModel, conversation_models, RECOMMENDED_MODELS
 __all__ = [
     "User",
     "TierName",
+    "TierRank",
+    "TIER_RANKS",
     "TierLimits",
     "Subscription",
     "SubscriptionStatus",
     "TIERS",
+    "TIER_MAX_BYTES",
     "get_tier_limits",
     "UsageType",
     "UsageRecord",
@@ -7,7 +7,7 @@ from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Float, Boo
 from sqlalchemy.orm import relationship
 import uuid
 
-from config.database import Base
+from config.database import Base, GUID
 
 
 class Conversation(Base):
@@ -17,7 +17,7 @@ class Conversation(Base):
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String(255), nullable=False)
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(GUID, ForeignKey("users.id"), nullable=False, index=True)
     description = Column(String(500), nullable=True)
     
     # LLM Settings - allows per-conversation model configuration
@@ -48,31 +48,50 @@ class Conversation(Base):
     user = relationship("User", back_populates="conversations")
     transcripts = relationship("Transcript", back_populates="conversation", cascade="all, delete-orphan")
     
+    # Columns read by row_to_dict, for column-only selects
+    DICT_COLUMNS = (
+        "id", "name", "user_id", "description",
+        "llm_provider", "llm_model", "llm_temperature", "llm_base_url",
+        "mcp_server_id", "is_locked", "lock_reason", "locked_at",
+        "file_count", "query_count", "total_size_bytes",
+        "created_at", "updated_at", "last_activity_at",
+    )
+    
     def to_dict(self):
         """Convert to dictionary."""
+        return self.row_to_dict(self)
+    
+    @staticmethod
+    def row_to_dict(row) -> dict:
+        """
+        Build the API dictionary from any object with conversation column attributes.
+        
+        Accepts a Conversation instance or a Row from a column select,
+        so list queries can skip building ORM entities.
+        """
         return {
-            "id": self.id,
-            "name": self.name,
-            "user_id": self.user_id,
-            "description": self.description,
+            "id": row.id,
+            "name": row.name,
+            "user_id": row.user_id,
+            "description": row.description,
             # LLM Settings
-            "llm_provider": self.llm_provider,
-            "llm_model": self.llm_model,
-            "llm_temperature": self.llm_temperature,
-            "llm_base_url": self.llm_base_url,
+            "llm_provider": row.llm_provider,
+            "llm_model": row.llm_model,
+            "llm_temperature": row.llm_temperature,
+            "llm_base_url": row.llm_base_url,
             # MCP
-            "mcp_server_id": self.mcp_server_id,
+            "mcp_server_id": row.mcp_server_id,
             # Lock status
-            "is_locked": self.is_locked,
-            "lock_reason": self.lock_reason,
-            "locked_at": self.locked_at.isoformat() if self.locked_at else None,
+            "is_locked": row.is_locked,
+            "lock_reason": row.lock_reason,
+            "locked_at": row.locked_at.isoformat() if row.locked_at else None,
             # Statistics
-            "file_count": self.file_count,
-            "query_count": self.query_count,
-            "total_size_mb": round(self.total_size_bytes / (1024 * 1024), 2),
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "last_activity_at": self.last_activity_at.isoformat() if self.last_activity_at else None,
+            "file_count": row.file_count,
+            "query_count": row.query_count,
+            "total_size_mb": round(row.total_size_bytes / (1024 * 1024), 2),
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+            "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+            "last_activity_at": row.last_activity_at.isoformat() if row.last_activity_at else None,
         }
     
     @staticmethod
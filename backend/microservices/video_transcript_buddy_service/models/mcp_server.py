@@ -4,13 +4,13 @@ MCP Server Model - Database model for user MCP server configurations.
 MCP (Model Context Protocol) servers allow users to connect external tools and data sources.
 """
 
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Text, Enum as SQLEnum
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from enum import Enum
 import uuid
 
-from config.database import Base
+from config.database import Base, GUID
 
 
 class MCPServerStatus(str, Enum):
@@ -27,7 +27,7 @@ class MCPServer(Base):
     __tablename__ = "mcp_servers"
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(GUID, ForeignKey("users.id"), nullable=False, index=True)
     
     # Server configuration
     name = Column(String(100), nullable=False)
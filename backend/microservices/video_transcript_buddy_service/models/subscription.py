@@ -2,13 +2,14 @@
 Subscription Model - Tier definitions with limits and pricing.
 """
 
-from enum import Enum
+from enum import Enum, IntEnum
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
 from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 
-from config.database import Base
+from config.database import Base, GUID
 
 
 class TierName(str, Enum):
@@ -19,6 +20,18 @@ class TierName(str, Enum):
     ENTERPRISE = "ENTERPRISE"
 
 
+class TierRank(IntEnum):
+    """Tier ordering, so access checks are integer comparisons."""
+    FREE = 0
+    STARTER = 1
+    PRO = 2
+    ENTERPRISE = 3
+
+
+# Rank per tier name as stored on users.tier; unknown names rank as FREE
+TIER_RANKS = {rank.name: rank for rank in TierRank}
+
+
 class SubscriptionStatus(str, Enum):
     """Subscription status."""
     ACTIVE = "ACTIVE"
@@ -31,8 +44,8 @@ class Subscription(Base):
     """SQLAlchemy model for user subscriptions."""
     __tablename__ = "subscriptions"
     
-    id = Column(String, primary_key=True)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
+    id = Column(GUID, primary_key=True)
+    user_id = Column(GUID, ForeignKey("users.id"), nullable=False, index=True)
     tier = Column(SQLEnum(TierName), nullable=False, default=TierName.FREE)
     status = Column(SQLEnum(SubscriptionStatus), nullable=False, default=SubscriptionStatus.ACTIVE)
     start_date = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -152,6 +165,11 @@ TIERS = {
 }
 
 
+# Max upload size per tier name, for the per-request file size check
+TIER_MAX_BYTES = {tier.value: limits.max_file_size_bytes for tier, limits in TIERS.items()}
+
+
+@lru_cache(maxsize=16)
 def get_tier_limits(tier_name: str) -> TierLimits:
     """Get limits for a tier by name."""
     try:
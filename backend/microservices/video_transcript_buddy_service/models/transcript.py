@@ -2,10 +2,10 @@
 Transcript Model - Database model for transcript metadata.
 """
 
-from sqlalchemy import Column, String, Integer, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, Boolean, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from config.database import Base
+from config.database import Base, GUID
 import uuid
 
 
@@ -17,7 +17,7 @@ class Transcript(Base):
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     filename = Column(String, nullable=False, index=True)
     original_filename = Column(String, nullable=False)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(GUID, ForeignKey("users.id"), nullable=False)  # Leading column of ix_transcripts_user_created
     conversation_id = Column(String, ForeignKey("conversations.id"), nullable=False, index=True)
     
     # File metadata
@@ -45,6 +45,11 @@ class Transcript(Base):
     # Relationships
     conversation = relationship("Conversation", back_populates="transcripts")
     
+    __table_args__ = (
+        # Per-user listings, newest first
+        Index("ix_transcripts_user_created", user_id, created_at.desc()),
+    )
+    
     def to_dict(self):
         """Convert to dictionary."""
         return {
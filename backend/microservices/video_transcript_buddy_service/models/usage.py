@@ -4,11 +4,11 @@ Usage Model - Track uploads, queries, and costs per user.
 
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, String, DateTime, Integer, Float, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, Integer, Float, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 import uuid
 
-from config.database import Base
+from config.database import Base, GUID
 
 
 class UsageType(str, Enum):
@@ -24,8 +24,8 @@ class UsageRecord(Base):
     
     __tablename__ = "usage_records"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    id = Column(GUID, primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(GUID, ForeignKey("users.id"), nullable=False)  # Leading column of the composite indexes
     
     # Usage details
     usage_type = Column(String(20), nullable=False)  # UPLOAD, QUERY_SIMPLE, QUERY_COMPLEX, TRANSCRIPTION
@@ -45,5 +45,12 @@ class UsageRecord(Base):
     # Relationships
     user = relationship("User", back_populates="usage_records")
     
+    __table_args__ = (
+        # Per-user time range scans and per-type aggregations. Migration 0003
+        # builds the same shape on the migrated schema's `timestamp` column.
+        Index("ix_usage_records_user_created", user_id, created_at.desc()),
+        Index("ix_usage_records_user_type_created", user_id, usage_type, created_at),
+    )
+    
     def __repr__(self):
         return f"<UsageRecord {self.usage_type} ${self.total_cost:.2f}>"
\ No newline at end of file
@@ -7,7 +7,7 @@ from sqlalchemy import Column, String, DateTime, Boolean, Integer, ForeignKey, T
 from sqlalchemy.orm import relationship
 import uuid
 
-from config.database import Base
+from config.database import Base, GUID
 
 
 class User(Base):
@@ -15,7 +15,7 @@ class User(Base):
     
     __tablename__ = "users"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(GUID, primary_key=True, default=lambda: str(uuid.uuid4()))
     email = Column(String(255), unique=True, nullable=False, index=True)
     hashed_password = Column(String(255), nullable=False)
     full_name = Column(String(255), nullable=True)
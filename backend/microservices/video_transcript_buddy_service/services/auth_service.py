@@ -4,11 +4,12 @@ Auth Service - User registration, login, and token management.
 
 import logging
 from typing import Optional, Dict, Any
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from .interfaces.auth_service_interface import IAuthService
 from models.user import User
-from utils.auth_utils import hash_password, verify_password, create_access_token, create_refresh_token, decode_token
+from utils.auth_utils import hash_password, _password_cache, create_access_token, create_refresh_token, decode_token, _token_cache
 from utils.id_encryption import generate_user_encryption_key
 from common.exceptions import ValidationException, AuthenticationException
 
@@ -16,16 +17,19 @@ logger = logging.getLogger(__name__)
 
 
 class AuthService(IAuthService):
-    """Service for authentication operations."""
+    """
+    Service for authentication operations.
     
-    def __init__(self, db: Session):
-        self.db = db
+    Stateless: the DB session is passed to each call, so one instance is
+    shared across requests.
+    """
     
-    def register(self, email: str, password: str, full_name: Optional[str] = None) -> User:
+    def register(self, db: Session, email: str, password: str, full_name: Optional[str] = None) -> User:
         """
         Register a new user.
         
         Args:
+            db: Database session
             email: User email
             password: Plain text password
             full_name: Optional full name
@@ -36,12 +40,7 @@ class AuthService(IAuthService):
         Raises:
             ValidationException: If email already exists
         """
-        # Check if email exists
-        existing = self.db.query(User).filter(User.email == email.lower()).first()
-        if existing:
-            raise ValidationException("Email already registered", field="email")
-        
-        # Create user with encryption key
+        # Create user with encryption key; the unique email index rejects duplicates
         user = User(
             email=email.lower(),
             hashed_password=hash_password(password),
@@ -50,18 +49,23 @@ class AuthService(IAuthService):
             encryption_key=generate_user_encryption_key()  # Per-user key for ID obfuscation
         )
         
-        self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        db.add(user)
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise ValidationException("Email already registered", field="email")
+        db.refresh(user)
         
         logger.info(f"User registered: {user.email}")
         return user
     
-    def login(self, email: str, password: str) -> Dict[str, Any]:
+    def login(self, db: Session, email: str, password: str) -> Dict[str, Any]:
         """
         Authenticate user and return tokens.
         
         Args:
+            db: Database session
             email: User email
             password: Plain text password
             
@@ -71,23 +75,34 @@ class AuthService(IAuthService):
         Raises:
             AuthenticationException: If credentials invalid
         """
-        user = self.db.query(User).filter(User.email == email.lower()).first()
+        user = db.query(User).filter(User.email == email.lower()).first()
         
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not _password_cache.verify(password, user.hashed_password):
             raise AuthenticationException("Invalid email or password")
         
         if not user.is_active:
             raise AuthenticationException("Account is deactivated")
         
-        # Generate tokens
-        access_token = create_access_token(user.id)
-        refresh_token = create_refresh_token(user.id)
-        
         logger.info(f"User logged in: {user.email}")
         
+        return self.issue_tokens(user)
+    
+    def issue_tokens(self, user: User) -> Dict[str, Any]:
+        """
+        Issue access and refresh tokens for an already authenticated user.
+        
+        Used by login after the password check, and directly after
+        registration where the credentials were just set.
+        
+        Args:
+            user: Authenticated user
+            
+        Returns:
+            Dict with access_token, refresh_token, user info
+        """
         return {
-            "access_token": access_token,
-            "refresh_token": refresh_token,
+            "access_token": create_access_token(user.id, claims=self._token_claims(user)),
+            "refresh_token": create_refresh_token(user.id),
             "token_type": "bearer",
             "user": {
                 "id": user.id,
@@ -97,11 +112,12 @@ class AuthService(IAuthService):
             }
         }
     
-    def refresh_tokens(self, refresh_token: str) -> Dict[str, str]:
+    def refresh_tokens(self, db: Session, refresh_token: str) -> Dict[str, str]:
         """
         Refresh access token using refresh token.
         
         Args:
+            db: Database session
             refresh_token: Valid refresh token
             
         Returns:
@@ -116,23 +132,40 @@ class AuthService(IAuthService):
             raise AuthenticationException("Invalid refresh token")
         
         user_id = payload.get("sub")
-        user = self.db.query(User).filter(User.id == user_id).first()
+        user = db.query(User).filter(User.id == user_id).first()
         
         if not user or not user.is_active:
             raise AuthenticationException("User not found or inactive")
         
-        new_access_token = create_access_token(user.id)
+        new_access_token = create_access_token(user.id, claims=self._token_claims(user))
         
         return {
             "access_token": new_access_token,
             "token_type": "bearer"
         }
     
-    def get_current_user(self, token: str) -> User:
+    @staticmethod
+    def _token_claims(user: User) -> Dict[str, Any]:
+        """Identity claims embedded in access tokens."""
+        return {"email": user.email, "tier": user.tier}
+    
+    def get_current_user(self, db: Session, token: str) -> User:
         """
         Get user from access token.
         
+        Recently seen tokens are served from an in-memory cache without
+        decoding, and tokens carrying email/tier claims are trusted without
+        a DB query. In both cases the returned User is detached and carries
+        only id, email, tier and is_active; other columns read as None, so
+        load the row (db.get(User, user.id)) when more is needed.
+        
+        Because claims are trusted, deactivating a user or changing their
+        tier only takes effect for claim-carrying tokens once those expire
+        (ACCESS_TOKEN_EXPIRE_MINUTES). There is no server-side revocation,
+        so privileged checks (e.g. admin routes) must reload the user row.
+        
         Args:
+            db: Database session
             token: JWT access token
             
         Returns:
@@ -141,15 +174,29 @@ class AuthService(IAuthService):
         Raises:
             AuthenticationException: If token invalid
         """
+        cached = _token_cache.get(token)
+        if cached is not None:
+            return User(**cached, is_active=True)
+        
         payload = decode_token(token)
         
         if not payload or payload.get("type") != "access":
             raise AuthenticationException("Invalid access token")
         
         user_id = payload.get("sub")
-        user = self.db.query(User).filter(User.id == user_id).first()
+        
+        # Signed claims stand in for the user row (valid until the token expires)
+        if "email" in payload and "tier" in payload:
+            return User(id=user_id, email=payload["email"], tier=payload["tier"], is_active=True)
+        
+        user = db.query(User).filter(User.id == user_id).first()
         
         if not user or not user.is_active:
             raise AuthenticationException("User not found or inactive")
         
+        _token_cache.set(
+            token,
+            {"id": user.id, "email": user.email, "tier": user.tier},
+            token_exp=payload.get("exp")
+        )
         return user
@@ -3,7 +3,8 @@ Conversation Service - Business logic for conversation/collection management.
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from datetime import datetime
 
@@ -98,13 +99,52 @@ class ConversationService:
         db: Session,
         user_id: str
     ) -> List[Dict[str, Any]]:
-        """List all conversations for a user."""
-        conversations = db.query(Conversation)\
-            .filter(Conversation.user_id == user_id)\
-            .order_by(Conversation.last_activity_at.desc())\
-            .all()
+        """
+        List all conversations for a user.
+        
+        Stats are denormalized on the conversation row, so one column
+        select covers the whole listing without loading ORM entities.
+        """
+        rows = db.execute(
+            select(*(getattr(Conversation, name) for name in Conversation.DICT_COLUMNS))
+            .where(Conversation.user_id == user_id)
+            .order_by(Conversation.last_activity_at.desc())
+        ).all()
+        
+        return [Conversation.row_to_dict(row) for row in rows]
+    
+    def get_list_version(self, db: Session, user_id: str) -> Tuple[Any, ...]:
+        """
+        Get values that change whenever the user's conversation list changes.
         
-        return [conv.to_dict() for conv in conversations]
+        One aggregate query: latest updated_at, conversation count (catches
+        deletes) and the user's key rotation time (encrypted IDs change).
+        """
+        key_rotated_at = select(User.encryption_key_rotated_at)\
+            .where(User.id == user_id)\
+            .scalar_subquery()
+        row = db.execute(
+            select(
+                func.max(Conversation.updated_at),
+                func.count(Conversation.id),
+                key_rotated_at
+            ).where(Conversation.user_id == user_id)
+        ).one()
+        return tuple(row)
+    
+    def get_conversation_version(
+        self,
+        db: Session,
+        conversation_id: str,
+        user_id: str
+    ) -> Optional[Tuple[Any, ...]]:
+        """Get values that change whenever a conversation changes, or None if not found."""
+        row = db.execute(
+            select(Conversation.updated_at, User.encryption_key_rotated_at)
+            .join(User, User.id == Conversation.user_id)
+            .where(Conversation.id == conversation_id, Conversation.user_id == user_id)
+        ).first()
+        return tuple(row) if row else None
     
     def get_conversation(
         self,
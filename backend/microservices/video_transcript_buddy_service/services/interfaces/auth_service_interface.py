@@ -4,6 +4,7 @@ Auth Service Interface - Abstract base class for authentication operations.
 
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any
+from sqlalchemy.orm import Session
 
 from models.user import User
 
@@ -12,11 +13,12 @@ class IAuthService(ABC):
     """Interface for authentication service operations."""
     
     @abstractmethod
-    def register(self, email: str, password: str, full_name: Optional[str] = None) -> User:
+    def register(self, db: Session, email: str, password: str, full_name: Optional[str] = None) -> User:
         """
         Register a new user.
         
         Args:
+            db: Database session
             email: User email
             password: Plain text password
             full_name: Optional full name
@@ -27,11 +29,12 @@ class IAuthService(ABC):
         pass
     
     @abstractmethod
-    def login(self, email: str, password: str) -> Dict[str, Any]:
+    def login(self, db: Session, email: str, password: str) -> Dict[str, Any]:
         """
         Authenticate user and return tokens.
         
         Args:
+            db: Database session
             email: User email
             password: Plain text password
             
@@ -41,11 +44,25 @@ class IAuthService(ABC):
         pass
     
     @abstractmethod
-    def refresh_tokens(self, refresh_token: str) -> Dict[str, str]:
+    def issue_tokens(self, user: User) -> Dict[str, Any]:
+        """
+        Issue access and refresh tokens for an already authenticated user.
+        
+        Args:
+            user: Authenticated user
+            
+        Returns:
+            Dict with access_token, refresh_token, user info
+        """
+        pass
+    
+    @abstractmethod
+    def refresh_tokens(self, db: Session, refresh_token: str) -> Dict[str, str]:
         """
         Refresh access token using refresh token.
         
         Args:
+            db: Database session
             refresh_token: Valid refresh token
             
         Returns:
@@ -54,11 +71,12 @@ class IAuthService(ABC):
         pass
     
     @abstractmethod
-    def get_current_user(self, token: str) -> User:
+    def get_current_user(self, db: Session, token: str) -> User:
         """
         Get user from access token.
         
         Args:
+            db: Database session
             token: JWT access token
             
         Returns:
@@ -74,7 +74,8 @@ class IUsageService(ABC):
     def check_limit(
         self,
         user_id: str,
-        usage_type: str
+        usage_type: str,
+        tier: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Check if user is within tier limits.
@@ -82,6 +83,7 @@ class IUsageService(ABC):
         Args:
             user_id: User ID
             usage_type: UPLOAD or QUERY
+            tier: User's tier, if already known (skips the user lookup)
             
         Returns:
             Dict with allowed status and remaining quota
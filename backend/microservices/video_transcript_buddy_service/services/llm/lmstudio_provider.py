@@ -6,9 +6,10 @@ by default, making it easy to use as a drop-in replacement.
 """
 
 import logging
+import httpx
 from typing import List, Optional, Dict, Any
 
-from .provider_interface import LLMProvider, LLMProviderConfig, LLMResponse, ProviderType
+from .provider_interface import HTTP_LIMITS, LLMProvider, LLMProviderConfig, LLMResponse, ProviderType
 
 logger = logging.getLogger(__name__)
 
@@ -29,16 +30,17 @@ class LMStudioProvider(LLMProvider):
         return self.config.base_url or DEFAULT_LMSTUDIO_URL
     
     def _get_client(self):
-        """Lazy-load OpenAI client pointed at LM Studio."""
+        """Lazy-load the async OpenAI client pointed at LM Studio."""
         if self._client is None:
             try:
-                from openai import OpenAI
+                from openai import AsyncOpenAI
                 
                 # LM Studio uses OpenAI-compatible API
                 # No API key needed for local server
-                self._client = OpenAI(
+                self._client = AsyncOpenAI(
                     base_url=self.base_url,
-                    api_key="lm-studio"  # Placeholder, not validated
+                    api_key="lm-studio",  # Placeholder, not validated
+                    http_client=httpx.AsyncClient(limits=HTTP_LIMITS)
                 )
             except ImportError:
                 raise ImportError("openai package not installed. Run: pip install openai")
@@ -72,7 +74,7 @@ class LMStudioProvider(LLMProvider):
         try:
             client = self._get_client()
             
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model=self.config.model_name,
                 messages=messages,
                 temperature=temperature or self.config.temperature,
@@ -112,7 +114,7 @@ class LMStudioProvider(LLMProvider):
                 self.config.model_name
             )
             
-            response = client.embeddings.create(
+            response = await client.embeddings.create(
                 model=embedding_model,
                 input=text
             )
@@ -127,7 +129,7 @@ class LMStudioProvider(LLMProvider):
         try:
             client = self._get_client()
             # Try to list models
-            client.models.list()
+            await client.with_options(max_retries=0).models.list()  # Probe: fail fast, no retries
             return True
         except Exception as e:
             logger.debug(f"LM Studio not available: {e}")
@@ -137,7 +139,7 @@ class LMStudioProvider(LLMProvider):
         """List available LM Studio models."""
         try:
             client = self._get_client()
-            models = client.models.list()
+            models = await client.models.list()
             
             return [m.id for m in models.data]
         except Exception as e:
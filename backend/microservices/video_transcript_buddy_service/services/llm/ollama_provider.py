@@ -15,13 +15,32 @@ import logging
 import httpx
 from typing import List, Optional, Dict, Any
 
-from .provider_interface import LLMProvider, LLMProviderConfig, LLMResponse, ProviderType
+from .provider_interface import HTTP_LIMITS, LLMProvider, LLMProviderConfig, LLMResponse, ProviderType
 
 logger = logging.getLogger(__name__)
 
 # Default Ollama endpoint
 DEFAULT_OLLAMA_URL = "http://localhost:11434"
 
+# One keep-alive pool shared by every OllamaProvider; timeouts are set per request
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(limits=HTTP_LIMITS)
+    return _http_client
+
+
+async def aclose_http_client() -> None:
+    """Close the shared HTTP client (call at application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class OllamaProvider(LLMProvider):
     """Ollama local LLM provider implementation."""
@@ -74,10 +93,10 @@ class OllamaProvider(LLMProvider):
             if max_tokens or self.config.max_tokens:
                 payload["options"]["num_predict"] = max_tokens or self.config.max_tokens
             
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
-                data = response.json()
+            client = _get_http_client()
+            response = await client.post(url, json=payload, timeout=120.0)
+            response.raise_for_status()
+            data = response.json()
             
             return LLMResponse(
                 content=data.get("message", {}).get("content", ""),
@@ -114,10 +133,10 @@ class OllamaProvider(LLMProvider):
                 "prompt": text
             }
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
-                data = response.json()
+            client = _get_http_client()
+            response = await client.post(url, json=payload, timeout=60.0)
+            response.raise_for_status()
+            data = response.json()
             
             return data.get("embedding", [])
         except httpx.ConnectError:
@@ -132,9 +151,9 @@ class OllamaProvider(LLMProvider):
         try:
             url = f"{self.base_url}/api/tags"
             
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(url)
-                return response.status_code == 200
+            client = _get_http_client()
+            response = await client.get(url, timeout=5.0)
+            return response.status_code == 200
         except Exception as e:
             logger.debug(f"Ollama not available: {e}")
             return False
@@ -144,10 +163,10 @@ class OllamaProvider(LLMProvider):
         try:
             url = f"{self.base_url}/api/tags"
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            client = _get_http_client()
+            response = await client.get(url, timeout=10.0)
+            response.raise_for_status()
+            data = response.json()
             
             models = [model.get("name", "") for model in data.get("models", [])]
             return sorted(models)
@@ -170,9 +189,9 @@ class OllamaProvider(LLMProvider):
             
             payload = {"name": model_name, "stream": False}
             
-            async with httpx.AsyncClient(timeout=None) as client:  # No timeout for downloads
-                response = await client.post(url, json=payload)
-                return response.status_code == 200
+            client = _get_http_client()
+            response = await client.post(url, json=payload, timeout=None)  # No timeout for downloads
+            return response.status_code == 200
         except Exception as e:
             logger.error(f"Failed to pull Ollama model {model_name}: {e}")
             return False
@@ -3,9 +3,10 @@ OpenAI Provider - Implementation for OpenAI API.
 """
 
 import logging
+import httpx
 from typing import List, Optional, Dict, Any
 
-from .provider_interface import LLMProvider, LLMProviderConfig, LLMResponse, ProviderType
+from .provider_interface import HTTP_LIMITS, LLMProvider, LLMProviderConfig, LLMResponse, ProviderType
 
 logger = logging.getLogger(__name__)
 
@@ -18,10 +19,10 @@ class OpenAIProvider(LLMProvider):
         return ProviderType.OPENAI
     
     def _get_client(self):
-        """Lazy-load OpenAI client."""
+        """Lazy-load the async OpenAI client (keep-alive connection pool)."""
         if self._client is None:
             try:
-                from openai import OpenAI
+                from openai import AsyncOpenAI
                 
                 api_key = self.config.api_key
                 if not api_key:
@@ -31,7 +32,10 @@ class OpenAIProvider(LLMProvider):
                 if not api_key:
                     raise ValueError("OpenAI API key not configured")
                 
-                self._client = OpenAI(api_key=api_key)
+                self._client = AsyncOpenAI(
+                    api_key=api_key,
+                    http_client=httpx.AsyncClient(limits=HTTP_LIMITS)
+                )
             except ImportError:
                 raise ImportError("openai package not installed. Run: pip install openai")
         
@@ -64,7 +68,7 @@ class OpenAIProvider(LLMProvider):
         try:
             client = self._get_client()
             
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model=self.config.model_name,
                 messages=messages,
                 temperature=temperature or self.config.temperature,
@@ -100,7 +104,7 @@ class OpenAIProvider(LLMProvider):
                 settings.OPENAI_EMBEDDING_MODEL
             )
             
-            response = client.embeddings.create(
+            response = await client.embeddings.create(
                 model=embedding_model,
                 input=text
             )
@@ -115,7 +119,7 @@ class OpenAIProvider(LLMProvider):
         try:
             client = self._get_client()
             # Quick test - list models
-            client.models.list()
+            await client.with_options(max_retries=0).models.list()  # Probe: fail fast, no retries
             return True
         except Exception as e:
             logger.warning(f"OpenAI not available: {e}")
@@ -125,7 +129,7 @@ class OpenAIProvider(LLMProvider):
         """List available OpenAI models."""
         try:
             client = self._get_client()
-            models = client.models.list()
+            models = await client.models.list()
             
             # Filter for chat models
             chat_models = [
@@ -2,16 +2,27 @@
 LLM Provider Factory - Create and manage LLM provider instances.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Optional, Dict, List, Any
+from collections import OrderedDict
+from typing import Optional, Dict, List, Any, Tuple
 
 from .provider_interface import LLMProvider, LLMProviderConfig, ProviderType
 from .openai_provider import OpenAIProvider
 from .ollama_provider import OllamaProvider
 from .lmstudio_provider import LMStudioProvider
+from .ollama_provider import aclose_http_client
 
 logger = logging.getLogger(__name__)
 
+# Per-provider limits for detect_available_providers; cloud gets more headroom
+PROBE_TIMEOUT_SECONDS = 1.5
+CLOUD_PROBE_TIMEOUT_SECONDS = 5.0
+
+# Evicted pool providers are closed after a grace period, so calls still using them can finish
+EVICTED_PROVIDER_CLOSE_DELAY_SECONDS = 30.0
+
 
 class LLMProviderFactory:
     """
@@ -22,6 +33,11 @@ class LLMProviderFactory:
     
     _instances: Dict[str, LLMProvider] = {}
     
+    # Model-agnostic providers reused for listing/probing, keyed by endpoint and key
+    _pool: "OrderedDict[Tuple[str, str, str], LLMProvider]" = OrderedDict()
+    _pool_max_size = 32
+    _evicted: Dict[LLMProvider, "asyncio.Task[None]"] = {}  # awaiting delayed close
+    
     @classmethod
     def create(cls, config: LLMProviderConfig) -> LLMProvider:
         """
@@ -64,81 +80,195 @@ class LLMProviderFactory:
         
         return cls._instances[cache_key]
     
+    @classmethod
+    def get_or_create_provider(cls, config: LLMProviderConfig) -> LLMProvider:
+        """
+        Get a pooled provider for model-agnostic calls (list_models, is_available).
+        
+        Keyed by (provider_type, base_url, api key hash), so repeat calls reuse
+        the provider's client and its keep-alive connections. The model name
+        is not part of the key; use get_or_create for generation.
+        
+        Args:
+            config: Provider configuration
+            
+        Returns:
+            Pooled LLMProvider instance
+        """
+        api_key_hash = hashlib.sha256(config.api_key.encode("utf-8")).hexdigest() if config.api_key else ""
+        pool_key = (config.provider_type.value, config.base_url or "default", api_key_hash)
+        
+        provider = cls._pool.get(pool_key)
+        if provider is None:
+            provider = cls.create(config)
+            cls._pool[pool_key] = provider
+            # Custom endpoints come from user input; keep the pool bounded
+            while len(cls._pool) > cls._pool_max_size:
+                _, evicted = cls._pool.popitem(last=False)
+                cls._schedule_close(evicted)
+        else:
+            cls._pool.move_to_end(pool_key)
+        return provider
+    
+    @classmethod
+    def _schedule_close(cls, provider: LLMProvider) -> None:
+        """Close an evicted provider's client in the background after a grace period."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop (sync caller); the client is released when collected
+        
+        async def _close_later() -> None:
+            await asyncio.sleep(EVICTED_PROVIDER_CLOSE_DELAY_SECONDS)
+            cls._evicted.pop(provider, None)
+            try:
+                await provider.aclose()
+            except Exception as e:
+                logger.debug(f"Failed to close evicted {provider.provider_type.value} provider: {e}")
+        
+        cls._evicted[provider] = loop.create_task(_close_later())
+    
     @classmethod
     def clear_cache(cls):
         """Clear all cached provider instances."""
         cls._instances.clear()
+        cls._pool.clear()
+    
+    @classmethod
+    async def aclose_all(cls) -> None:
+        """Close clients held by cached providers and the shared Ollama client (call at shutdown)."""
+        for task in cls._evicted.values():
+            task.cancel()
+        for provider in [*cls._instances.values(), *cls._pool.values(), *cls._evicted]:
+            try:
+                await provider.aclose()
+            except Exception as e:
+                logger.debug(f"Failed to close {provider.provider_type.value} provider: {e}")
+        cls.clear_cache()
+        cls._evicted.clear()
+        await aclose_http_client()
+    
+    @classmethod
+    async def warmup(cls) -> None:
+        """
+        Open connections to the default provider endpoints ahead of traffic.
+        
+        Runs a cheap availability check against each pooled provider so the
+        TLS handshake and keep-alive connection are already in place for the
+        first real request. Failures are ignored; a down provider just stays cold.
+        """
+        from config.settings import settings
+        
+        targets = [
+            (LLMProviderConfig.ollama(), PROBE_TIMEOUT_SECONDS),
+            (LLMProviderConfig.lmstudio(), PROBE_TIMEOUT_SECONDS),
+        ]
+        if settings.OPENAI_API_KEY:
+            targets.insert(0, (LLMProviderConfig.openai(), CLOUD_PROBE_TIMEOUT_SECONDS))
+        
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(cls.get_or_create_provider(config).is_available(), timeout)
+                for config, timeout in targets
+            ),
+            return_exceptions=True
+        )
+        
+        warmed = [
+            config.provider_type.value
+            for (config, _), result in zip(targets, results)
+            if result is True
+        ]
+        logger.info(f"LLM provider warmup complete: {', '.join(warmed) or 'none reachable'}")
     
     @classmethod
     async def detect_available_providers(cls) -> List[Dict[str, Any]]:
         """
         Detect which LLM providers are available.
         
+        Providers are probed concurrently, each under its own timeout, so
+        the call takes as long as the slowest probe rather than the sum and
+        a down local server can't stall it.
+        
         Returns:
             List of available provider info dicts
         """
-        available = []
+        from config.settings import settings
         
-        # Check OpenAI
-        try:
-            from config.settings import settings
-            if settings.OPENAI_API_KEY:
-                openai_config = LLMProviderConfig.openai()
-                openai_provider = cls.create(openai_config)
-                if await openai_provider.is_available():
-                    models = await openai_provider.list_models()
-                    available.append({
-                        "provider": ProviderType.OPENAI.value,
-                        "name": "OpenAI",
-                        "description": "OpenAI GPT models (cloud)",
-                        "available": True,
-                        "models": models[:10],  # Limit to top 10
-                        "requires_api_key": True,
-                        "is_local": False
-                    })
-        except Exception as e:
-            logger.debug(f"OpenAI not available: {e}")
-        
-        # Check Ollama
-        try:
-            ollama_config = LLMProviderConfig.ollama()
-            ollama_provider = cls.create(ollama_config)
-            if await ollama_provider.is_available():
-                models = await ollama_provider.list_models()
-                available.append({
-                    "provider": ProviderType.OLLAMA.value,
-                    "name": "Ollama",
-                    "description": "Local LLM with Ollama (free, private)",
-                    "available": True,
-                    "models": models,
-                    "requires_api_key": False,
-                    "is_local": True,
-                    "endpoint": ollama_config.base_url
-                })
-        except Exception as e:
-            logger.debug(f"Ollama not available: {e}")
-        
-        # Check LM Studio
-        try:
-            lmstudio_config = LLMProviderConfig.lmstudio()
-            lmstudio_provider = cls.create(lmstudio_config)
-            if await lmstudio_provider.is_available():
-                models = await lmstudio_provider.list_models()
-                available.append({
-                    "provider": ProviderType.LMSTUDIO.value,
-                    "name": "LM Studio",
-                    "description": "Local LLM with LM Studio (free, private)",
-                    "available": True,
-                    "models": models,
-                    "requires_api_key": False,
-                    "is_local": True,
-                    "endpoint": lmstudio_config.base_url
-                })
-        except Exception as e:
-            logger.debug(f"LM Studio not available: {e}")
+        probes = [
+            (ProviderType.OLLAMA, cls._probe_ollama(), PROBE_TIMEOUT_SECONDS),
+            (ProviderType.LMSTUDIO, cls._probe_lmstudio(), PROBE_TIMEOUT_SECONDS),
+        ]
+        if settings.OPENAI_API_KEY:
+            probes.insert(0, (ProviderType.OPENAI, cls._probe_openai(), CLOUD_PROBE_TIMEOUT_SECONDS))
+        
+        results = await asyncio.gather(
+            *(asyncio.wait_for(probe, timeout) for _, probe, timeout in probes),
+            return_exceptions=True
+        )
         
+        available = []
+        for (provider_type, _, _), result in zip(probes, results):
+            if isinstance(result, BaseException):
+                logger.debug(f"{provider_type.value} not available: {result!r}")
+            elif result is not None:
+                available.append(result)
         return available
-
+    
+    @classmethod
+    async def _probe_openai(cls) -> Optional[Dict[str, Any]]:
+        """Probe OpenAI; None if unavailable."""
+        openai_provider = cls.get_or_create_provider(LLMProviderConfig.openai())
+        if not await openai_provider.is_available():
+            return None
+        models = await openai_provider.list_models()
+        return {
+            "provider": ProviderType.OPENAI.value,
+            "name": "OpenAI",
+            "description": "OpenAI GPT models (cloud)",
+            "available": True,
+            "models": models[:10],  # Limit to top 10
+            "requires_api_key": True,
+            "is_local": False
+        }
+    
+    @classmethod
+    async def _probe_ollama(cls) -> Optional[Dict[str, Any]]:
+        """Probe the local Ollama server; None if unavailable."""
+        ollama_config = LLMProviderConfig.ollama()
+        ollama_provider = cls.get_or_create_provider(ollama_config)
+        if not await ollama_provider.is_available():
+            return None
+        models = await ollama_provider.list_models()
+        return {
+            "provider": ProviderType.OLLAMA.value,
+            "name": "Ollama",
+            "description": "Local LLM with Ollama (free, private)",
+            "available": True,
+            "models": models,
+            "requires_api_key": False,
+            "is_local": True,
+            "endpoint": ollama_config.base_url
+        }
+    
+    @classmethod
+    async def _probe_lmstudio(cls) -> Optional[Dict[str, Any]]:
+        """Probe the local LM Studio server; None if unavailable."""
+        lmstudio_config = LLMProviderConfig.lmstudio()
+        lmstudio_provider = cls.get_or_create_provider(lmstudio_config)
+        if not await lmstudio_provider.is_available():
+            return None
+        models = await lmstudio_provider.list_models()
+        return {
+            "provider": ProviderType.LMSTUDIO.value,
+            "name": "LM Studio",
+            "description": "Local LLM with LM Studio (free, private)",
+            "available": True,
+            "models": models,
+            "requires_api_key": False,
+            "is_local": True,
+            "endpoint": lmstudio_config.base_url
+        }
 
 def get_llm_provider(
     provider_type: str = "openai",
@@ -2,11 +2,17 @@
 LLM Provider Interface - Base class for all LLM providers.
 """
 
+import inspect
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
+import httpx
+
+# Keep-alive limits for the HTTP clients providers hold; timeouts are set per request
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=30)
+
 
 class ProviderType(str, Enum):
     """Supported LLM provider types."""
@@ -170,6 +176,15 @@ class LLMProvider(ABC):
         self.config = config
         self._client = None
     
+    async def aclose(self) -> None:
+        """Release the provider's client connections, if it holds any."""
+        close = getattr(self._client, "close", None)
+        if close is not None:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        self._client = None
+    
     @property
     @abstractmethod
     def provider_type(self) -> ProviderType:
@@ -9,9 +9,12 @@ Handles:
 """
 
 import logging
+import threading
+import time
 import httpx
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from sqlalchemy import and_, exists, or_, select
 from sqlalchemy.orm import Session
 
 from models.ollama_model import OllamaModel, RECOMMENDED_MODELS, conversation_models
@@ -24,13 +27,23 @@ logger = logging.getLogger(__name__)
 OLLAMA_BASE_URL = "http://localhost:11434"
 OLLAMA_TAGS_URL = f"{OLLAMA_BASE_URL}/api/tags"
 
+# Model lists change on discovery/toggle, not per request
+MODEL_LIST_CACHE_TTL_SECONDS = 20.0
+
 
 class OllamaModelService:
     """Service for managing Ollama models."""
     
     def __init__(self):
         """Initialize the service."""
-        pass
+        # (include_disabled, installed_only) -> (expires_at, models)
+        self._model_list_cache: Dict[Tuple[bool, bool], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._model_list_lock = threading.Lock()
+    
+    def invalidate_model_list_cache(self) -> None:
+        """Drop cached model lists (call after models are added or changed)."""
+        with self._model_list_lock:
+            self._model_list_cache.clear()
     
     async def discover_models(self, db: Session) -> Dict[str, Any]:
         """
@@ -111,6 +124,7 @@ class OllamaModelService:
                 logger.info(f"Model no longer installed: {model.name}")
             
             db.commit()
+            self.invalidate_model_list_cache()
             
             return {
                 "success": True,
@@ -154,8 +168,14 @@ class OllamaModelService:
             installed_only: Only return currently installed models
             
         Returns:
-            List of model dictionaries
+            List of model dictionaries (cached briefly; treat as read-only)
         """
+        cache_key = (include_disabled, installed_only)
+        with self._model_list_lock:
+            cached = self._model_list_cache.get(cache_key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        
         query = db.query(OllamaModel)
         
         if not include_disabled:
@@ -171,7 +191,10 @@ class OllamaModelService:
             OllamaModel.name
         ).all()
         
-        return [m.to_dict() for m in models]
+        result = [m.to_dict() for m in models]
+        with self._model_list_lock:
+            self._model_list_cache[cache_key] = (time.monotonic() + MODEL_LIST_CACHE_TTL_SECONDS, result)
+        return result
     
     def get_enabled_models(self, db: Session) -> List[Dict[str, Any]]:
         """Get only enabled and installed models (for chat UI)."""
@@ -205,6 +228,7 @@ class OllamaModelService:
             model.is_enabled = enabled
         
         db.commit()
+        self.invalidate_model_list_cache()
         db.refresh(model)
         
         return {
@@ -263,12 +287,13 @@ class OllamaModelService:
         db: Session, 
         conversation_id: str,
         include_new: bool = True
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[List[Dict[str, Any]], int, int]:
         """
         Get models available for a conversation.
         
         Returns models that were linked when conversation was created,
-        plus optionally any new models discovered since then.
+        plus optionally any new models discovered since then. Both sets
+        come from one query; filtering and ordering happen in the DB.
         
         Args:
             db: Database session
@@ -276,55 +301,49 @@ class OllamaModelService:
             include_new: Also include newly discovered models not yet linked
             
         Returns:
-            List of model dictionaries with 'is_original' flag
+            Tuple of (model dictionaries with 'is_original'/'is_new' flags,
+            original count, new count)
         """
-        # Get originally linked models
-        original_query = db.query(OllamaModel).join(
-            conversation_models,
-            conversation_models.c.model_id == OllamaModel.id
-        ).filter(
+        is_original = exists().where(
             conversation_models.c.conversation_id == conversation_id,
-            OllamaModel.is_enabled == True
+            conversation_models.c.model_id == OllamaModel.id
         )
         
-        original_models = original_query.all()
-        original_ids = {m.id for m in original_models}
-        
-        result = []
-        for model in original_models:
-            model_dict = model.to_dict()
-            model_dict["is_original"] = True  # Was available at conversation creation
-            model_dict["is_new"] = False
-            result.append(model_dict)
-        
-        # Optionally add new models discovered after conversation creation
         if include_new:
-            conversation = db.query(Conversation).filter(
+            # New = enabled, installed and discovered after the conversation was created
+            created_at = select(Conversation.created_at).where(
                 Conversation.id == conversation_id
-            ).first()
-            
-            if conversation:
-                new_models = db.query(OllamaModel).filter(
-                    OllamaModel.id.notin_(original_ids),
-                    OllamaModel.is_enabled == True,
+            ).scalar_subquery()
+            membership = or_(
+                is_original,
+                and_(
                     OllamaModel.is_installed == True,
-                    OllamaModel.discovered_at > conversation.created_at
-                ).all()
-                
-                for model in new_models:
-                    model_dict = model.to_dict()
-                    model_dict["is_original"] = False
-                    model_dict["is_new"] = True  # Discovered after conversation
-                    result.append(model_dict)
+                    OllamaModel.discovered_at > created_at
+                )
+            )
+        else:
+            membership = is_original
         
         # Sort: recommended first, then original before new, then by name
-        result.sort(key=lambda m: (
-            not m.get("is_recommended", False),
-            not m.get("is_original", True),
-            m.get("name", "")
-        ))
+        rows = db.query(OllamaModel, is_original.label("is_original")).filter(
+            OllamaModel.is_enabled == True,
+            membership
+        ).order_by(
+            OllamaModel.is_recommended.desc(),
+            is_original.desc(),
+            OllamaModel.name
+        ).all()
         
-        return result
+        result = []
+        original_count = 0
+        for model, original in rows:
+            model_dict = model.to_dict()
+            model_dict["is_original"] = bool(original)  # Was available at conversation creation
+            model_dict["is_new"] = not original  # Discovered after conversation
+            original_count += model_dict["is_original"]
+            result.append(model_dict)
+        
+        return result, original_count, len(result) - original_count
     
     def add_model_to_conversation(
         self,
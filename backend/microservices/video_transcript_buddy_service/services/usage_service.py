@@ -3,10 +3,12 @@ Usage Service - Track uploads, queries, and costs per user.
 """
 
 import logging
-from typing import Optional, Dict, Any
+import threading
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy import func
 
 from .interfaces.usage_service_interface import IUsageService
 from models.user import User
@@ -29,6 +31,95 @@ PRICING = {
     "innovation_fee_percent": 0.15,
 }
 
+# Near a tier limit, cached counts are re-read from the database: another
+# worker's recent usage is invisible to this worker's cache until it expires.
+# "Near" means within this many uses, or this fraction of the limit if larger.
+LIMIT_RECOUNT_MARGIN = 5
+LIMIT_RECOUNT_FRACTION = 0.1
+
+# Usage types counted against each tier limit
+LIMIT_USAGE_TYPES = {
+    "UPLOAD": [UsageType.UPLOAD.value],
+    "QUERY": [UsageType.QUERY_SIMPLE.value, UsageType.QUERY_COMPLEX.value],
+}
+
+
+def _month_bounds(now: datetime) -> Tuple[str, datetime, datetime]:
+    """Return the period label and [start, end) datetimes of the month containing now."""
+    start = datetime(now.year, now.month, 1)
+    if now.month == 12:
+        end = datetime(now.year + 1, 1, 1)
+    else:
+        end = datetime(now.year, now.month + 1, 1)
+    return f"{now.year}-{now.month:02d}", start, end
+
+
+class UsageCounter:
+    """
+    In-process monthly usage counters keyed by (user_id, action, period).
+    
+    Counts are seeded from the database on first use and incremented as
+    usage is recorded, so limit checks don't have to rescan usage_records.
+    Entries expire after a short TTL so counts written by other workers
+    are picked up again.
+    """
+    
+    def __init__(self, ttl_seconds: int = 60, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._counts: Dict[Tuple[str, str, str], List] = {}  # key -> [count, expires_at]
+        self._lock = threading.Lock()
+    
+    def get(self, user_id: str, action: str, period: str) -> Optional[int]:
+        """Return the cached count, or None if missing or expired."""
+        key = (user_id, action, period)
+        with self._lock:
+            entry = self._counts.get(key)
+            if entry is None:
+                return None
+            if entry[1] < time.monotonic():
+                del self._counts[key]
+                return None
+            return entry[0]
+    
+    def set(self, user_id: str, action: str, period: str, count: int) -> None:
+        """Store a count read from the database."""
+        with self._lock:
+            if len(self._counts) >= self.max_entries:
+                self._evict()
+            self._counts[(user_id, action, period)] = [count, time.monotonic() + self.ttl_seconds]
+    
+    def increment(self, user_id: str, action: str, period: str, amount: int = 1) -> None:
+        """Bump a cached count; uncached counts are left to be seeded on next read."""
+        with self._lock:
+            entry = self._counts.get((user_id, action, period))
+            if entry is not None:
+                entry[0] += amount
+    
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop all counts for a user."""
+        with self._lock:
+            for key in [k for k in self._counts if k[0] == user_id]:
+                del self._counts[key]
+    
+    def clear(self) -> None:
+        """Drop all counts."""
+        with self._lock:
+            self._counts.clear()
+    
+    def _evict(self) -> None:
+        """Drop expired entries, or the oldest half if none have expired."""
+        now = time.monotonic()
+        expired = [k for k, v in self._counts.items() if v[1] < now]
+        if not expired:
+            expired = list(self._counts)[:len(self._counts) // 2]
+        for key in expired:
+            del self._counts[key]
+
+
+# Global counter instance
+_usage_counter = UsageCounter()
+
 
 class UsageService(IUsageService):
     """Service for tracking usage and costs."""
@@ -62,6 +153,7 @@ class UsageService(IUsageService):
         self.db.add(record)
         self.db.commit()
         self.db.refresh(record)
+        _usage_counter.increment(user_id, "UPLOAD", _month_bounds(record.created_at)[0])
         
         logger.info(f"Recorded upload for user {user_id}: {filename}")
         
@@ -104,6 +196,7 @@ class UsageService(IUsageService):
         self.db.add(record)
         self.db.commit()
         self.db.refresh(record)
+        _usage_counter.increment(user_id, "QUERY", _month_bounds(record.created_at)[0])
         
         logger.info(f"Recorded query for user {user_id}: {usage_type.value}")
         
@@ -124,63 +217,106 @@ class UsageService(IUsageService):
         now = datetime.utcnow()
         month = month or now.month
         year = year or now.year
+        period, start, end = _month_bounds(datetime(year, month, 1))
         
-        # Query usage records for the month
-        query = self.db.query(UsageRecord).filter(
+        # One grouped aggregate in SQL; a created_at range instead of extract()
+        # lets the (user_id, created_at) index select the rows
+        rows = self.db.query(
+            UsageRecord.usage_type,
+            func.count(),
+            func.coalesce(func.sum(UsageRecord.total_cost), 0.0)
+        ).filter(
             UsageRecord.user_id == user_id,
-            extract('month', UsageRecord.created_at) == month,
-            extract('year', UsageRecord.created_at) == year
-        )
-        
-        records = query.all()
+            UsageRecord.created_at >= start,
+            UsageRecord.created_at < end
+        ).group_by(UsageRecord.usage_type).all()
         
-        # Aggregate by type
-        uploads = [r for r in records if r.usage_type == UsageType.UPLOAD.value]
-        simple_queries = [r for r in records if r.usage_type == UsageType.QUERY_SIMPLE.value]
-        complex_queries = [r for r in records if r.usage_type == UsageType.QUERY_COMPLEX.value]
+        counts = {usage_type: count for usage_type, count, _ in rows}
+        costs = {usage_type: cost for usage_type, _, cost in rows}
         
-        total_cost = sum(r.total_cost for r in records)
+        simple_count = counts.get(UsageType.QUERY_SIMPLE.value, 0)
+        complex_count = counts.get(UsageType.QUERY_COMPLEX.value, 0)
+        query_cost = costs.get(UsageType.QUERY_SIMPLE.value, 0.0) + costs.get(UsageType.QUERY_COMPLEX.value, 0.0)
         
         return {
             "user_id": user_id,
-            "period": f"{year}-{month:02d}",
+            "period": period,
             "uploads": {
-                "count": len(uploads),
-                "cost": round(sum(r.total_cost for r in uploads), 2)
+                "count": counts.get(UsageType.UPLOAD.value, 0),
+                "cost": round(costs.get(UsageType.UPLOAD.value, 0.0), 2)
             },
             "queries": {
-                "simple_count": len(simple_queries),
-                "complex_count": len(complex_queries),
-                "total_count": len(simple_queries) + len(complex_queries),
-                "cost": round(sum(r.total_cost for r in simple_queries + complex_queries), 2)
+                "simple_count": simple_count,
+                "complex_count": complex_count,
+                "total_count": simple_count + complex_count,
+                "cost": round(query_cost, 2)
             },
-            "total_cost": round(total_cost, 2)
+            "total_cost": round(sum(costs.values()), 2)
         }
     
+    def count_usage(self, user_id: str, action: str, fresh: bool = False) -> int:
+        """
+        Count this month's usage for a limit action.
+        
+        Args:
+            user_id: User ID
+            action: UPLOAD or QUERY
+            fresh: Skip this worker's cached count and read the database
+            
+        Returns:
+            Number of matching usage records this month
+        """
+        period, start, end = _month_bounds(datetime.utcnow())
+        
+        if not fresh:
+            cached = _usage_counter.get(user_id, action, period)
+            if cached is not None:
+                return cached
+        
+        # Range filter + count(*) so the (user_id, usage_type, created_at) index covers it
+        count = self.db.query(func.count()).select_from(UsageRecord).filter(
+            UsageRecord.user_id == user_id,
+            UsageRecord.usage_type.in_(LIMIT_USAGE_TYPES[action]),
+            UsageRecord.created_at >= start,
+            UsageRecord.created_at < end
+        ).scalar() or 0
+        
+        _usage_counter.set(user_id, action, period, count)
+        return count
+    
     def check_limit(
         self,
         user_id: str,
-        usage_type: str
+        usage_type: str,
+        tier: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Check if user is within tier limits."""
+        """
+        Check if user is within tier limits.
         
-        # Get user and tier
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return {"allowed": False, "reason": "User not found"}
+        Counts come from a per-worker cache while the user is well under the
+        limit; within LIMIT_RECOUNT_MARGIN (or LIMIT_RECOUNT_FRACTION of the
+        limit) they are recounted from the database, so usage recorded by
+        other workers is seen before the limit is enforced. The limit can
+        only be overshot if other workers record more than that margin for
+        the same user within the counter TTL.
+        """
         
-        tier_limits = get_tier_limits(user.tier)
+        # Get tier, unless the caller already has the user loaded
+        if tier is None:
+            user = self.db.query(User).filter(User.id == user_id).first()
+            if not user:
+                return {"allowed": False, "reason": "User not found"}
+            tier = user.tier
         
-        # Get current month usage
-        now = datetime.utcnow()
-        summary = self.get_user_usage_summary(user_id, now.month, now.year)
+        tier_limits = get_tier_limits(tier)
         
-        if usage_type == "UPLOAD":
+        action = "UPLOAD" if usage_type == "UPLOAD" else "QUERY"
+        current = self.count_usage(user_id, action)
+        
+        if action == "UPLOAD":
             max_allowed = tier_limits.max_uploads
-            current = summary["uploads"]["count"]
         else:  # QUERY
             max_allowed = tier_limits.max_queries
-            current = summary["queries"]["total_count"]
         
         # -1 means unlimited
         if max_allowed == -1:
@@ -191,6 +327,10 @@ class UsageService(IUsageService):
                 "remaining": "unlimited"
             }
         
+        margin = max(LIMIT_RECOUNT_MARGIN, int(max_allowed * LIMIT_RECOUNT_FRACTION))
+        if max_allowed - current <= margin:
+            current = self.count_usage(user_id, action, fresh=True)
+        
         allowed = current < max_allowed
         
         return {
@@ -199,4 +339,4 @@ class UsageService(IUsageService):
             "limit": max_allowed,
             "remaining": max(0, max_allowed - current),
             "reason": None if allowed else f"Monthly {usage_type.lower()} limit reached"
-        }
\ No newline at end of file
+        }
@@ -2,8 +2,12 @@
 Auth Utilities - Password hashing and JWT token management.
 """
 
+import hashlib
+import hmac
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, Optional, Set, Tuple
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 
@@ -14,6 +18,7 @@ from config.settings import settings
 pwd_context = CryptContext(
     schemes=["bcrypt"], 
     deprecated="auto",
+    bcrypt__rounds=settings.PASSWORD_HASH_ROUNDS,
     bcrypt__truncate_error=False
 )
 
@@ -38,12 +43,79 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(password_truncated, hashed_password)
 
 
-def create_access_token(user_id: str, expires_delta: Optional[timedelta] = None) -> str:
-    """Create JWT access token."""
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
+class PasswordVerifyCache:
+    """
+    Short-lived memory of successful password checks.
+    
+    Keys are HMACs (with the app secret) of the stored hash plus the
+    submitted password, so neither is kept in memory and changing the
+    password changes the key. Only successes are cached.
+    """
+    
+    def __init__(self, ttl_seconds: int = 60, max_entries: int = 10000):
+        self._cache: Dict[str, float] = {}  # key -> expires_at
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(plain_password: str, hashed_password: str) -> str:
+        message = f"{hashed_password}\0{plain_password}".encode('utf-8')
+        return hmac.new(settings.SECRET_KEY.encode('utf-8'), message, hashlib.sha256).hexdigest()
+    
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password, skipping bcrypt if the same pair verified recently."""
+        if self._ttl_seconds <= 0:
+            return verify_password(plain_password, hashed_password)
+        
+        key = self._key(plain_password, hashed_password)
+        now = time.time()
+        with self._lock:
+            expires_at = self._cache.get(key)
+            if expires_at is not None and now < expires_at:
+                return True
+        
+        if not verify_password(plain_password, hashed_password):
+            return False
+        
+        with self._lock:
+            if len(self._cache) >= self._max_entries and key not in self._cache:
+                expired = [k for k, t in self._cache.items() if t <= now]
+                for k in expired or [next(iter(self._cache))]:
+                    del self._cache[k]
+            self._cache[key] = now + self._ttl_seconds
+        return True
+    
+    def clear(self) -> None:
+        """Forget all cached checks."""
+        with self._lock:
+            self._cache.clear()
+
+
+_password_cache = PasswordVerifyCache(ttl_seconds=settings.AUTH_PASSWORD_CACHE_TTL_SECONDS)
+
+
+def create_access_token(
+    user_id: str,
+    expires_delta: Optional[timedelta] = None,
+    claims: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Create JWT access token.
+    
+    Args:
+        user_id: User ID (sub claim)
+        expires_delta: Token lifetime (defaults to ACCESS_TOKEN_EXPIRE_MINUTES)
+        claims: Extra claims such as email and tier, trusted by
+            get_current_user in place of a DB lookup
+    """
+    now = datetime.utcnow()
+    expire = now + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
     payload = {
+        **(claims or {}),
         "sub": user_id,
         "type": "access",
+        "iat": now,
         "exp": expire
     }
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
@@ -66,4 +138,84 @@ def decode_token(token: str) -> Optional[dict]:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
         return payload
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+
+
+class TokenUserCache:
+    """
+    In-memory cache of access token -> user snapshot with TTL.
+    
+    Keys are SHA-256 hashes of the token (raw tokens are never stored).
+    An entry never outlives the token's own expiry.
+    """
+    
+    def __init__(self, ttl_seconds: int = 60, max_entries: int = 10000):
+        self._cache: Dict[str, Tuple[Dict[str, Any], float]] = {}  # token hash -> (snapshot, expires_at)
+        self._user_keys: Dict[str, Set[str]] = {}  # user_id -> token hashes
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _hash(token: str) -> str:
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+    
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Get the cached user snapshot for a token."""
+        key = self._hash(token)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            snapshot, expires_at = entry
+            if time.time() < expires_at:
+                return snapshot
+            self._remove(key)
+        return None
+    
+    def set(self, token: str, snapshot: Dict[str, Any], token_exp: Optional[float] = None) -> None:
+        """Cache a user snapshot (must contain "id") for a token."""
+        if self._ttl_seconds <= 0:
+            return
+        expires_at = time.time() + self._ttl_seconds
+        if token_exp is not None:
+            expires_at = min(expires_at, token_exp)
+        key = self._hash(token)
+        with self._lock:
+            if len(self._cache) >= self._max_entries and key not in self._cache:
+                self._evict()
+            self._cache[key] = (snapshot, expires_at)
+            self._user_keys.setdefault(snapshot["id"], set()).add(key)
+    
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop every cached token for a user."""
+        with self._lock:
+            for key in self._user_keys.pop(user_id, set()):
+                self._cache.pop(key, None)
+    
+    def clear(self) -> None:
+        """Clear all cached tokens."""
+        with self._lock:
+            self._cache.clear()
+            self._user_keys.clear()
+    
+    def _remove(self, key: str) -> None:
+        """Remove one entry (lock must be held)."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            keys = self._user_keys.get(entry[0]["id"])
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._user_keys[entry[0]["id"]]
+    
+    def _evict(self) -> None:
+        """Drop expired entries, or the oldest one if none expired (lock must be held)."""
+        now = time.time()
+        expired = [k for k, (_, expires_at) in self._cache.items() if expires_at <= now]
+        for key in expired or [next(iter(self._cache))]:
+            self._remove(key)
+
+
+# Global cache instance
+_token_cache = TokenUserCache(ttl_seconds=settings.AUTH_CACHE_TTL_SECONDS)
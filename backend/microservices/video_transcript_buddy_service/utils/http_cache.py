@@ -0,0 +1,43 @@
+"""
+HTTP Cache Helpers - ETag building and If-None-Match matching.
+
+Lets GET endpoints answer 304 Not Modified when a client already holds
+the current representation, skipping the work of rebuilding the body.
+"""
+
+import hashlib
+from typing import Any, Optional
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong, quoted ETag from the values that determine a response.
+    
+    Args:
+        parts: Values whose change should change the ETag (ids, timestamps, counts)
+    
+    Returns:
+        ETag header value, e.g. '"3f2a..."'
+    """
+    digest = hashlib.sha256(":".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison, per RFC 9110).
+    
+    Args:
+        if_none_match: Raw If-None-Match header value, if any
+        etag: Current ETag of the resource
+    
+    Returns:
+        True if the client's cached copy is current
+    """
+    if not if_none_match:
+        return False
+    
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
@@ -8,9 +8,11 @@ Prevents users from guessing or manipulating resource IDs in API requests.
 import base64
 import hashlib
 import secrets
+import threading
 import time
 import logging
-from typing import Optional, Dict, Tuple, Union
+from collections import OrderedDict
+from typing import Callable, Optional, Dict, List, Tuple, Union
 from cryptography.fernet import Fernet
 from functools import lru_cache
 from datetime import datetime, timedelta
@@ -19,40 +21,119 @@ logger = logging.getLogger(__name__)
 
 
 class IDEncryptionCache:
-    """In-memory cache for user encryption keys with TTL."""
+    """In-memory LRU cache for user encryption keys with TTL."""
     
-    def __init__(self, ttl_hours: int = 24):
-        self._cache: Dict[str, Tuple[str, float]] = {}  # user_id -> (key, timestamp)
+    def __init__(self, ttl_hours: int = 24, max_entries: int = 10000):
+        self._cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()  # user_id -> (key, timestamp)
         self._ttl_seconds = ttl_hours * 3600
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
     
     def get(self, user_id: str) -> Optional[str]:
         """Get cached encryption key for user."""
-        if user_id in self._cache:
-            key, timestamp = self._cache[user_id]
+        with self._lock:
+            entry = self._cache.get(user_id)
+            if entry is None:
+                return None
+            key, timestamp = entry
             if time.time() - timestamp < self._ttl_seconds:
+                self._cache.move_to_end(user_id)
                 return key
-            else:
-                # Expired, remove from cache
-                del self._cache[user_id]
+            # Expired, remove from cache
+            del self._cache[user_id]
         return None
     
     def set(self, user_id: str, key: str) -> None:
-        """Cache encryption key for user."""
-        self._cache[user_id] = (key, time.time())
+        """Cache encryption key for user, evicting the least recently used beyond max_entries."""
+        with self._lock:
+            self._cache[user_id] = (key, time.time())
+            self._cache.move_to_end(user_id)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
     
     def invalidate(self, user_id: str) -> None:
         """Remove user's key from cache (e.g., after key rotation)."""
-        if user_id in self._cache:
-            del self._cache[user_id]
+        with self._lock:
+            removed = self._cache.pop(user_id, None)
+        if removed is not None:
             logger.info(f"Invalidated encryption key cache for user {user_id}")
     
+    def invalidate_many(self, user_ids: List[str]) -> int:
+        """Remove several users' keys under one lock; returns how many were cached."""
+        with self._lock:
+            removed = sum(self._cache.pop(user_id, None) is not None for user_id in user_ids)
+        if removed:
+            logger.info(f"Invalidated encryption key cache for {removed} users")
+        return removed
+    
     def clear(self) -> None:
         """Clear all cached keys."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
 
 
-# Global cache instance
-_key_cache = IDEncryptionCache(ttl_hours=24)
+class DecryptedIDCache:
+    """
+    In-memory LRU cache of (user_id, encrypted ID) -> decrypted ID with TTL.
+    
+    Lets repeat requests for the same resource skip Fernet decryption.
+    The cache lives in this worker only; entries are dropped when the
+    user's key is rotated, so rotated tokens are decrypted (and rejected)
+    for real. A token past its max age can still resolve for up to
+    ttl_seconds after it was last decrypted.
+    """
+    
+    def __init__(self, ttl_seconds: int = 300, max_entries: int = 10000):
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[Union[int, str], float]]" = OrderedDict()
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+    
+    def get(self, user_id: str, encrypted_id: str) -> Optional[Union[int, str]]:
+        """Get the cached decrypted ID, or None on a miss."""
+        key = (user_id, encrypted_id)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            value, timestamp = entry
+            if time.monotonic() - timestamp < self._ttl_seconds:
+                self._cache.move_to_end(key)
+                return value
+            del self._cache[key]
+        return None
+    
+    def set(self, user_id: str, encrypted_id: str, value: Union[int, str]) -> None:
+        """Cache a decrypted ID, evicting the least recently used beyond max_entries."""
+        key = (user_id, encrypted_id)
+        with self._lock:
+            self._cache[key] = (value, time.monotonic())
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+    
+    def invalidate(self, user_id: str) -> None:
+        """Remove all of a user's entries (e.g., after key rotation)."""
+        with self._lock:
+            for key in [k for k in self._cache if k[0] == user_id]:
+                del self._cache[key]
+    
+    def invalidate_many(self, user_ids: List[str]) -> None:
+        """Remove all entries for several users in one pass."""
+        user_ids = set(user_ids)
+        with self._lock:
+            for key in [k for k in self._cache if k[0] in user_ids]:
+                del self._cache[key]
+    
+    def clear(self) -> None:
+        """Clear all cached IDs."""
+        with self._lock:
+            self._cache.clear()
+
+
+# Global cache instances
+_key_cache = IDEncryptionCache(ttl_hours=24, max_entries=10000)
+_decrypted_id_cache = DecryptedIDCache(ttl_seconds=300, max_entries=10000)
 
 
 def generate_user_encryption_key() -> str:
@@ -93,6 +174,34 @@ def encrypt_id(internal_id: Union[int, str], user_key: str) -> str:
         raise ValueError("Failed to encrypt ID")
 
 
+def encrypt_ids(internal_ids: List[Union[int, str]], user_key: str) -> List[str]:
+    """
+    Encrypt several IDs with one Fernet instance and one timestamp.
+    
+    Args:
+        internal_ids: The actual database IDs
+        user_key: User's encryption key
+        
+    Returns:
+        Encrypted IDs in input order
+    """
+    return _encrypt_with(_get_fernet(user_key), internal_ids)
+
+
+def _encrypt_with(fernet: Fernet, internal_ids: List[Union[int, str]]) -> List[str]:
+    """Encrypt IDs with an existing Fernet instance."""
+    try:
+        timestamp_ms = int(time.time() * 1000)
+        return [
+            fernet.encrypt(f"{timestamp_ms}:{internal_id}".encode('utf-8'))
+            .decode('utf-8').replace('/', '_').replace('+', '-')
+            for internal_id in internal_ids
+        ]
+    except Exception as e:
+        logger.error(f"ID encryption failed: {e}")
+        raise ValueError("Failed to encrypt ID")
+
+
 def decrypt_id(encrypted_id: str, user_key: str, max_age_hours: int = 72) -> Union[int, str]:
     """
     Decrypt an encrypted ID using user's encryption key.
@@ -108,8 +217,38 @@ def decrypt_id(encrypted_id: str, user_key: str, max_age_hours: int = 72) -> Uni
     Raises:
         ValueError: If decryption fails or token is too old
     """
+    return _decrypt_with(_get_fernet(user_key), encrypted_id, max_age_hours)
+
+
+def decrypt_ids(
+    encrypted_ids: List[str],
+    user_key: str,
+    max_age_hours: int = 72
+) -> List[Optional[Union[int, str]]]:
+    """
+    Decrypt several encrypted IDs with one Fernet instance.
+    
+    Args:
+        encrypted_ids: Encrypted IDs from client
+        user_key: User's encryption key
+        max_age_hours: Maximum age of encrypted ID
+        
+    Returns:
+        Original IDs in input order, with None for any that fail to decrypt
+    """
+    fernet = _get_fernet(user_key)
+    results: List[Optional[Union[int, str]]] = []
+    for encrypted_id in encrypted_ids:
+        try:
+            results.append(_decrypt_with(fernet, encrypted_id, max_age_hours))
+        except ValueError:
+            results.append(None)
+    return results
+
+
+def _decrypt_with(fernet: Fernet, encrypted_id: str, max_age_hours: int) -> Union[int, str]:
+    """Decrypt one ID with an existing Fernet instance."""
     try:
-        fernet = _get_fernet(user_key)
         # Restore original base64 characters
         encrypted_bytes = encrypted_id.replace('_', '/').replace('-', '+').encode('utf-8')
         decrypted = fernet.decrypt(encrypted_bytes).decode('utf-8')
@@ -147,6 +286,9 @@ class UserIDEncryptor:
         self.db = db_session
         self.user_id = user_id
         self._key: Optional[str] = None
+        self._fernet: Optional[Fernet] = None
+        # raw id -> token; Fernet tokens use a random IV, so reuse them within this encryptor
+        self._encrypted: Dict[Union[int, str], str] = {}
     
     def _get_key(self) -> str:
         """Get user's encryption key from cache or database."""
@@ -175,13 +317,40 @@ class UserIDEncryptor:
         _key_cache.set(self.user_id, self._key)
         return self._key
     
+    def _get_fernet(self) -> Fernet:
+        """Get the Fernet instance for the user's key, built once per encryptor."""
+        if self._fernet is None:
+            self._fernet = _get_fernet(self._get_key())
+        return self._fernet
+    
     def encrypt(self, internal_id: Union[int, str]) -> str:
         """Encrypt an ID for sending to client."""
-        return encrypt_id(internal_id, self._get_key())
+        return self.encrypt_many([internal_id])[0]
+    
+    def encrypt_many(self, internal_ids: List[Union[int, str]]) -> List[str]:
+        """Encrypt a list of IDs for sending to client, reusing tokens already issued."""
+        pending = list(dict.fromkeys(i for i in internal_ids if i not in self._encrypted))
+        if pending:
+            self._encrypted.update(zip(pending, _encrypt_with(self._get_fernet(), pending)))
+        return [self._encrypted[internal_id] for internal_id in internal_ids]
     
     def decrypt(self, encrypted_id: str) -> Union[int, str]:
         """Decrypt an ID received from client."""
-        return decrypt_id(encrypted_id, self._get_key())
+        decrypted = _decrypted_id_cache.get(self.user_id, encrypted_id)
+        if decrypted is None:
+            decrypted = _decrypt_with(self._get_fernet(), encrypted_id, max_age_hours=72)
+            _decrypted_id_cache.set(self.user_id, encrypted_id, decrypted)
+        return decrypted
+    
+    def decrypt_batch(self, encrypted_ids: List[str]) -> List[Optional[Union[int, str]]]:
+        """Decrypt a list of IDs from client; invalid ones come back as None."""
+        results: List[Optional[Union[int, str]]] = []
+        for encrypted_id in encrypted_ids:
+            try:
+                results.append(self.decrypt(encrypted_id))
+            except ValueError:
+                results.append(None)
+        return results
     
     def encrypt_dict(self, data: dict, id_fields: list) -> dict:
         """
@@ -191,11 +360,29 @@ class UserIDEncryptor:
             data: Dictionary containing response data
             id_fields: List of field names to encrypt (e.g., ['id', 'conversation_id'])
         """
-        result = data.copy()
-        for field in id_fields:
-            if field in result and result[field] is not None:
-                result[field] = self.encrypt(result[field])
-        return result
+        return self.encrypt_dicts([data], id_fields)[0]
+    
+    def encrypt_dicts(self, data_list: List[dict], id_fields: list) -> List[dict]:
+        """
+        Encrypt specified ID fields across a list of dictionaries.
+        
+        All IDs are collected first and encrypted in one encrypt_many call.
+        
+        Args:
+            data_list: Dictionaries containing response data
+            id_fields: List of field names to encrypt
+        """
+        results = [data.copy() for data in data_list]
+        targets = [
+            (result, field)
+            for result in results
+            for field in id_fields
+            if result.get(field) is not None
+        ]
+        encrypted = self.encrypt_many([result[field] for result, field in targets])
+        for (result, field), token in zip(targets, encrypted):
+            result[field] = token
+        return results
     
     def decrypt_dict(self, data: dict, id_fields: list) -> dict:
         """
@@ -213,8 +400,15 @@ class UserIDEncryptor:
 
 
 def invalidate_user_key_cache(user_id: str) -> None:
-    """Invalidate cached key for a user (call after key rotation)."""
+    """Invalidate cached key and decrypted IDs for a user (call after key rotation)."""
     _key_cache.invalidate(user_id)
+    _decrypted_id_cache.invalidate(user_id)
+
+
+def invalidate_user_key_cache_many(user_ids: List[str]) -> None:
+    """Invalidate cached keys and decrypted IDs for several users at once."""
+    _key_cache.invalidate_many(user_ids)
+    _decrypted_id_cache.invalidate_many(user_ids)
 
 
 def rotate_user_key(db_session, user_id: str) -> str:
@@ -222,26 +416,96 @@ def rotate_user_key(db_session, user_id: str) -> str:
     Rotate (regenerate) a user's encryption key.
     User will need to re-login to get new encrypted IDs.
     
+    Done as a single UPDATE ... RETURNING, so there is no separate
+    existence check that could race with a delete.
+    
     Args:
         db_session: Database session
         user_id: User ID to rotate key for
         
     Returns:
-        The new encryption key
+        The user's email
+        
+    Raises:
+        ValueError: If the user does not exist
     """
+    from sqlalchemy import update
     from models.user import User
     
-    user = db_session.query(User).filter(User.id == user_id).first()
-    if not user:
+    row = db_session.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(
+            encryption_key=generate_user_encryption_key(),
+            encryption_key_rotated_at=datetime.utcnow()
+        )
+        .returning(User.email)
+    ).first()
+    if row is None:
+        db_session.rollback()
         raise ValueError(f"User {user_id} not found")
-    
-    new_key = generate_user_encryption_key()
-    user.encryption_key = new_key
-    user.encryption_key_rotated_at = datetime.utcnow()
     db_session.commit()
     
     # Invalidate cache
     invalidate_user_key_cache(user_id)
     
     logger.info(f"Rotated encryption key for user {user_id}")
-    return new_key
+    return row.email
+
+
+def rotate_all_user_keys(
+    db_session,
+    batch_size: int = 1000,
+    on_batch: Optional[Callable[[int], None]] = None
+) -> int:
+    """
+    Rotate every user's encryption key in one transaction.
+    
+    User IDs are streamed batch_size at a time (yield_per) and each batch
+    is written with one bulk UPDATE, so memory stays bounded by the batch
+    rather than the user count.
+    
+    Args:
+        db_session: Database session
+        batch_size: Rows fetched and updated per batch
+        on_batch: Optional callback given the running count after each batch
+        
+    Returns:
+        Number of users rotated
+    """
+    from sqlalchemy import select, update
+    from models.user import User
+    
+    rotated_at = datetime.utcnow()
+    rotated_count = 0
+    
+    try:
+        user_ids = db_session.execute(
+            select(User.id).execution_options(yield_per=batch_size)
+        ).scalars()
+        for batch in user_ids.partitions():
+            db_session.execute(
+                update(User),
+                [
+                    {
+                        "id": user_id,
+                        "encryption_key": generate_user_encryption_key(),
+                        "encryption_key_rotated_at": rotated_at
+                    }
+                    for user_id in batch
+                ]
+            )
+            rotated_count += len(batch)
+            if on_batch:
+                on_batch(rotated_count)
+        db_session.commit()
+    except Exception:
+        db_session.rollback()
+        raise
+    
+    # Every cached key and decrypted ID is now stale
+    _key_cache.clear()
+    _decrypted_id_cache.clear()
+    
+    logger.info(f"Rotated encryption keys for {rotated_count} users")
+    return rotated_count
@@ -0,0 +1,115 @@
+"""
+LLM Batcher - Coalesces concurrent chat completion requests.
+
+Requests are dispatched as soon as they arrive; there is no batching
+window, since the Chat Completions API takes one conversation per request
+and waiting only adds latency. Identical non-streaming requests that are
+in flight at the same time share a single API call.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _PermitStream:
+    """
+    Wraps a streaming response and holds a concurrency permit until it ends.
+
+    The permit is released when iteration finishes or fails, or on close(),
+    whichever comes first.
+    """
+
+    def __init__(self, stream: Any, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[Any]:
+        try:
+            async for event in self._stream:
+                yield event
+        finally:
+            self._release_permit()
+
+    async def close(self) -> None:
+        """Release the permit and close the underlying stream."""
+        self._release_permit()
+        close = getattr(self._stream, "close", None)
+        if close is not None:
+            await close()
+
+    def _release_permit(self) -> None:
+        if not self._released:
+            self._released = True
+            self._release()
+
+
+class LLMBatcher:
+    """
+    Request coalescer for chat completion calls.
+
+    Usage:
+        response = await llm_batcher.call(
+            client, model="gpt-4", messages=[...], max_tokens=500, temperature=0.3
+        )
+    """
+
+    def __init__(self, max_concurrency: int = 32):
+        """
+        Initialize the batcher.
+
+        Args:
+            max_concurrency: Maximum API calls in flight at once
+        """
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._in_flight: Dict[Tuple[int, str], asyncio.Future] = {}
+
+    async def call(self, client: Any, **request: Any) -> Any:
+        """
+        Send a chat completion request, joining an identical one already in flight.
+
+        Args:
+            client: AsyncOpenAI client used to dispatch the request
+            **request: Keyword arguments for chat.completions.create
+
+        Returns:
+            The ChatCompletion response, or for stream=True a stream that
+            holds its concurrency permit until consumed or closed
+        """
+        if request.get("stream"):
+            # A stream can only be consumed once, so never share it
+            return await self._dispatch_stream(client, request)
+
+        key = (id(client), json.dumps(request, sort_keys=True, default=str))
+        shared = self._in_flight.get(key)
+        if shared is None:
+            shared = asyncio.ensure_future(self._dispatch(client, request))
+            self._in_flight[key] = shared
+            shared.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            logger.debug("LLM request joined an identical in-flight call")
+
+        # Shielded so one caller cancelling doesn't cancel the call for the others
+        return await asyncio.shield(shared)
+
+    async def _dispatch(self, client: Any, request: Dict[str, Any]) -> Any:
+        """Send one request, bounded by the concurrency limit."""
+        async with self._semaphore:
+            return await client.chat.completions.create(**request)
+
+    async def _dispatch_stream(self, client: Any, request: Dict[str, Any]) -> _PermitStream:
+        """Open a stream; the permit stays held while tokens are still being generated."""
+        await self._semaphore.acquire()
+        try:
+            stream = await client.chat.completions.create(**request)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return _PermitStream(stream, self._semaphore.release)
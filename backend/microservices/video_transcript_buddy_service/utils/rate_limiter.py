@@ -0,0 +1,92 @@
+"""
+Rate Limiter - In-process fixed-window request counters.
+
+Used to throttle expensive endpoints (e.g. login, where every attempt
+runs a bcrypt verify) before the costly work starts.
+"""
+
+import threading
+import time
+from typing import Dict, List, Tuple
+
+
+class FixedWindowRateLimiter:
+    """
+    Count hits per key in fixed time windows.
+    
+    Counters live in this process only, so with several workers the
+    effective limit is per worker.
+    """
+    
+    def __init__(self, limit: int, window_seconds: int = 60, max_keys: int = 100000):
+        """
+        Initialize the limiter.
+        
+        Args:
+            limit: Hits allowed per key per window (0 disables limiting)
+            window_seconds: Window length
+            max_keys: Keys tracked before stale windows are swept
+        """
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._windows: Dict[str, List] = {}  # key -> [window_start, count]
+        self._lock = threading.Lock()
+    
+    def _window(self) -> Tuple[float, int]:
+        """Return the current window start and seconds until it resets."""
+        now = time.monotonic()
+        window_start = now - now % self.window_seconds
+        return window_start, max(1, int(window_start + self.window_seconds - now))
+    
+    def check(self, key: str) -> Tuple[bool, int]:
+        """
+        Check whether key is under its limit, without recording a hit.
+        
+        Returns:
+            Tuple of (allowed, seconds until the window resets)
+        """
+        if self.limit <= 0:
+            return True, 0
+        
+        window_start, retry_after = self._window()
+        with self._lock:
+            entry = self._windows.get(key)
+            count = entry[1] if entry is not None and entry[0] == window_start else 0
+            return count < self.limit, retry_after
+    
+    def hit(self, key: str) -> Tuple[bool, int]:
+        """
+        Record a hit for key.
+        
+        Returns:
+            Tuple of (allowed, seconds until the window resets)
+        """
+        if self.limit <= 0:
+            return True, 0
+        
+        window_start, retry_after = self._window()
+        with self._lock:
+            entry = self._windows.get(key)
+            if entry is None or entry[0] != window_start:
+                if entry is None and len(self._windows) >= self.max_keys:
+                    self._sweep(window_start)
+                entry = [window_start, 0]
+                self._windows[key] = entry
+            entry[1] += 1
+            return entry[1] <= self.limit, retry_after
+    
+    def reset(self, key: str) -> None:
+        """Forget a key's counter."""
+        with self._lock:
+            self._windows.pop(key, None)
+    
+    def clear(self) -> None:
+        """Forget all counters."""
+        with self._lock:
+            self._windows.clear()
+    
+    def _sweep(self, window_start: float) -> None:
+        """Drop counters from past windows (lock must be held)."""
+        for key in [k for k, v in self._windows.items() if v[0] != window_start]:
+            del self._windows[key]
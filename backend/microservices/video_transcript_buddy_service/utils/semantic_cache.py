@@ -0,0 +1,221 @@
+"""
+Semantic Cache - In-memory cache for LLM results with embedding lookup.
+
+Entries are stored under an exact SHA-256 key (scope + normalized query).
+When an embedding function is configured, query embeddings are kept in a
+small numpy matrix per scope so near-identical queries can reuse a previous
+result without another LLM round-trip.
+"""
+
+import asyncio
+import copy
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """
+    TTL cache with exact and cosine-similarity lookup.
+
+    A "scope" groups entries that are interchangeable for fuzzy matching
+    (e.g. same analysis type over the same chunks). Fuzzy matches are only
+    considered within the same scope.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Optional[Callable[[str], List[float]]] = None,
+        threshold: float = 0.95,
+        ttl_seconds: int = 3600,
+        max_entries: int = 1024
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            embed_fn: Function returning a unit-length embedding for a query
+            threshold: Minimum cosine similarity for a fuzzy hit
+            ttl_seconds: Time-to-live for entries
+            max_entries: Maximum number of entries kept in memory
+        """
+        self._embed_fn = embed_fn
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[float, str, Any]] = {}
+        self._scopes: Dict[str, Tuple[List[str], np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Normalize a query for exact-key matching."""
+        return " ".join(query.lower().split())
+
+    @staticmethod
+    def make_scope(*parts: Any) -> str:
+        """Build a scope hash from its parts (order-sensitive)."""
+        raw = "\x1f".join(str(p) for p in parts)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def make_key(self, scope: str, query: str) -> str:
+        """Build the exact cache key for a query within a scope."""
+        raw = f"{scope}\x1f{self.normalize(query)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def embed(self, query: str) -> Optional[np.ndarray]:
+        """Embed a query; returns None if embeddings are unavailable."""
+        if self._embed_fn is None:
+            return None
+        try:
+            return np.asarray(self._embed_fn(query), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Semantic cache embedding failed: {e}")
+            return None
+
+    def get(
+        self,
+        scope: str,
+        query: str,
+        embedding: Optional[np.ndarray] = None
+    ) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            scope: Scope hash from make_scope
+            query: Raw query text
+            embedding: Optional query embedding for fuzzy lookup
+
+        Returns:
+            Cached value or None
+        """
+        now = time.monotonic()
+        with self._lock:
+            value = self._get_live(self.make_key(scope, query), now)
+            if value is not None or embedding is None:
+                return value
+
+            keys, matrix = self._scopes.get(scope, ([], None))
+            if not keys:
+                return None
+
+            # Embeddings are unit vectors, so the dot product is the cosine
+            scores = matrix @ embedding
+            best = int(np.argmax(scores))
+            if scores[best] >= self.threshold:
+                return self._get_live(keys[best], now)
+        return None
+
+    def set(
+        self,
+        scope: str,
+        query: str,
+        value: Any,
+        embedding: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Store a value.
+
+        Args:
+            scope: Scope hash from make_scope
+            query: Raw query text
+            value: Value to cache
+            embedding: Optional query embedding for fuzzy lookup
+        """
+        key = self.make_key(scope, query)
+        now = time.monotonic()
+        with self._lock:
+            self._remove(key)
+            if len(self._entries) >= self.max_entries:
+                self._evict(now)
+
+            self._entries[key] = (now + self.ttl_seconds, scope, value)
+
+            if embedding is not None:
+                keys, matrix = self._scopes.get(scope, ([], None))
+                row = embedding.reshape(1, -1)
+                matrix = row if matrix is None else np.vstack([matrix, row])
+                self._scopes[scope] = (keys + [key], matrix)
+
+    async def get_or_compute(
+        self,
+        scope: str,
+        query: str,
+        compute: Callable[[], Awaitable[Any]],
+        should_cache: Optional[Callable[[Any], bool]] = None
+    ) -> Tuple[Any, bool]:
+        """
+        Return a cached value or compute and store a new one.
+
+        Args:
+            scope: Scope hash from make_scope
+            query: Raw query text
+            compute: Coroutine factory producing the value on a miss
+            should_cache: Optional predicate deciding whether to store the value
+
+        Returns:
+            Tuple of (value, cache_hit); values are copies, so callers may
+            mutate them without affecting the cache
+        """
+        cached = self.get(scope, query)
+        if cached is not None:
+            return copy.deepcopy(cached), True
+
+        embedding = None
+        if self._embed_fn is not None:
+            embedding = await asyncio.to_thread(self.embed, query)
+            cached = self.get(scope, query, embedding)
+            if cached is not None:
+                return copy.deepcopy(cached), True
+
+        value = await compute()
+        if should_cache is None or should_cache(value):
+            self.set(scope, query, copy.deepcopy(value), embedding)
+        return value, False
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._scopes.clear()
+
+    def _get_live(self, key: str, now: float) -> Optional[Any]:
+        """Return an unexpired value, dropping it if stale. Caller holds the lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] < now:
+            self._remove(key)
+            return None
+        return entry[2]
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and its embedding row. Caller holds the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        scope = entry[1]
+        keys, matrix = self._scopes.get(scope, ([], None))
+        if key in keys:
+            idx = keys.index(key)
+            keys = keys[:idx] + keys[idx + 1:]
+            if keys:
+                self._scopes[scope] = (keys, np.delete(matrix, idx, axis=0))
+            else:
+                del self._scopes[scope]
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then the oldest ones if still full. Caller holds the lock."""
+        for key in [k for k, e in self._entries.items() if e[0] < now]:
+            self._remove(key)
+
+        while len(self._entries) >= self.max_entries:
+            self._remove(next(iter(self._entries)))
@@ -0,0 +1,99 @@
+"""
+Session Chunk Cache - Per-session candidate chunks for follow-up queries.
+
+When a user keeps asking about the same transcripts, the top-K chunks of
+the previous search are a good candidate set for the next question. They
+can be re-ranked locally instead of running another full index search.
+
+QueryResolverAgent consults it only when a caller passes session_id; no
+API route calls the resolver yet, so the path is currently unused.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass(slots=True)
+class PrefetchHint:
+    """Candidate chunks prefetched for one session and transcript set."""
+    transcript_key: Tuple[str, ...]
+    chunks: List[Dict[str, Any]]
+    score_floor: float  # Lowest candidate score for the query that prefetched them
+    expires_at: float
+
+
+class SessionChunkCache:
+    """
+    LRU of prefetched chunks keyed by session.
+
+    Only the most recent transcript set is kept per session; asking about
+    different transcripts replaces the hint.
+    """
+
+    def __init__(self, max_sessions: int = 1024, ttl_seconds: int = 900):
+        """
+        Initialize the cache.
+
+        Args:
+            max_sessions: Maximum number of sessions kept in memory
+            ttl_seconds: Time-to-live for a session's hint
+        """
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._hints: "OrderedDict[str, PrefetchHint]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_transcript_key(transcript_ids: List[str]) -> Tuple[str, ...]:
+        """Build an order-insensitive key for a transcript set."""
+        return tuple(sorted(set(transcript_ids)))
+
+    def get(self, session_id: str, transcript_ids: List[str]) -> Optional[PrefetchHint]:
+        """Return the live hint for this session and transcript set, if any."""
+        key = self.make_transcript_key(transcript_ids)
+        with self._lock:
+            hint = self._hints.get(session_id)
+            if hint is None:
+                return None
+            if hint.expires_at < time.monotonic():
+                del self._hints[session_id]
+                return None
+            if hint.transcript_key != key:
+                return None
+            self._hints.move_to_end(session_id)
+            return hint
+
+    def set(
+        self,
+        session_id: str,
+        transcript_ids: List[str],
+        chunks: List[Dict[str, Any]]
+    ) -> None:
+        """Store the candidate chunks from a session's latest full search."""
+        if not chunks:
+            return
+        hint = PrefetchHint(
+            transcript_key=self.make_transcript_key(transcript_ids),
+            # Only IDs and scores are needed to re-rank; content stays in the store
+            chunks=[{"id": c["id"], "score": c.get("score", 0.0)} for c in chunks],
+            score_floor=min(c.get("score", 0.0) for c in chunks),
+            expires_at=time.monotonic() + self.ttl_seconds
+        )
+        with self._lock:
+            self._hints[session_id] = hint
+            self._hints.move_to_end(session_id)
+            while len(self._hints) > self.max_sessions:
+                self._hints.popitem(last=False)
+
+    def invalidate(self, session_id: str) -> None:
+        """Drop a session's hint."""
+        with self._lock:
+            self._hints.pop(session_id, None)
+
+    def clear(self) -> None:
+        """Drop all hints."""
+        with self._lock:
+            self._hints.clear()
@@ -0,0 +1,84 @@
+"""
+TTL Cache - Time-bounded memoization for async functions.
+
+Used for slow lookups (e.g. probing local LLM servers) that many requests
+ask for at once but whose answer only needs to be a few seconds fresh.
+"""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+_MISSING = object()
+
+
+def async_ttl_cache(seconds: float, max_entries: int = 256) -> Callable:
+    """
+    Cache an async function's result per argument set for `seconds`.
+    
+    One caller refreshes an expired entry while concurrent callers get the
+    previous (stale) value instead of waiting; callers only wait when
+    nothing has been cached yet. Exceptions are not cached. The cache is
+    process-local and holds at most `max_entries` argument sets, evicting
+    the least recently used (arguments may come from user input).
+    
+    Args:
+        seconds: How long a result stays fresh
+        max_entries: Maximum number of cached argument sets
+    
+    Returns:
+        Decorator; the wrapped function gains a cache_clear() method
+    """
+    def decorator(func: Callable) -> Callable:
+        entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()  # key -> (value, expires_at)
+        locks: Dict[Hashable, asyncio.Lock] = {}
+        
+        def _evict() -> None:
+            while len(entries) > max_entries:
+                old_key, _ = entries.popitem(last=False)
+                lock = locks.get(old_key)
+                if lock is not None and not lock.locked():
+                    del locks[old_key]
+            if len(locks) > max_entries:
+                # Locks left behind by calls that raised (nothing was cached)
+                for stale_key in [k for k, l in locks.items() if k not in entries and not l.locked()]:
+                    del locks[stale_key]
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            value, expires_at = entries.get(key, (_MISSING, 0.0))
+            if value is not _MISSING:
+                entries.move_to_end(key)
+                if time.monotonic() < expires_at:
+                    return value
+            
+            lock = locks.setdefault(key, asyncio.Lock())
+            if value is not _MISSING and lock.locked():
+                # Someone is already refreshing; serve the stale value
+                return value
+            
+            async with lock:
+                value, expires_at = entries.get(key, (_MISSING, 0.0))
+                if value is not _MISSING and time.monotonic() < expires_at:
+                    return value
+                try:
+                    value = await func(*args, **kwargs)
+                finally:
+                    _evict()
+                entries[key] = (value, time.monotonic() + seconds)
+                entries.move_to_end(key)
+                _evict()
+                return value
+        
+        def cache_clear() -> None:
+            entries.clear()
+            for key in [k for k, l in locks.items() if not l.locked()]:
+                del locks[key]
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    
+    return decorator
@@ -195,7 +195,7 @@ cmd_setup() {
     # Check Python version
     print_info "Checking Python version..."
     if ! command -v $python_cmd &> /dev/null; then
-        print_error "Python not found! Please install Python 3.9+ first."
+        print_error "Python not found! Please install Python 3.10+ first."
         case "$OS_TYPE" in
             ubuntu|linux|wsl)
                 echo -e "\n  Run: ${CYAN}sudo apt update && sudo apt install python3 python3-venv python3-pip${NC}"
@@ -211,6 +211,10 @@ cmd_setup() {
     fi
     
     $python_cmd --version
+    if ! $python_cmd -c 'import sys; sys.exit(sys.version_info < (3, 10))'; then
+        print_error "Python 3.10+ is required."
+        exit 1
+    fi
     
     # Create venv directory
     print_info "Creating virtual environment directory..."
@@ -267,7 +271,10 @@ cmd_start() {
     print_info "Starting backend server at http://localhost:8000"
     
     cd "$BACKEND_PATH"
-    "$uvicorn_cmd" main:app --host 0.0.0.0 --port 8000
+    # Behind a reverse proxy, set FORWARDED_ALLOW_IPS to its address so client
+    # IPs (used by auth rate limiting) come from X-Forwarded-For
+    "$uvicorn_cmd" main:app --host 0.0.0.0 --port 8000 \
+        --proxy-headers --forwarded-allow-ips "${FORWARDED_ALLOW_IPS:-127.0.0.1}"
 }
 
 cmd_verify() {